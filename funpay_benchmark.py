@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FunPay Auto Boost - Benchmarks
+Offline microbenchmarks of the hot paths with baselines and a regression gate
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import logging
+import platform
+import tempfile
+import argparse
+import statistics
+from datetime import datetime, timedelta
+from selenium.common.exceptions import WebDriverException
+
+from funpay_boost_ultimate import FunPayBooster, RateLimiter, CircuitBreaker, ErrorRecovery
+from funpay_simulator import SimulatedClock, SimulatedFunPay, FakeDriver, TARGET_URL
+from telegram_notifier import TelegramNotifier
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baselines.json')
+DEFAULT_THRESHOLD = 0.3  # Allowed slowdown before a benchmark counts as a regression
+DEFAULT_REPEAT = 15
+NOISE_FLOOR = 1e-6       # Slowdowns smaller than this many seconds per call are timer and scheduler noise
+CONFIRM_RUNS = 2         # Re-runs of a regressed benchmark before the gate fails
+
+def calibrate(repeat=DEFAULT_REPEAT):
+    """Seconds for a fixed pure-Python workload - lets baselines travel between machines"""
+    def workload():
+        total = 0
+        items = {}
+        for i in range(20000):
+            items[i % 97] = items.get(i % 97, 0) + i
+            total += len(str(i))
+        return total
+    return measure(workload, number=10, repeat=repeat)
+
+def measure(func, number, repeat=DEFAULT_REPEAT):
+    """Median time per call over `repeat` runs of `number` calls"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+    return statistics.median(timings)
+
+def lot_page(rows=2000, wait_minutes=137):
+    """Large lot page in FunPay's markup with the raise message at the very end"""
+    parts = ["<html><head><title>Lots</title></head><body><div class='tc table-hover'>"]
+    for i in range(rows):
+        parts.append(
+            f"<a href='https://funpay.com/en/lots/offer?id={100000 + i}' class='tc-item'>"
+            f"<div class='tc-server hidden-xxs'>Server {i % 12}</div>"
+            f"<div class='tc-desc'><div class='tc-desc-text'>Offer {i}, instant delivery, 24/7 online</div></div>"
+            f"<div class='tc-user'><div class='media-user-name'>seller_{i % 350}</div>"
+            f"<div class='media-user-info'>on the site for {1 + i % 9} years</div></div>"
+            f"<div class='tc-amount'>{(i * 37) % 5000}</div>"
+            f"<div class='tc-price'><div>{(i * 13) % 900 + 0.5} <span class='unit'>₽</span></div></div></a>"
+        )
+    parts.append(f"</div><div class='ajax-alert ajax-alert-danger'>Please wait {wait_minutes} minutes.</div>")
+    parts.append("</body></html>")
+    return ''.join(parts)
+
+class PageDriver(FakeDriver):
+    """Fake driver that serves a fixed page source"""
+
+    def __init__(self, site, html):
+        super().__init__(site)
+        self.html = html
+
+    @property
+    def page_source(self):
+        return self.html
+
+def make_booster(work_dir, driver):
+    """Booster wired to a fake driver with disk writes stubbed out"""
+    config_file = os.path.join(work_dir, 'config.json')
+    with open(config_file, 'w') as f:
+        json.dump({
+            'username': 'bench_user',
+            'target_url': TARGET_URL,
+            'boost_interval': 3,
+            'cookies': [],
+            'server_clock_url': None
+        }, f)
+
+    booster = FunPayBooster(
+        config_file=config_file,
+        log_settings={'console': False, 'boost_log': {'path': os.path.join(work_dir, 'boost.log')}},
+        clock=SimulatedClock(),
+        rng=random.Random(1),
+        driver_factory=lambda: driver
+    )
+    booster.telegram = None
+    booster.driver = driver
+    booster.current_lot_url = TARGET_URL
+    # Measure the parsing and lookups, not the JSON files they persist to
+    booster.save_config = lambda: True
+    booster.selector_stats.save = lambda: True
+    return booster
+
+def bench_rate_limiter(context):
+    limiter = RateLimiter(clock=SimulatedClock(), rng=random.Random(1))
+    return lambda: limiter.wait_if_needed("navigation")
+
+def bench_circuit_breaker(context):
+    breaker = CircuitBreaker(clock=SimulatedClock(), name='bench')
+    return lambda: breaker.call(len, 'boost')
+
+def bench_error_recovery(context):
+    recovery = ErrorRecovery(clock=SimulatedClock(), rng=random.Random(1))
+    state = {'calls': 0}
+
+    def flaky():
+        # Every other run hits one transient failure before succeeding
+        state['calls'] += 1
+        if state['calls'] % 3 == 1:
+            raise WebDriverException("simulated timeout")
+        return True
+
+    def run():
+        recovery.reset_cycle_budget()
+        return recovery.execute_with_retry(flaky, "bench")
+    return run
+
+def bench_parse_wait_time(context):
+    site = SimulatedFunPay(SimulatedClock(), random.Random(1))
+    booster = make_booster(context['work_dir'], PageDriver(site, lot_page()))
+    context['boosters'].append(booster)
+
+    def run():
+        booster.page_snapshot.invalidate()
+        return booster.parse_wait_time_from_page()
+    return run
+
+def bench_find_boost_button(context):
+    clock = SimulatedClock()
+    site = SimulatedFunPay(clock, random.Random(1))
+    site.authenticated = True
+    driver = FakeDriver(site)
+    driver.get(TARGET_URL)
+    booster = make_booster(context['work_dir'], driver)
+    context['boosters'].append(booster)
+    return booster.find_boost_button
+
+def bench_telegram_messages(context):
+    notifier = TelegramNotifier(config_file=os.path.join(context['work_dir'], 'telegram_config.json'))
+    sent = []
+    notifier.send_message = lambda message: sent.append(message) or True
+    next_boost = datetime.utcnow() + timedelta(hours=3, minutes=17)
+
+    def run():
+        sent.clear()
+        notifier.notify_boost_success(next_boost)
+        notifier.notify_boost_failed(next_boost, exact_wait_minutes=197)
+        return sent
+    return run
+
+# name: (setup, calls per timing run, allowed slowdown or None for --threshold)
+BENCHMARKS = {
+    'rate_limiter.wait_if_needed': (bench_rate_limiter, 2000, None),
+    'circuit_breaker.call': (bench_circuit_breaker, 20000, None),
+    'error_recovery.execute_with_retry': (bench_error_recovery, 2000, None),
+    # Regexes over a 1 MB page swing with allocator and cache state
+    'booster.parse_wait_time_from_page': (bench_parse_wait_time, 50, 0.6),
+    'booster.find_boost_button': (bench_find_boost_button, 2000, None),
+    'telegram.message_building': (bench_telegram_messages, 500, None)
+}
+
+def run_benchmarks(names=None, repeat=DEFAULT_REPEAT):
+    """Run the benchmarks and return {'calibration': seconds, 'benchmarks': {name: seconds per call}}"""
+    context = {'work_dir': tempfile.mkdtemp(prefix='funpay_bench_'), 'boosters': []}
+    results = {}
+    previous_disable = logging.root.manager.disable
+    logging.disable(logging.CRITICAL)
+    try:
+        calibration = calibrate(repeat)
+        for name, (setup, number, _) in BENCHMARKS.items():
+            if names and name not in names:
+                continue
+            func = setup(context)
+            func()  # Warm up caches and lazy imports
+            results[name] = measure(func, number, repeat)
+    finally:
+        logging.disable(previous_disable)
+        for booster in context['boosters']:
+            booster.stop_logging()
+
+    return {'calibration': calibration, 'benchmarks': results}
+
+def load_baseline(path):
+    """Stored baseline, None if there is none yet"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_baseline(path, report):
+    """Store a run as the new baseline"""
+    baseline = dict(report)
+    baseline['python'] = platform.python_version()
+    baseline['machine'] = platform.machine()
+    baseline['recorded_at'] = datetime.utcnow().replace(microsecond=0).isoformat()
+    with open(path, 'w') as f:
+        json.dump(baseline, f, indent=2)
+        f.write('\n')
+
+def compare(report, baseline, threshold):
+    """Per benchmark: (seconds, baseline seconds or None, ratio or None, regressed)
+
+    A regression is both over the benchmark's allowed ratio and more than NOISE_FLOOR slower per call.
+    """
+    rows = {}
+    # Scale the baseline by how fast this machine runs the calibration workload
+    scale = 1.0
+    if baseline and baseline.get('calibration'):
+        scale = report['calibration'] / baseline['calibration']
+
+    for name, seconds in report['benchmarks'].items():
+        expected = (baseline or {}).get('benchmarks', {}).get(name)
+        if expected:
+            expected *= scale
+            ratio = seconds / expected
+            allowed = BENCHMARKS[name][2] if name in BENCHMARKS and BENCHMARKS[name][2] is not None else threshold
+            rows[name] = (seconds, expected, ratio, ratio > 1 + allowed and seconds - expected > NOISE_FLOOR)
+        else:
+            rows[name] = (seconds, None, None, False)
+    return rows
+
+def format_duration(seconds):
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.1f}µs"
+
+def print_report(rows, threshold):
+    """Print the comparison table"""
+    print("╔══════════════════════════════════════════════════════════════╗")
+    print("║                FunPay Auto Boost - Benchmarks                ║")
+    print("╚══════════════════════════════════════════════════════════════╝")
+    print("")
+    for name, (seconds, expected, ratio, regressed) in rows.items():
+        if expected is None:
+            print(f"⚪ {name:<36} {format_duration(seconds):>10}   (no baseline)")
+            continue
+        icon = "❌" if regressed else "✅"
+        print(f"{icon} {name:<36} {format_duration(seconds):>10}   baseline {format_duration(expected):>10}   {ratio:5.2f}x")
+    print("")
+    print(f"Threshold: {1 + threshold:.2f}x of baseline (calibrated to this machine) "
+          f"and over {format_duration(NOISE_FLOOR)} per call")
+
+def confirm_regressions(rows, baseline, threshold, repeat, runs=CONFIRM_RUNS):
+    """Re-run regressed benchmarks and keep their fastest result - noise rarely repeats, a regression does"""
+    for _ in range(runs):
+        regressed = [name for name, row in rows.items() if row[3]]
+        if not regressed:
+            break
+        rerun = compare(run_benchmarks(regressed, repeat), baseline, threshold)
+        for name in regressed:
+            if rerun[name][2] < rows[name][2]:
+                rows[name] = rerun[name]
+    return rows
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='FunPay Auto Boost - Microbenchmarks')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='Baseline file')
+    parser.add_argument('--update-baseline', action='store_true', help='Store this run as the new baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='Allowed slowdown, e.g. 0.3 fails anything over 1.3x the baseline')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='Timing runs per benchmark (median is kept)')
+    parser.add_argument('--only', nargs='*', choices=list(BENCHMARKS), help='Run only these benchmarks')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+    args = parser.parse_args()
+
+    report = run_benchmarks(args.only, args.repeat)
+
+    if args.update_baseline:
+        baseline = load_baseline(args.baseline) or {}
+        if args.only and baseline.get('benchmarks'):
+            # Keep the stored numbers of benchmarks that were not run, rescaled to this machine
+            scale = report['calibration'] / baseline['calibration']
+            merged = {name: seconds * scale for name, seconds in baseline['benchmarks'].items()}
+            merged.update(report['benchmarks'])
+            report = dict(report, benchmarks=merged)
+        save_baseline(args.baseline, report)
+        print(f"✅ Baseline saved to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    rows = confirm_regressions(compare(report, baseline, args.threshold), baseline, args.threshold, args.repeat)
+    if args.json:
+        print(json.dumps({
+            name: {'seconds': seconds, 'baseline': expected, 'ratio': ratio, 'regressed': regressed}
+            for name, (seconds, expected, ratio, regressed) in rows.items()
+        }, indent=2))
+    else:
+        print_report(rows, args.threshold)
+
+    return 1 if any(row[3] for row in rows.values()) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,11 +10,28 @@ import subprocess
 import time
 import json
 import logging
+import logging.handlers
+import queue
+import gzip
+import atexit
+import threading
+import multiprocessing
 import signal
+import socket
+import select
+import ctypes
+import ctypes.util
 import sys
 import random
+import heapq
 import hashlib
 import base64
+import re
+import shutil
+import urllib.request
+import urllib.error
+import email.utils
+from collections import deque, OrderedDict
 from datetime import datetime, timedelta
 import pytz
 from selenium import webdriver
@@ -23,7 +40,10 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.common.exceptions import (
+    TimeoutException, WebDriverException, NoSuchElementException, InvalidSelectorException,
+    NoSuchDriverException, SessionNotCreatedException
+)
 from selenium.webdriver.common.action_chains import ActionChains
 
 # Import telegram notifier
@@ -34,11 +54,306 @@ except ImportError:
     TELEGRAM_AVAILABLE = False
     print("⚠️ Telegram notifier not available")
 
+# Default log files - override per instance with the "logging" section of the config
+DEFAULT_LOG_SETTINGS = {
+    'level': 'INFO',
+    'console': True,
+    'queue_size': 10000,
+    'boost_log': {
+        'path': '/var/log/funpay/boost.log',
+        'max_bytes': 10 * 1024 * 1024,  # 10 MB
+        'when': None,  # e.g. "midnight" for time based rotation
+        'backup_count': 5,
+        'compress': True
+    },
+    'background_log': {
+        'path': '/var/log/funpay/background.log',
+        'max_bytes': 5 * 1024 * 1024,  # 5 MB
+        'when': None,
+        'backup_count': 3,
+        'compress': True
+    }
+}
+
+def account_state_file(config_file, name):
+    """Per-account state file stored next to the config"""
+    directory = os.path.dirname(config_file) or '.'
+    stem = os.path.splitext(os.path.basename(config_file))[0]
+    if stem == 'config':
+        return os.path.join(directory, f"{name}.json")
+    return os.path.join(directory, f"{stem}.{name}.json")
+
+# "Please wait" messages of the lot page and the raise request
+WAIT_MINUTE_PATTERNS = (
+    r'please wait (\d+) minutes?',
+    r'wait (\d+) minutes?',
+    r'подожди(?:те)? (\d+) минут',
+    r'через (\d+) минут',
+    r'cooldown.*?(\d+).*?minutes?',
+    r'try again.*?(\d+).*?minutes?'
+)
+
+WAIT_HOUR_PATTERNS = (
+    r'please wait (\d+) hours?',
+    r'wait (\d+) hours?',
+    r'подожди(?:те)? (\d+) час',
+    r'через (\d+) час'
+)
+
+def wait_minutes_from_text(text):
+    """Minutes from a "please wait" message, None if there is none"""
+    for pattern in WAIT_MINUTE_PATTERNS:
+        match = re.search(pattern, text or '', re.IGNORECASE)
+        if match:
+            return int(match.group(1))
+    for pattern in WAIT_HOUR_PATTERNS:
+        match = re.search(pattern, text or '', re.IGNORECASE)
+        if match:
+            return int(match.group(1)) * 60
+    return None
+
+def schedule_delay(result, boost_interval, rng=random):
+    """Seconds until an account should be checked again after a cycle result"""
+    if result == "success":
+        return boost_interval * 3600 + rng.randint(-1800, 1800)
+    if result == "wait":
+        return 3600 + rng.randint(-600, 600)
+    if result == "deadline_exceeded":
+        return 600 + rng.randint(-120, 120)
+    if result == "fatal":
+        return 6 * 3600 + rng.randint(-600, 600)
+    return 1800 + rng.randint(-300, 300)
+
+def _gzip_namer(name):
+    """Name rotated log files with a .gz suffix"""
+    return name + '.gz'
+
+def _gzip_rotator(source, dest):
+    """Compress a rotated log file"""
+    with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(source)
+
+def create_rotating_handler(settings):
+    """Create a size or time rotated file handler from log settings"""
+    path = settings['path']
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    
+    if settings.get('when'):
+        handler = logging.handlers.TimedRotatingFileHandler(
+            path, when=settings['when'], backupCount=settings.get('backup_count', 5), encoding='utf-8'
+        )
+    else:
+        handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=settings.get('max_bytes', 0), backupCount=settings.get('backup_count', 5), encoding='utf-8'
+        )
+    
+    if settings.get('compress', True):
+        handler.namer = _gzip_namer
+        handler.rotator = _gzip_rotator
+    return handler
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full"""
+    
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+# Running log pipelines by logger name: (logger, queue handler, listener)
+LOG_PIPELINES = {}
+
+def stop_log_pipeline(name, listener=None):
+    """Detach a logger's queue handler, flush its listener and close its files"""
+    pipeline = LOG_PIPELINES.get(name)
+    # Leave a pipeline alone that has already been replaced by someone else's
+    if not pipeline or (listener is not None and pipeline[2] is not listener):
+        return
+    del LOG_PIPELINES[name]
+    logger, queue_handler, listener = pipeline
+    logger.removeHandler(queue_handler)
+    if queue_handler.dropped:
+        sys.__stderr__.write(f"Logging queue full, dropped {queue_handler.dropped} records\n")
+    try:
+        listener.stop()
+    except Exception:
+        pass
+    for handler in listener.handlers:
+        handler.close()
+
+def stop_all_log_pipelines():
+    for name in list(LOG_PIPELINES):
+        stop_log_pipeline(name)
+
+atexit.register(stop_all_log_pipelines)
+
+class LogStream:
+    """File-like object that forwards writes (print, tracebacks) to a logger"""
+    
+    def __init__(self, logger, level=logging.INFO):
+        self.logger = logger
+        self.level = level
+        self.buffer = ''
+    
+    def write(self, message):
+        self.buffer += message
+        while '\n' in self.buffer:
+            line, self.buffer = self.buffer.split('\n', 1)
+            if line.strip():
+                self.logger.log(self.level, line)
+        return len(message)
+    
+    def flush(self):
+        if self.buffer.strip():
+            self.logger.log(self.level, self.buffer)
+        self.buffer = ''
+    
+    def isatty(self):
+        return False
+
+class SystemClock:
+    """Wall clock and sleeper - replaced by a simulated clock in the simulator"""
+    
+    def time(self):
+        return time.time()
+    
+    def utcnow(self):
+        return datetime.utcnow()
+    
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+class DeadlineExceeded(Exception):
+    """Raised when a boost cycle or one of its phases runs out of time"""
+    pass
+
+class BoostError(Exception):
+    """Failure with a known recovery category"""
+    category = 'transient'
+
+class AuthError(BoostError):
+    """Session, CAPTCHA or credentials need a new login - retrying will not help"""
+    category = 'auth'
+
+class SiteChangeError(BoostError):
+    """The page no longer has the elements we expect"""
+    category = 'site_change'
+
+class FatalError(BoostError):
+    """Broken installation or configuration - needs the operator"""
+    category = 'fatal'
+
+# Retry policy per failure category: attempts per call, backoff and retries allowed per boost cycle
+ERROR_POLICIES = {
+    'transient': {'attempts': 5, 'base_delay': 1.0, 'max_delay': 300.0, 'cycle_budget': 8},
+    'site_change': {'attempts': 2, 'base_delay': 5.0, 'max_delay': 30.0, 'cycle_budget': 1},
+    'auth': {'attempts': 1, 'base_delay': 0.0, 'max_delay': 0.0, 'cycle_budget': 0},
+    'fatal': {'attempts': 1, 'base_delay': 0.0, 'max_delay': 0.0, 'cycle_budget': 0}
+}
+
+def classify_error(error):
+    """Failure category of an exception: transient, auth, site_change or fatal"""
+    if isinstance(error, BoostError):
+        return error.category
+    # Missing chromedriver, missing binaries, unreadable files
+    if isinstance(error, (NoSuchDriverException, FileNotFoundError, PermissionError)):
+        return 'fatal'
+    # DevToolsActivePort and port races usually go away on the next start - a version
+    # mismatch is raised as FatalError where the session is created
+    if isinstance(error, SessionNotCreatedException):
+        return 'transient'
+    # Nobody is there to answer a prompt
+    if isinstance(error, EOFError):
+        return 'auth'
+    if isinstance(error, (NoSuchElementException, InvalidSelectorException)):
+        return 'site_change'
+    if 'captcha' in str(error).lower():
+        return 'auth'
+    return 'transient'
+
+class CycleDeadline:
+    """Time budget for one boost cycle and for each of its phases"""
+    
+    def __init__(self, total, phases=None, clock=None):
+        self.clock = clock or SystemClock()
+        self.total = total
+        self.phases = phases or {}
+        self.started = self.clock.time()
+        self.phase_name = None
+        self.phase_ends = None
+        self.expired = False
+    
+    def remaining(self):
+        """Seconds left in the current phase (or the whole cycle)"""
+        ends = self.started + self.total
+        if self.phase_ends is not None:
+            ends = min(ends, self.phase_ends)
+        return ends - self.clock.time()
+    
+    def start_phase(self, name):
+        """Begin a new phase with its own budget"""
+        self.check()
+        budget = self.phases.get(name)
+        self.phase_name = name
+        self.phase_ends = self.clock.time() + budget if budget else None
+    
+    def check(self):
+        """Raise DeadlineExceeded if the budget is used up"""
+        if self.expired or self.remaining() <= 0:
+            self.expired = True
+            raise DeadlineExceeded(f"{self.phase_name or 'cycle'} deadline exceeded")
+
+class PersistentChromeService(Service):
+    """ChromeDriver service that outlives individual browser sessions"""
+    
+    starting = False
+    
+    def start(self):
+        """Start chromedriver unless a connectable one is already running"""
+        if self.is_alive():
+            return
+        # A chromedriver that runs but never answers is of no use - replace it
+        if self.is_running():
+            self.shutdown()
+        # Selenium calls stop() when the start fails, that one has to kill the process
+        self.starting = True
+        try:
+            super().start()
+        finally:
+            self.starting = False
+    
+    def stop(self):
+        """Ignore per-session stop requests (driver.quit) - use shutdown()"""
+        if self.starting:
+            super().stop()
+    
+    def shutdown(self):
+        """Really stop the chromedriver process"""
+        super().stop()
+    
+    def is_running(self):
+        """Check if the chromedriver process exists, answering or not"""
+        process = getattr(self, 'process', None)
+        return process is not None and process.poll() is None
+    
+    def is_alive(self):
+        """Check if the chromedriver process is running and accepts connections"""
+        return self.is_running() and self.is_connectable()
+
 class RateLimiter:
     """Advanced Rate Limiting with adaptive delays"""
     
-    def __init__(self):
-        self.request_history = []
+    def __init__(self, clock=None, rng=None, logger=None):
+        self.clock = clock or SystemClock()
+        self.rng = rng or random
+        self.logger = logger or logging.getLogger(__name__)
+        self.request_history = deque()  # Request times, oldest first
         self.base_delay = 2.0
         self.max_delay = 30.0
         self.burst_threshold = 3
@@ -47,10 +362,11 @@ class RateLimiter:
         
     def wait_if_needed(self, action_type="general"):
         """Apply intelligent rate limiting based on recent activity"""
-        now = time.time()
+        now = self.clock.time()
         
         # Clean old entries
-        self.request_history = [t for t in self.request_history if now - t < self.cooldown_period]
+        while self.request_history and now - self.request_history[0] >= self.cooldown_period:
+            self.request_history.popleft()
         
         # Calculate adaptive delay
         recent_requests = len(self.request_history)
@@ -61,18 +377,18 @@ class RateLimiter:
             delay *= self.adaptive_factor
             
             # Add randomization to avoid detection patterns
-            jitter = random.uniform(0.5, 1.5)
+            jitter = self.rng.uniform(0.5, 1.5)
             final_delay = delay * jitter
             
-            logging.info(f"Rate limiting: waiting {final_delay:.2f}s (recent requests: {recent_requests})")
-            time.sleep(final_delay)
+            self.logger.info(f"Rate limiting: waiting {final_delay:.2f}s (recent requests: {recent_requests})")
+            self.clock.sleep(final_delay)
             
             # Increase adaptive factor if we're hitting limits frequently
             self.adaptive_factor = min(self.adaptive_factor * 1.1, 3.0)
         else:
             # Normal operation - small random delay
-            delay = random.uniform(1.0, 3.0)
-            time.sleep(delay)
+            delay = self.rng.uniform(1.0, 3.0)
+            self.clock.sleep(delay)
             
             # Gradually reduce adaptive factor during normal operation
             self.adaptive_factor = max(self.adaptive_factor * 0.95, 1.0)
@@ -82,8 +398,8 @@ class RateLimiter:
     
     def add_human_delay(self, min_delay=0.5, max_delay=2.0):
         """Add human-like random delays"""
-        delay = random.uniform(min_delay, max_delay)
-        time.sleep(delay)
+        delay = self.rng.uniform(min_delay, max_delay)
+        self.clock.sleep(delay)
     
     def reset_adaptive_factor(self):
         """Reset adaptive factor after successful operations"""
@@ -92,33 +408,39 @@ class RateLimiter:
 class BrowserStealth:
     """Advanced browser detection avoidance"""
     
-    def __init__(self):
-        self.user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ]
-        
-        self.screen_resolutions = [
-            (1920, 1080), (1366, 768), (1440, 900), (1536, 864), (1280, 720)
-        ]
-        
-        self.languages = ["en-US,en;q=0.9", "en-GB,en;q=0.9", "en;q=0.9"]
+    # Shared by every account - never modified
+    user_agents = (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    )
+    
+    screen_resolutions = (
+        (1920, 1080), (1366, 768), (1440, 900), (1536, 864), (1280, 720)
+    )
+    
+    languages = ("en-US,en;q=0.9", "en-GB,en;q=0.9", "en;q=0.9")
+    
+    __slots__ = ('rng', 'logger')
+    
+    def __init__(self, rng=None, logger=None):
+        self.rng = rng or random
+        self.logger = logger or logging.getLogger(__name__)
         
     def get_random_user_agent(self):
         """Get a random user agent"""
-        return random.choice(self.user_agents)
+        return self.rng.choice(self.user_agents)
     
     def get_random_resolution(self):
         """Get a random screen resolution"""
-        return random.choice(self.screen_resolutions)
+        return self.rng.choice(self.screen_resolutions)
     
     def get_random_language(self):
         """Get a random language preference"""
-        return random.choice(self.languages)
+        return self.rng.choice(self.languages)
     
     def apply_stealth_settings(self, chrome_options):
         """Apply comprehensive stealth settings to Chrome"""
@@ -169,7 +491,7 @@ class BrowserStealth:
             try:
                 driver.execute_script(script)
             except Exception as e:
-                logging.debug(f"Failed to execute stealth script: {e}")
+                self.logger.debug(f"Failed to execute stealth script: {e}")
     
     def simulate_human_behavior(self, driver, element=None):
         """Simulate human-like mouse movements and interactions"""
@@ -179,118 +501,272 @@ class BrowserStealth:
             if element:
                 # Move to element with human-like curve
                 actions.move_to_element_with_offset(element, 
-                    random.randint(-5, 5), random.randint(-5, 5))
+                    self.rng.randint(-5, 5), self.rng.randint(-5, 5))
                 
                 # Add small random movements
-                for _ in range(random.randint(1, 3)):
-                    actions.move_by_offset(random.randint(-2, 2), random.randint(-2, 2))
-                    actions.pause(random.uniform(0.1, 0.3))
+                for _ in range(self.rng.randint(1, 3)):
+                    actions.move_by_offset(self.rng.randint(-2, 2), self.rng.randint(-2, 2))
+                    actions.pause(self.rng.uniform(0.1, 0.3))
                 
-                actions.pause(random.uniform(0.2, 0.8))
+                actions.pause(self.rng.uniform(0.2, 0.8))
                 actions.click()
             else:
                 # Random mouse movements
-                for _ in range(random.randint(2, 5)):
-                    x = random.randint(100, 800)
-                    y = random.randint(100, 600)
+                for _ in range(self.rng.randint(2, 5)):
+                    x = self.rng.randint(100, 800)
+                    y = self.rng.randint(100, 600)
                     actions.move_by_offset(x, y)
-                    actions.pause(random.uniform(0.5, 1.5))
+                    actions.pause(self.rng.uniform(0.5, 1.5))
             
             actions.perform()
             
         except Exception as e:
-            logging.debug(f"Human behavior simulation failed: {e}")
+            self.logger.debug(f"Human behavior simulation failed: {e}")
+
+class CircuitBreakerOpen(Exception):
+    """Raised when a call is rejected because its circuit breaker is open"""
+    pass
 
 class CircuitBreaker:
     """Circuit breaker pattern for error recovery"""
     
-    def __init__(self, failure_threshold=5, recovery_timeout=300, expected_exception=Exception):
+    def __init__(self, failure_threshold=5, recovery_timeout=300, expected_exception=Exception, clock=None,
+                 name='default', half_open_max_calls=1, max_recovery_timeout=None, on_transition=None, logger=None):
+        self.clock = clock or SystemClock()
+        self.logger = logger or logging.getLogger(__name__)
+        self.name = name
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
+        # Each failed probe doubles the wait before the next one, up to this limit
+        self.max_recovery_timeout = max_recovery_timeout or recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
         self.expected_exception = expected_exception
+        self.on_transition = on_transition
         self.failure_count = 0
         self.last_failure_time = None
+        self.open_count = 0  # Consecutive openings without a successful probe
+        self.half_open_calls = 0
+        self.half_open_successes = 0
         self.state = 'CLOSED'  # CLOSED, OPEN, HALF_OPEN
+        self.state_changed_at = self.clock.time()
+        self.transitions = []  # (time, from_state, to_state), most recent last
         
     def call(self, func, *args, **kwargs):
         """Execute function with circuit breaker protection"""
         if self.state == 'OPEN':
             if self._should_attempt_reset():
-                self.state = 'HALF_OPEN'
+                self._transition('HALF_OPEN')
             else:
-                raise Exception("Circuit breaker is OPEN")
+                raise CircuitBreakerOpen(
+                    f"Circuit breaker '{self.name}' is OPEN (next probe in {self.time_until_probe():.0f}s)"
+                )
+        
+        # Only a bounded number of probes may test a recovering dependency
+        if self.state == 'HALF_OPEN':
+            if self.half_open_calls >= self.half_open_max_calls:
+                raise CircuitBreakerOpen(f"Circuit breaker '{self.name}' is HALF_OPEN, probe limit reached")
+            self.half_open_calls += 1
         
         try:
             result = func(*args, **kwargs)
             self._on_success()
             return result
+        except DeadlineExceeded:
+            raise
         except self.expected_exception as e:
             self._on_failure()
             raise e
     
+    def current_timeout(self):
+        """Wait before the next probe, grown by every failed probe"""
+        return min(self.recovery_timeout * (2 ** max(self.open_count - 1, 0)), self.max_recovery_timeout)
+    
+    def time_until_probe(self):
+        """Seconds until the breaker lets a probe through (0 unless OPEN)"""
+        if self.state != 'OPEN':
+            return 0
+        return max(self.current_timeout() - (self.clock.time() - self.last_failure_time), 0)
+    
+    def status(self):
+        """State, counters and transition times"""
+        return {
+            'state': self.state,
+            'failure_count': self.failure_count,
+            'state_changed_at': self.state_changed_at,
+            'next_probe_in': round(self.time_until_probe(), 1),
+            'transitions': self.transitions[-10:]
+        }
+    
+    def _transition(self, state):
+        """Move to a new state and record when it happened"""
+        if state == self.state:
+            return
+        now = self.clock.time()
+        self.transitions.append((now, self.state, state))
+        del self.transitions[:-50]
+        self.logger.info(f"Circuit breaker '{self.name}': {self.state} -> {state}")
+        self.state = state
+        self.state_changed_at = now
+        self.half_open_calls = 0
+        self.half_open_successes = 0
+        if self.on_transition:
+            self.on_transition(self)
+    
     def _should_attempt_reset(self):
         """Check if enough time has passed to attempt reset"""
-        return (time.time() - self.last_failure_time) >= self.recovery_timeout
+        return (self.clock.time() - self.last_failure_time) >= self.current_timeout()
     
     def _on_success(self):
         """Handle successful execution"""
         self.failure_count = 0
-        self.state = 'CLOSED'
+        if self.state == 'HALF_OPEN':
+            self.half_open_successes += 1
+            if self.half_open_successes < self.half_open_max_calls:
+                return
+        self.open_count = 0
+        self._transition('CLOSED')
     
     def _on_failure(self):
         """Handle failed execution"""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = self.clock.time()
         
-        if self.failure_count >= self.failure_threshold:
-            self.state = 'OPEN'
-            logging.warning(f"Circuit breaker opened after {self.failure_count} failures")
+        # A failed probe reopens the breaker straight away
+        if self.state == 'HALF_OPEN' or self.failure_count >= self.failure_threshold:
+            self.open_count += 1
+            self._transition('OPEN')
+            self.logger.warning(
+                f"Circuit breaker '{self.name}' opened after {self.failure_count} failures, "
+                f"next probe in {self.current_timeout():.0f}s"
+            )
+
+class CircuitBreakerRegistry:
+    """Named circuit breakers, one per dependency"""
+    
+    DEFAULTS = {
+        'navigation': {'failure_threshold': 5, 'recovery_timeout': 300, 'max_recovery_timeout': 1800},
+        'login': {'failure_threshold': 3, 'recovery_timeout': 600, 'max_recovery_timeout': 3600},
+        'browser_startup': {'failure_threshold': 3, 'recovery_timeout': 120, 'max_recovery_timeout': 1800},
+        'telegram': {'failure_threshold': 3, 'recovery_timeout': 300, 'max_recovery_timeout': 3600}
+    }
+    
+    def __init__(self, settings=None, clock=None, state_file=None, logger=None):
+        self.clock = clock or SystemClock()
+        self.logger = logger or logging.getLogger(__name__)
+        self.settings = settings or {}
+        self.state_file = state_file
+        self.breakers = {}
+    
+    def get(self, name):
+        """Breaker for a dependency, created on first use"""
+        breaker = self.breakers.get(name)
+        if breaker is None:
+            options = dict(self.DEFAULTS.get(name, {}))
+            options.update(self.settings.get(name, {}))
+            breaker = self.breakers[name] = CircuitBreaker(
+                clock=self.clock, name=name, on_transition=self._on_transition, logger=self.logger, **options
+            )
+        return breaker
+    
+    def call(self, name, func, *args, **kwargs):
+        """Run func behind the named breaker"""
+        return self.get(name).call(func, *args, **kwargs)
+    
+    def next_probe_in(self):
+        """Seconds until the first open breaker accepts a probe (0 if none is open)"""
+        waits = [breaker.time_until_probe() for breaker in self.breakers.values() if breaker.state == 'OPEN']
+        return min(waits) if waits else 0
+    
+    def status(self):
+        """Status of every breaker by name"""
+        return {name: breaker.status() for name, breaker in self.breakers.items()}
+    
+    def load_status(self):
+        """Last saved status (for --status from another process)"""
+        try:
+            with open(self.state_file, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+    
+    def _on_transition(self, breaker):
+        """Persist breaker states so --status can show them"""
+        if not self.state_file:
+            return
+        try:
+            with open(self.state_file, 'w') as f:
+                json.dump(self.status(), f, indent=2)
+        except Exception as e:
+            self.logger.debug(f"Failed to save circuit breaker state: {e}")
 
 class ErrorRecovery:
     """Advanced error recovery with exponential backoff"""
     
-    def __init__(self):
+    def __init__(self, clock=None, rng=None, policies=None, logger=None):
+        self.clock = clock or SystemClock()
+        self.rng = rng or random
+        self.logger = logger or logging.getLogger(__name__)
         self.retry_counts = {}
-        self.max_retries = 5
-        self.base_delay = 1.0
-        self.max_delay = 300.0  # 5 minutes
+        self.policies = {category: dict(policy) for category, policy in ERROR_POLICIES.items()}
+        for category, policy in (policies or {}).items():
+            self.policies.setdefault(category, {}).update(policy)
         self.backoff_factor = 2.0
+        self.deadline = None  # CycleDeadline of the running boost cycle
+        self.reset_cycle_budget()
+    
+    def reset_cycle_budget(self):
+        """Refill the per-category retry budget (call at the start of each boost cycle)"""
+        self.cycle_budget = {category: policy['cycle_budget'] for category, policy in self.policies.items()}
         
     def execute_with_retry(self, func, operation_name, *args, **kwargs):
-        """Execute function with intelligent retry logic"""
+        """Execute function with intelligent retry logic - re-raises the last error when retries are exhausted"""
         retry_count = self.retry_counts.get(operation_name, 0)
+        attempt = 0
         
-        for attempt in range(self.max_retries):
+        while True:
             try:
                 result = func(*args, **kwargs)
                 # Reset retry count on success
                 self.retry_counts[operation_name] = 0
                 return result
                 
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 retry_count += 1
                 self.retry_counts[operation_name] = retry_count
                 
-                if attempt == self.max_retries - 1:
-                    logging.error(f"Operation '{operation_name}' failed after {self.max_retries} attempts: {e}")
+                # Only failures that can go away on their own are retried
+                category = classify_error(e)
+                policy = self.policies[category]
+                if attempt + 1 >= policy['attempts']:
+                    self.logger.error(f"Operation '{operation_name}' failed ({category}) after {attempt + 1} attempts: {e}")
+                    raise e
+                if self.cycle_budget.get(category, 0) <= 0:
+                    self.logger.error(f"Operation '{operation_name}' failed ({category}), retry budget for this cycle is spent: {e}")
                     raise e
+                self.cycle_budget[category] -= 1
                 
                 # Calculate delay with exponential backoff
                 delay = min(
-                    self.base_delay * (self.backoff_factor ** attempt),
-                    self.max_delay
+                    policy['base_delay'] * (self.backoff_factor ** attempt),
+                    policy['max_delay']
                 )
                 
                 # Add jitter to prevent thundering herd
-                jitter = random.uniform(0.5, 1.5)
+                jitter = self.rng.uniform(0.5, 1.5)
                 final_delay = delay * jitter
                 
-                logging.warning(f"Operation '{operation_name}' failed (attempt {attempt + 1}/{self.max_retries}): {e}")
-                logging.info(f"Retrying in {final_delay:.2f} seconds...")
+                # Never back off past the end of the running boost cycle
+                if self.deadline is not None and final_delay >= self.deadline.remaining():
+                    self.deadline.expired = True
+                    raise DeadlineExceeded(f"no time left to retry '{operation_name}': {e}")
                 
-                time.sleep(final_delay)
-        
-        return None
+                self.logger.warning(f"Operation '{operation_name}' failed ({category}, attempt {attempt + 1}/{policy['attempts']}): {e}")
+                self.logger.info(f"Retrying in {final_delay:.2f} seconds...")
+                
+                self.clock.sleep(final_delay)
+                attempt += 1
     
     def get_retry_count(self, operation_name):
         """Get current retry count for an operation"""
@@ -300,59 +776,1253 @@ class ErrorRecovery:
         """Reset retry count for an operation"""
         self.retry_counts[operation_name] = 0
 
+class PageSnapshot:
+    """Per-navigation cache of the page document to avoid repeated page_source transfers"""
+    
+    CONTAINER_SCRIPT = "var el = document.querySelector(arguments[0]); return el ? el.outerHTML : null;"
+    
+    def __init__(self):
+        self.driver_id = None
+        self.documents = {}
+        self.reset_stats()
+    
+    def reset_stats(self):
+        """Reset per-cycle counters and return the previous ones"""
+        previous = getattr(self, 'stats', None)
+        self.stats = {'fetches': 0, 'hits': 0, 'bytes_fetched': 0, 'bytes_saved': 0}
+        return previous
+    
+    def invalidate(self):
+        """Forget cached documents (call after navigation or click)"""
+        self.documents = {}
+    
+    def _get(self, driver, key, fetch):
+        if id(driver) != self.driver_id:
+            self.driver_id = id(driver)
+            self.invalidate()
+        
+        if key in self.documents:
+            document = self.documents[key]
+            self.stats['hits'] += 1
+            self.stats['bytes_saved'] += len(document or '')
+            return document
+        
+        document = fetch()
+        self.documents[key] = document
+        self.stats['fetches'] += 1
+        self.stats['bytes_fetched'] += len(document or '')
+        return document
+    
+    def source(self, driver):
+        """Full page source, fetched at most once per navigation"""
+        return self._get(driver, 'source', lambda: driver.page_source)
+    
+    def lower(self, driver):
+        """Lowercased page source"""
+        if 'lower' in self.documents and id(driver) == self.driver_id:
+            self.stats['hits'] += 1
+            self.stats['bytes_saved'] += len(self.documents['lower'])
+            return self.documents['lower']
+        self.documents['lower'] = self.source(driver).lower()
+        return self.documents['lower']
+    
+    def container(self, driver, css_selector):
+        """HTML of a single container - falls back to the full page if it is missing"""
+        if not css_selector:
+            return self.source(driver)
+        if 'source' in self.documents and id(driver) == self.driver_id:
+            return self.source(driver)
+        
+        html = self._get(driver, f"container:{css_selector}",
+                         lambda: driver.execute_script(self.CONTAINER_SCRIPT, css_selector))
+        return html if html is not None else self.source(driver)
+
+class CommandStats:
+    """Counts WebDriver commands by type with their latency and payload sizes"""
+    
+    def __init__(self):
+        self.reset()
+    
+    def reset(self):
+        """Start a new cycle and return the previous counters"""
+        previous = getattr(self, 'commands', None)
+        self.commands = {}
+        return previous
+    
+    @staticmethod
+    def attach(driver, stats):
+        """Route the driver's commands into stats (the wrapper is installed once per driver)"""
+        if driver is None:
+            return
+        driver._command_stats = stats
+        if getattr(driver, '_command_stats_installed', False):
+            return
+        
+        # WebElement methods call back into driver.execute, so this sees every command
+        original = driver.execute
+        
+        def execute(driver_command, params=None):
+            started = time.perf_counter()
+            response = None
+            try:
+                response = original(driver_command, params)
+                return response
+            finally:
+                current = getattr(driver, '_command_stats', None)
+                if current is not None:
+                    current.record(driver_command, time.perf_counter() - started, params, response)
+        
+        driver.execute = execute
+        driver._command_stats_installed = True
+    
+    @staticmethod
+    def payload_size(value):
+        """Approximate JSON size of a command payload"""
+        if value is None:
+            return 0
+        if isinstance(value, str):
+            return len(value.encode('utf-8', errors='ignore'))
+        try:
+            return len(json.dumps(value, default=str))
+        except Exception:
+            return 0
+    
+    def record(self, command, seconds, params=None, response=None):
+        entry = self.commands.setdefault(command, {'count': 0, 'seconds': 0.0, 'bytes_sent': 0, 'bytes_received': 0})
+        entry['count'] += 1
+        entry['seconds'] += seconds
+        entry['bytes_sent'] += self.payload_size(params)
+        if isinstance(response, dict):
+            entry['bytes_received'] += self.payload_size(response.get('value'))
+    
+    def totals(self):
+        totals = {'count': 0, 'seconds': 0.0, 'bytes_sent': 0, 'bytes_received': 0}
+        for entry in self.commands.values():
+            for key in totals:
+                totals[key] += entry[key]
+        return totals
+    
+    def summary(self, top=5):
+        """One-line description of the busiest commands"""
+        totals = self.totals()
+        busiest = sorted(self.commands.items(), key=lambda item: item[1]['count'], reverse=True)[:top]
+        breakdown = ', '.join(f"{command} {entry['count']}" for command, entry in busiest)
+        return (
+            f"{totals['count']} commands ({breakdown or 'none'}), "
+            f"{(totals['bytes_sent'] + totals['bytes_received']) / 1024:.1f} KB, {totals['seconds']:.1f}s"
+        )
+    
+    def to_dict(self):
+        commands = {
+            command: dict(entry, seconds=round(entry['seconds'], 3)) for command, entry in self.commands.items()
+        }
+        totals = self.totals()
+        totals['seconds'] = round(totals['seconds'], 3)
+        return {'totals': totals, 'commands': commands}
+
+class RaiseResponseWatcher:
+    """Reads the outcome of the raise request from Chrome's DevTools network events (performance log)"""
+    
+    RAISE_URL = re.compile(r'/lots/raise\b')
+    
+    def __init__(self, driver, clock=None, logger=None):
+        self.driver = driver
+        self.clock = clock or SystemClock()
+        self.logger = logger or logging.getLogger(__name__)
+        self.supported = False
+    
+    @staticmethod
+    def enable(options):
+        """Ask ChromeDriver to record network events for a new session"""
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        return options
+    
+    def _events(self):
+        for entry in self.driver.get_log('performance'):
+            try:
+                yield json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+    
+    def start(self):
+        """Drop events recorded so far; False when the session has no network log"""
+        try:
+            for _ in self._events():
+                pass
+            self.supported = True
+        except Exception as e:
+            self.logger.debug(f"Network events unavailable: {e}")
+            self.supported = False
+        return self.supported
+    
+    def wait(self, timeout=15, poll_interval=0.2):
+        """Status and JSON body of the raise response, None if it did not arrive in time"""
+        if not self.supported:
+            return None
+        
+        requests = {}  # requestId -> HTTP status of raise responses
+        deadline = self.clock.time() + timeout
+        while self.clock.time() < deadline:
+            try:
+                for event in self._events():
+                    method, params = event.get('method'), event.get('params', {})
+                    if method == 'Network.responseReceived':
+                        response = params.get('response', {})
+                        if self.RAISE_URL.search(response.get('url', '')):
+                            requests[params.get('requestId')] = response.get('status')
+                    elif method == 'Network.loadingFinished' and params.get('requestId') in requests:
+                        request_id = params['requestId']
+                        body = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+                        try:
+                            payload = json.loads(body.get('body') or '{}')
+                        except ValueError:
+                            payload = {'msg': body.get('body')}
+                        return {'status': requests[request_id], 'body': payload}
+            except Exception as e:
+                self.logger.debug(f"Reading network events failed: {e}")
+                return None
+            self.clock.sleep(poll_interval)
+        return None
+    
+    @staticmethod
+    def interpret(response):
+        """('success' | 'wait', wait minutes or None) from a raise response, None if it is not conclusive"""
+        body = response.get('body') if isinstance(response.get('body'), dict) else {}
+        message = str(body.get('msg') or '')
+        if response.get('status') != 200 or body.get('modal'):
+            # Errors and the category picker are left to the page checks
+            return None
+        if body.get('error'):
+            wait_minutes = wait_minutes_from_text(message)
+            return ('wait', wait_minutes) if wait_minutes else None
+        return 'success', wait_minutes_from_text(message)
+
+class CycleJournal:
+    """Append-only JSON lines record of every boost cycle"""
+    
+    def __init__(self, path, max_bytes=5 * 1024 * 1024, logger=None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.logger = logger or logging.getLogger(__name__)
+    
+    def append(self, entry):
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            if os.path.exists(self.path) and os.path.getsize(self.path) > self.max_bytes:
+                os.replace(self.path, f"{self.path}.1")
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(entry) + '\n')
+        except Exception as e:
+            self.logger.debug(f"Failed to write cycle journal: {e}")
+    
+    def last(self):
+        """Most recent entry, or None"""
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(f.tell() - 65536, 0))
+                lines = f.read().splitlines()
+            return json.loads(lines[-1]) if lines else None
+        except Exception:
+            return None
+
+class SelectorStats:
+    """Persisted selector hit statistics used to try the best selector first"""
+    
+    def __init__(self, stats_file, history_size=20, logger=None):
+        self.stats_file = stats_file
+        self.history_size = history_size
+        self.logger = logger or logging.getLogger(__name__)
+        self.data = {}
+        self.load()
+    
+    def load(self):
+        """Load statistics from disk"""
+        try:
+            if os.path.exists(self.stats_file):
+                with open(self.stats_file, 'r') as f:
+                    self.data = json.load(f)
+        except Exception as e:
+            self.logger.debug(f"Failed to load selector stats: {e}")
+            self.data = {}
+    
+    def save(self):
+        """Save statistics to disk"""
+        try:
+            os.makedirs(os.path.dirname(self.stats_file) or '.', exist_ok=True)
+            with open(self.stats_file, 'w') as f:
+                json.dump(self.data, f, indent=2, ensure_ascii=False)
+            return True
+        except Exception as e:
+            self.logger.debug(f"Failed to save selector stats: {e}")
+            return False
+    
+    def _entry(self, key):
+        return self.data.setdefault(key, {'selectors': {}, 'recent': []})
+    
+    def ordered(self, key, selectors):
+        """Selectors sorted by past hits, selectors that never hit go last"""
+        stats = self._entry(key)['selectors']
+        
+        def rank(item):
+            index, selector = item
+            entry = stats.get(selector, {})
+            return (-entry.get('hits', 0), entry.get('misses', 0), index)
+        
+        return [selector for _, selector in sorted(enumerate(selectors), key=rank)]
+    
+    def record(self, key, tried, hit_selector=None):
+        """Record the outcome of one lookup"""
+        entry = self._entry(key)
+        for selector in tried:
+            selector_stats = entry['selectors'].setdefault(selector, {'hits': 0, 'misses': 0})
+            if selector == hit_selector:
+                selector_stats['hits'] += 1
+                selector_stats['last_hit'] = datetime.utcnow().isoformat()
+            else:
+                selector_stats['misses'] += 1
+        
+        entry['recent'] = (entry['recent'] + [1 if hit_selector else 0])[-self.history_size:]
+        self.save()
+    
+    def hit_rate(self, key):
+        """Hit rate over the recent lookups, None if there is no history"""
+        recent = self._entry(key)['recent']
+        if not recent:
+            return None
+        return sum(recent) / len(recent)
+
+def parse_cookies(data):
+    """Cookies from a cookie list, a {name: value} mapping or a "name=value; ..." header"""
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode('utf-8')
+    if isinstance(data, str):
+        data = data.strip()
+        try:
+            data = json.loads(data)
+        except ValueError:
+            data = dict(part.strip().split('=', 1) for part in data.split(';') if '=' in part)
+    if isinstance(data, dict) and isinstance(data.get('cookies'), list):
+        data = data['cookies']
+    if isinstance(data, dict):
+        data = [{'name': name, 'value': value} for name, value in data.items()]
+    if not isinstance(data, list):
+        raise ValueError("unrecognised cookie format")
+    
+    # Errors are logged - they name cookies and fields, never values
+    cookies = []
+    for position, cookie in enumerate(data):
+        if not isinstance(cookie, dict):
+            raise ValueError(f"invalid cookie #{position + 1}: not an object")
+        missing = [field for field in ('name', 'value') if not cookie.get(field)]
+        if missing:
+            raise ValueError(f"invalid cookie {cookie.get('name') or '#' + str(position + 1)}: "
+                             f"missing {', '.join(missing)}")
+        cookie = dict(cookie)
+        cookie.setdefault('domain', '.funpay.com')
+        cookie.setdefault('path', '/')
+        cookies.append(cookie)
+    
+    if not any(cookie['name'] == 'golden_key' for cookie in cookies):
+        raise ValueError("golden_key cookie is missing")
+    return cookies
+
+class CookieInbox:
+    """Fresh cookies delivered out of band through a drop file or a local Unix socket"""
+    
+    def __init__(self, drop_file, socket_path=None, logger=None):
+        self.drop_file = drop_file
+        self.socket_path = socket_path
+        self.logger = logger or logging.getLogger(__name__)
+        self.server = None
+    
+    def open(self):
+        """Start listening on the socket (the drop file needs no setup)"""
+        if not self.socket_path or self.server:
+            return
+        try:
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(self.socket_path)
+            os.chmod(self.socket_path, 0o600)
+            server.listen(4)
+            server.setblocking(False)
+            self.server = server
+        except Exception as e:
+            self.logger.warning(f"Cookie socket unavailable, only the drop file is watched: {e}")
+    
+    def close(self):
+        """Stop listening and remove the socket"""
+        if not self.server:
+            return
+        try:
+            self.server.close()
+            os.unlink(self.socket_path)
+        except Exception:
+            pass
+        self.server = None
+    
+    def poll(self):
+        """Cookies delivered since the last poll, or None"""
+        return self._poll_socket() or self._poll_file()
+    
+    def _poll_file(self):
+        if not os.path.exists(self.drop_file):
+            return None
+        try:
+            with open(self.drop_file, 'r') as f:
+                data = f.read()
+            os.remove(self.drop_file)
+            return parse_cookies(data)
+        except Exception as e:
+            self.logger.error(f"Ignoring cookie drop file {self.drop_file}: {e}")
+            return None
+    
+    def _poll_socket(self):
+        if not self.server:
+            return None
+        try:
+            conn, _ = self.server.accept()
+        except (BlockingIOError, OSError):
+            return None
+        
+        with conn:
+            try:
+                conn.settimeout(5)
+                chunks = []
+                while True:
+                    chunk = conn.recv(65536)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                cookies = parse_cookies(b''.join(chunks))
+                conn.sendall(b"ok\n")
+                return cookies
+            except Exception as e:
+                self.logger.error(f"Ignoring cookies from socket: {e}")
+                try:
+                    conn.sendall(f"error: {e}\n".encode('utf-8'))
+                except Exception:
+                    pass
+                return None
+    
+    def deliver(self, data):
+        """Hand cookies to a running daemon - socket if it is listening, drop file otherwise"""
+        parse_cookies(data)  # Reject bad input here, not in the daemon
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        
+        if self.socket_path and os.path.exists(self.socket_path):
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                    client.settimeout(10)
+                    client.connect(self.socket_path)
+                    client.sendall(data)
+                    client.shutdown(socket.SHUT_WR)
+                    return client.recv(1024).decode('utf-8').strip()
+            except OSError:
+                pass
+        
+        # Written under a temporary name so the daemon never reads half a file
+        temp_file = f"{self.drop_file}.tmp"
+        with open(temp_file, 'wb') as f:
+            f.write(data)
+        os.chmod(temp_file, 0o600)
+        os.replace(temp_file, self.drop_file)
+        return f"dropped into {self.drop_file}"
+
+# Config keys that change when the next boost check should happen
+SCHEDULE_KEYS = ('boost_interval', 'target_url', 'target_urls')
+
+def validate_config(config):
+    """Problems that make a config unusable (empty list when it is fine)"""
+    if not isinstance(config, dict):
+        return ["config must be a JSON object"]
+    
+    errors = []
+    interval = config.get('boost_interval', 3)
+    if isinstance(interval, bool) or not isinstance(interval, (int, float)) or interval <= 0:
+        errors.append("boost_interval must be a positive number of hours")
+    
+    target_urls = list(config.get('target_urls') or [])
+    if config.get('target_url'):
+        target_urls.append(config['target_url'])
+    for target_url in target_urls:
+        if not isinstance(target_url, str) or not target_url.startswith('http'):
+            errors.append(f"invalid target URL: {target_url}")
+    
+    for key in ('username', 'password'):
+        if key in config and not isinstance(config[key], str):
+            errors.append(f"{key} must be a string")
+    
+    if config.get('cookies'):
+        try:
+            parse_cookies(config['cookies'])
+        except ValueError as e:
+            errors.append(f"cookies: {e}")
+    return errors
+
+class ConfigWatcher:
+    """Notices edits of the config file - inotify when available, polling otherwise"""
+    
+    # inotify event masks (linux/inotify.h)
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    
+    def __init__(self, path, logger=None):
+        self.path = path
+        self.logger = logger or logging.getLogger(__name__)
+        self.fd = None
+        self.signature = self._signature()
+        self._start_inotify()
+    
+    def _start_inotify(self):
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            # Watch the directory - editors usually replace the file instead of rewriting it
+            directory = os.path.dirname(os.path.abspath(self.path))
+            mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+            if libc.inotify_add_watch(fd, directory.encode(), mask) < 0:
+                os.close(fd)
+                raise OSError(ctypes.get_errno(), f"cannot watch {directory}")
+            self.fd = fd
+        except Exception as e:
+            self.logger.debug(f"inotify unavailable, polling the config file: {e}")
+    
+    def _signature(self):
+        try:
+            stat = os.stat(self.path)
+            return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            return None
+    
+    def changed(self):
+        """True once for every edit of the file since the last call"""
+        if self.fd is not None:
+            try:
+                os.read(self.fd, 65536)
+            except BlockingIOError:
+                return False  # No events - nothing in the directory changed
+            except OSError:
+                pass
+        
+        signature = self._signature()
+        if signature is None or signature == self.signature:
+            return False
+        self.signature = signature
+        return True
+    
+    def mark_seen(self):
+        """Ignore our own writes"""
+        self.signature = self._signature()
+    
+    def wait(self, timeout):
+        """Block until something in the watched directory changes or timeout passes (inotify only)"""
+        select.select([self.fd], [], [], max(timeout, 0))
+    
+    def close(self):
+        if self.fd is not None:
+            try:
+                os.close(self.fd)
+            except OSError:
+                pass
+            self.fd = None
+
+class SystemdNotifier:
+    """sd_notify client - READY, WATCHDOG and STATUS messages to $NOTIFY_SOCKET"""
+    
+    MIN_WINDOW = 10  # Shortest watchdog window handed to systemd, in seconds
+    
+    def __init__(self, socket_path=None, watchdog_usec=None, logger=None):
+        self.socket_path = os.environ.get('NOTIFY_SOCKET') if socket_path is None else socket_path
+        self.logger = logger or logging.getLogger(__name__)
+        
+        # Ping at half of WatchdogSec, as systemd recommends
+        watchdog_pid = os.environ.get('WATCHDOG_PID')
+        if watchdog_usec is None and (not watchdog_pid or watchdog_pid == str(os.getpid())):
+            watchdog_usec = os.environ.get('WATCHDOG_USEC')
+        try:
+            self.watchdog_interval = int(watchdog_usec) / 1e6 / 2 if watchdog_usec else None
+        except ValueError:
+            self.watchdog_interval = None
+    
+    def enabled(self):
+        return bool(self.socket_path)
+    
+    def notify(self, *fields):
+        """Send one notification datagram; False when not running under systemd"""
+        if not self.socket_path:
+            return False
+        # "@name" is a socket in the abstract namespace
+        address = '\0' + self.socket_path[1:] if self.socket_path.startswith('@') else self.socket_path
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+                sock.sendto('\n'.join(fields).encode('utf-8'), address)
+            return True
+        except OSError as e:
+            self.logger.debug(f"sd_notify failed: {e}")
+            return False
+    
+    def ready(self, status=None):
+        return self.notify('READY=1', *([f'STATUS={status}'] if status else []))
+    
+    def status(self, text):
+        return self.notify(f'STATUS={text}')
+    
+    def stopping(self):
+        return self.notify('STOPPING=1')
+    
+    def watchdog(self, window=None):
+        """Keep-alive ping; window (seconds) replaces WatchdogSec until the next ping"""
+        if not self.watchdog_interval:
+            return False
+        fields = ['WATCHDOG=1']
+        if window:
+            fields.append(f'WATCHDOG_USEC={int(window * 1e6)}')
+        return self.notify(*fields)
+    
+    def expect_progress(self, seconds):
+        """Main-loop check-in: ping now - a loop that does not check in again within seconds is restarted"""
+        return self.watchdog(max(seconds, self.MIN_WINDOW))
+
+def port_listener_pids(port):
+    """PIDs listening on a local TCP port (Linux /proc), None where that cannot be told"""
+    inodes = set()
+    try:
+        for table in ('/proc/net/tcp', '/proc/net/tcp6'):
+            if not os.path.exists(table):
+                continue
+            with open(table, 'r') as f:
+                for line in f.readlines()[1:]:
+                    fields = line.split()
+                    # State 0A is LISTEN
+                    if fields[3] == '0A' and int(fields[1].rsplit(':', 1)[1], 16) == port:
+                        inodes.add(fields[9])
+    except (OSError, ValueError, IndexError):
+        return None
+    
+    pids = set()
+    if not inodes:
+        return pids
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            for fd in os.listdir(f'/proc/{entry}/fd'):
+                target = os.readlink(f'/proc/{entry}/fd/{fd}')
+                if target.startswith('socket:[') and target[8:-1] in inodes:
+                    pids.add(int(entry))
+                    break
+        except OSError:
+            continue
+    return pids
+
+def process_tree_rss(pid):
+    """Resident memory in bytes of a process and all of its descendants (Linux /proc)"""
+    if not pid:
+        return 0
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                # The process name may contain spaces - fields start after the last ')'
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+            children.setdefault(ppid, []).append(int(entry))
+        except (OSError, ValueError, IndexError):
+            continue
+    
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        try:
+            with open(f'/proc/{current}/status', 'r') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1]) * 1024
+                        break
+        except (OSError, ValueError):
+            continue
+    return total
+
+class BrowserLifecycle:
+    """Keeps the browser warm between boosts or hibernates it and pre-launches it before the next check"""
+    
+    POLICIES = ('auto', 'keep_alive', 'hibernate')
+    
+    def __init__(self, state_file, policy='auto', min_gap=1800, min_rss_mb=150, margin=60, clock=None, logger=None):
+        self.state_file = state_file
+        self.logger = logger or logging.getLogger(__name__)
+        self.policy = policy if policy in self.POLICIES else 'auto'
+        self.min_gap = min_gap
+        self.min_rss_mb = min_rss_mb
+        self.margin = margin
+        self.clock = clock or SystemClock()
+        self.state = {'startup_seconds': None, 'idle_rss_mb': None, 'startups': 0, 'last_decision': None}
+        self.load()
+    
+    def load(self):
+        try:
+            with open(self.state_file, 'r') as f:
+                self.state.update(json.load(f))
+        except Exception:
+            pass
+    
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self.state_file) or '.', exist_ok=True)
+            with open(self.state_file, 'w') as f:
+                json.dump(self.state, f, indent=2)
+        except Exception as e:
+            self.logger.debug(f"Failed to save browser lifecycle state: {e}")
+    
+    def _smooth(self, key, value):
+        previous = self.state.get(key)
+        self.state[key] = round(value if previous is None else 0.7 * previous + 0.3 * value, 1)
+    
+    def record_startup(self, seconds):
+        """Cold start time: Chrome launch plus authentication"""
+        self._smooth('startup_seconds', seconds)
+        self.state['startups'] = self.state.get('startups', 0) + 1
+        self.save()
+    
+    def record_idle_rss(self, rss_bytes):
+        if rss_bytes:
+            self._smooth('idle_rss_mb', rss_bytes / 1024 / 1024)
+    
+    def prelaunch_lead(self):
+        """Seconds before the next check to start the browser again"""
+        return (self.state.get('startup_seconds') or 60) * 1.5 + self.margin
+    
+    def should_hibernate(self, gap):
+        """True when shutting the browser down for this idle gap is worth a cold start"""
+        lead = self.prelaunch_lead()
+        if self.policy == 'keep_alive' or gap <= lead * 2:
+            decision = False
+        elif self.policy == 'hibernate':
+            decision = True
+        else:
+            # A 15 s start is cheap next to hours of a few hundred MB held for nothing
+            decision = (gap >= max(self.min_gap, lead * 10)
+                        and (self.state.get('idle_rss_mb') or 0) >= self.min_rss_mb)
+        self.state['last_decision'] = 'hibernate' if decision else 'keep_alive'
+        self.save()
+        return decision
+
+def host_memory_available():
+    """MemAvailable in bytes (Linux /proc/meminfo), None where it cannot be read"""
+    try:
+        with open('/proc/meminfo', 'r') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+class ConcurrencyGovernor:
+    """Admits browser starts and boost cycles in deadline order while host memory, CPU load and caps allow
+
+    max_sessions caps live browsers: work in flight plus idle keys that still hold a browser.
+    """
+    
+    def __init__(self, max_sessions=None, max_starts=2, min_free_mb=512, session_mb=400, max_load=1.5,
+                 clock=None, memory_probe=host_memory_available, load_probe=None):
+        self.clock = clock or SystemClock()
+        self.cpus = os.cpu_count() or 1
+        self.max_sessions = max_sessions or self.cpus
+        self.max_starts = max_starts
+        self.min_free_mb = min_free_mb
+        self.session_mb = session_mb  # Memory set aside for every admitted session until it shows up in MemAvailable
+        self.max_load = max_load      # 1-minute load average per CPU
+        self.memory_probe = memory_probe
+        self.load_probe = load_probe or (lambda: os.getloadavg()[0] if hasattr(os, 'getloadavg') else 0.0)
+        self.queue = []    # (deadline, sequence, key) heap - stale entries are skipped
+        self.pending = {}  # key -> (kind, queued_at)
+        self.active = {}   # key -> kind
+        self.sessions = set()  # Keys holding a live browser between their cycles
+        self.sequence = 0
+        self.delays = deque(maxlen=500)  # Recent queueing delays in seconds
+        self.blocked_by = None
+    
+    def request(self, key, kind, deadline):
+        """Queue a 'start' or 'cycle' for key unless it is already queued or running"""
+        if key in self.pending or key in self.active:
+            return
+        self.pending[key] = (kind, self.clock.time())
+        heapq.heappush(self.queue, (deadline, self.sequence, key))
+        self.sequence += 1
+    
+    def release(self, key):
+        """Running work of key has finished"""
+        self.active.pop(key, None)
+    
+    def hold(self, key):
+        """key keeps a live browser after its work finished"""
+        self.sessions.add(key)
+    
+    def cancel(self, key):
+        """Forget queued or running work of key and its browser"""
+        self.pending.pop(key, None)
+        self.active.pop(key, None)
+        self.sessions.discard(key)
+    
+    def live_sessions(self):
+        """Browsers alive or being started"""
+        return len(self.sessions | set(self.active))
+    
+    def limit(self, kind, key=None, reserved_mb=0):
+        """What keeps this work from starting now, None if nothing does"""
+        # Work of a key that already holds a browser does not add a session
+        if key not in self.sessions and self.live_sessions() >= self.max_sessions:
+            return 'sessions'
+        if kind == 'start' and sum(1 for active in self.active.values() if active == 'start') >= self.max_starts:
+            return 'starts'
+        available = self.memory_probe()
+        needed_mb = reserved_mb + (0 if key in self.sessions else self.session_mb)
+        if available is not None and available / 1024 / 1024 - needed_mb < self.min_free_mb:
+            return 'memory'
+        if self.load_probe() / self.cpus > self.max_load:
+            return 'cpu'
+        return None
+    
+    def admit(self):
+        """Take queued work in deadline order while the host has room; [(key, kind, queueing delay)]"""
+        admitted = []
+        waiting = []  # New sessions held back by max_sessions
+        new_sessions = 0
+        self.blocked_by = None
+        while self.queue:
+            deadline, _, key = self.queue[0]
+            if key not in self.pending:
+                heapq.heappop(self.queue)
+                continue
+            kind, queued_at = self.pending[key]
+            # Strict deadline order - a later item never overtakes a blocked earlier one, except that
+            # browsers already alive keep cycling while a new session waits for a slot
+            blocked_by = self.limit(kind, key, reserved_mb=new_sessions * self.session_mb)
+            if blocked_by == 'sessions':
+                self.blocked_by = blocked_by
+                waiting.append(heapq.heappop(self.queue))
+                continue
+            if blocked_by:
+                self.blocked_by = blocked_by
+                break
+            heapq.heappop(self.queue)
+            del self.pending[key]
+            if key not in self.sessions:
+                new_sessions += 1
+            self.active[key] = kind
+            delay = max(self.clock.time() - queued_at, 0.0)
+            self.delays.append(delay)
+            admitted.append((key, kind, delay))
+        for entry in waiting:
+            heapq.heappush(self.queue, entry)
+        return admitted
+    
+    def stats(self):
+        """Queue length, running work and recent queueing delays"""
+        delays = sorted(self.delays)
+        return {
+            'queued': len(self.pending),
+            'active': len(self.active),
+            'sessions': self.live_sessions(),
+            'blocked_by': self.blocked_by,
+            'queue_delay': {
+                'mean': round(sum(delays) / len(delays), 1) if delays else 0.0,
+                'p95': round(delays[min(len(delays) - 1, int(0.95 * len(delays)))], 1) if delays else 0.0,
+                'max': round(delays[-1], 1) if delays else 0.0
+            }
+        }
+    
+    def summary(self):
+        stats = self.stats()
+        delay = stats['queue_delay']
+        text = (f"{stats['sessions']} browsers, {stats['active']} running, {stats['queued']} queued, "
+                f"queue delay mean {delay['mean']}s, "
+                f"p95 {delay['p95']}s, max {delay['max']}s")
+        if stats['blocked_by']:
+            text += f" (waiting on {stats['blocked_by']})"
+        return text
+
+class ServerClock:
+    """Offset between the local clock and FunPay's clock, estimated from HTTP Date headers"""
+    
+    def __init__(self, url='https://funpay.com/', clock=None, state_file=None, sync_interval=3600,
+                 smoothing=0.3, max_rtt=5.0, logger=None):
+        self.url = url
+        self.clock = clock or SystemClock()
+        self.logger = logger or logging.getLogger(__name__)
+        self.state_file = state_file
+        self.sync_interval = sync_interval
+        self.smoothing = smoothing
+        self.max_rtt = max_rtt
+        self.offset = 0.0  # Seconds to add to local UTC to get server UTC
+        self.uncertainty = None
+        self.samples = 0
+        self.last_sync = None
+        self.load()
+    
+    def load(self):
+        """Last estimate, so short-lived runs (--once, --status) start aligned"""
+        try:
+            with open(self.state_file, 'r') as f:
+                state = json.load(f)
+            self.offset = float(state.get('offset', 0.0))
+            self.uncertainty = state.get('uncertainty')
+            self.samples = int(state.get('samples', 0))
+        except Exception:
+            pass
+    
+    def save(self):
+        if not self.state_file:
+            return
+        try:
+            with open(self.state_file, 'w') as f:
+                json.dump({
+                    'offset': round(self.offset, 3),
+                    'uncertainty': self.uncertainty,
+                    'samples': self.samples,
+                    'updated_at': self.clock.utcnow().isoformat()
+                }, f, indent=2)
+        except Exception as e:
+            self.logger.debug(f"Failed to save server clock state: {e}")
+    
+    def sample(self):
+        """One measurement: (offset, round trip) in seconds"""
+        request = urllib.request.Request(self.url, method='HEAD', headers={'User-Agent': 'Mozilla/5.0'})
+        sent = self.clock.time()
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                date = response.headers.get('Date')
+        except urllib.error.HTTPError as e:
+            # Error pages carry a Date header too
+            date = e.headers.get('Date')
+        received = self.clock.time()
+        if not date:
+            raise ValueError("response has no Date header")
+        
+        # Date is truncated to the second - the server was half a second past it on average
+        server_time = email.utils.parsedate_to_datetime(date).timestamp() + 0.5
+        return server_time - (sent + received) / 2, received - sent
+    
+    def sync(self, force=False):
+        """Refresh the estimate when it is older than sync_interval"""
+        now = self.clock.time()
+        if not self.url or (not force and self.last_sync and now - self.last_sync < self.sync_interval):
+            return False
+        self.last_sync = now
+        
+        try:
+            offset, rtt = self.sample()
+        except Exception as e:
+            self.logger.debug(f"Server clock sync failed: {e}")
+            return False
+        
+        # A slow round trip says little about when the server stamped the response
+        if rtt > self.max_rtt:
+            self.logger.debug(f"Server clock sample ignored (round trip {rtt:.1f}s)")
+            return False
+        
+        self.offset = offset if self.samples == 0 else (1 - self.smoothing) * self.offset + self.smoothing * offset
+        self.uncertainty = round(rtt / 2 + 0.5, 3)
+        self.samples += 1
+        self.save()
+        return True
+    
+    def utcnow(self):
+        """Current time on FunPay's clock"""
+        return self.clock.utcnow() + timedelta(seconds=self.offset)
+
+class BrowserContextPool:
+    """Isolated DevTools browser contexts for several accounts inside one Chrome"""
+    
+    def __init__(self, driver, logger=None):
+        self.driver = driver
+        self.logger = logger or logging.getLogger(__name__)
+        self.contexts = {}  # account_id -> {'context_id', 'handle', 'tabs'}
+    
+    def _handle_for_target(self, target_id):
+        """WebDriver window handle of a DevTools target"""
+        for handle in self.driver.window_handles:
+            if handle == target_id or handle.endswith(target_id):
+                return handle
+        return target_id
+    
+    def _create_target(self, context_id):
+        result = self.driver.execute_cdp_cmd('Target.createTarget', {
+            'url': 'about:blank',
+            'browserContextId': context_id
+        })
+        return self._handle_for_target(result['targetId'])
+    
+    def acquire(self, account_id):
+        """Get the driver switched to the account's context, creating it if needed"""
+        if account_id not in self.contexts:
+            # Each context has its own cookie jar and storage
+            context_id = self.driver.execute_cdp_cmd('Target.createBrowserContext', {})['browserContextId']
+            self.contexts[account_id] = {
+                'context_id': context_id,
+                'handle': self._create_target(context_id),
+                'tabs': []
+            }
+            self.logger.info(f"🧩 Created browser context for {account_id}")
+        self.activate(account_id)
+        return self.driver
+    
+    def activate(self, account_id):
+        """Switch the shared driver to the account's main tab"""
+        self.driver.switch_to.window(self.contexts[account_id]['handle'])
+    
+    def new_tab(self, account_id):
+        """Open another tab inside the account's context and switch to it"""
+        context = self.contexts[account_id]
+        handle = self._create_target(context['context_id'])
+        context['tabs'].append(handle)
+        self.driver.switch_to.window(handle)
+        return handle
+    
+    def release(self, account_id):
+        """Dispose the account's context - other accounts are not affected"""
+        context = self.contexts.pop(account_id, None)
+        if not context:
+            return
+        try:
+            self.driver.execute_cdp_cmd('Target.disposeBrowserContext', {'browserContextId': context['context_id']})
+            self.logger.info(f"🧩 Disposed browser context for {account_id}")
+        except Exception as e:
+            self.logger.warning(f"Failed to dispose browser context for {account_id}: {e}")
+    
+    def recycle(self, account_id):
+        """Replace the account's context with a fresh one"""
+        self.release(account_id)
+        return self.acquire(account_id)
+    
+    def release_all(self):
+        for account_id in list(self.contexts):
+            self.release(account_id)
+
 class FunPayBooster:
-    def __init__(self, config_file='/etc/funpay/config.json'):
+    BOOST_BUTTON_SELECTORS = [
+        "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'boost')]",
+        "//a[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'boost')]",
+        "//button[contains(translate(text(), 'АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ', 'абвгдеёжзийклмнопрстуфхцчшщъыьэюя'), 'поднять')]",
+        "//a[contains(translate(text(), 'АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ', 'абвгдеёжзийклмнопрстуфхцчшщъыьэюя'), 'поднять')]",
+        "//*[contains(@class, 'boost')]",
+        "//*[contains(@id, 'boost')]"
+    ]
+    
+    def __init__(self, config_file='/etc/funpay/config.json', log_settings=None,
+                 clock=None, rng=None, driver_factory=None, managed=False, logger=None):
+        # Injectable time, randomness and browser (used by the simulator)
+        self.clock = clock or SystemClock()
+        self.rng = rng or random
+        self.driver_factory = driver_factory
+        self.running = False
+        
+        # Shared Chrome with one browser context per account (multi-account mode)
+        self.browser_pool = None
+        self.account_id = None
         self.driver = None
+        self.driver_service = None
+        self.chromedriver_path = None
+        self._chromedriver_resolved = False
         self.config_file = config_file
         self.config = {}
         self.xvfb_process = None
+        self.xvfb_pid = None
         self.display_num = 111
+        # Per-process slot on a shared host - runtime only, never saved to the config
+        self.debug_port = None
+        self.chrome_profile_dir = None
+        self.chrome_process = None
+        self.chrome_pid = None
+        self.browser_reattached = False
+        self.browser_state_file = account_state_file(config_file, 'browser_session')
+        # False when other boosters share this host - never pkill their processes
+        self.exclusive_host = True
         self.consecutive_errors = 0
         self.max_errors = 3
         self.pid_file = '/tmp/funpay_boost.pid'
         
+        # Every account logs through its own logger (managed accounts through their host's)
+        self.logger = logger or logging.getLogger(
+            'funpay.' + os.path.splitext(os.path.abspath(config_file))[0].replace('.', '_')
+        )
+        
         # Rate Limiting & Error Recovery
-        self.rate_limiter = RateLimiter()
-        self.error_recovery = ErrorRecovery()
-        self.browser_stealth = BrowserStealth()
-        
-        # Circuit breaker for error recovery
-        self.circuit_breaker = CircuitBreaker(
-            failure_threshold=5,
-            recovery_timeout=1800,  # 30 minutes
-            expected_exception=Exception
+        self.rate_limiter = RateLimiter(clock=self.clock, rng=self.rng, logger=self.logger)
+        self.error_recovery = ErrorRecovery(clock=self.clock, rng=self.rng, logger=self.logger)
+        self.browser_stealth = BrowserStealth(rng=self.rng, logger=self.logger)
+        self.page_snapshot = PageSnapshot()
+        self.command_stats = CommandStats()
+        self.current_lot_url = None
+        self.cycle_deadline = None
+        # Called with a window in seconds whenever the main loop makes progress
+        self.progress_hook = None
+        # (client config, its HTTP timeout before any cycle capped it) of the current session
+        self.session_command_timeout = (None, None)
+        self.selector_stats = SelectorStats(
+            account_state_file(config_file, 'selector_stats'),
+            logger=self.logger
         )
         
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('/var/log/funpay/boost.log'),
-                logging.StreamHandler()
-            ]
+        # Circuit breakers per dependency (navigation, login, browser_startup, telegram)
+        self.circuit_breakers = CircuitBreakerRegistry(
+            clock=self.clock,
+            state_file=account_state_file(config_file, 'circuit_breakers'),
+            logger=self.logger
         )
-        self.logger = logging.getLogger(__name__)
+        
+        # Setup logging - file I/O happens on a listener thread
+        self.log_pipelines = []  # (logger name, listener) of the pipelines this booster started
+        self.log_settings = self.load_log_settings(log_settings)
+        # Accounts managed by a MultiAccountDaemon log through its pipeline and leave signals to it
+        self.managed = managed
+        if not managed:
+            self.setup_logging()
         
         # Initialize telegram notifier
         if TELEGRAM_AVAILABLE:
-            self.telegram = TelegramNotifier()
+            self.telegram = TelegramNotifier(logger=self.logger)
         else:
             self.telegram = None
         
-        # Load or create configuration
-        self.load_or_create_config()
+        # Load or create configuration
+        self.config_watcher = None
+        self.load_or_create_config()
+        self.config_watcher = ConfigWatcher(config_file, logger=self.logger)
+        self.next_check_at = None
+        self.systemd = SystemdNotifier(logger=self.logger)
+        self.schedule_file = account_state_file(config_file, 'schedule')
+        self.cycle_journal = CycleJournal(
+            self.config.get('cycle_journal')
+            or os.path.splitext(self.log_settings['boost_log']['path'])[0] + '.cycles.jsonl',
+            logger=self.logger
+        )
+        # Cooldowns end on FunPay's clock - every deadline is kept in server time
+        self.server_clock = ServerClock(
+            url=self.config.get('server_clock_url', 'https://funpay.com/'),
+            clock=self.clock,
+            state_file=account_state_file(config_file, 'server_clock'),
+            sync_interval=self.config.get('clock_sync_interval', 3600),
+            logger=self.logger
+        )
+        self.lifecycle = BrowserLifecycle(
+            account_state_file(config_file, 'browser_lifecycle'),
+            policy=self.config.get('browser_policy', 'auto'),
+            min_gap=self.config.get('hibernate_min_gap', 1800),
+            min_rss_mb=self.config.get('hibernate_min_rss_mb', 150),
+            clock=self.clock,
+            logger=self.logger
+        )
+        
+        # Out-of-band cookie delivery when nobody can answer a prompt
+        self.interactive = bool(sys.stdin and sys.stdin.isatty())
+        self.awaiting_credentials = False
+        self.delivered_cookies = None  # Arrived while no browser was running
+        self.cookie_inbox = CookieInbox(
+            account_state_file(config_file, 'cookies_drop'),
+            self.config.get('cookie_socket') or os.path.splitext(account_state_file(config_file, 'cookies'))[0] + '.sock',
+            logger=self.logger
+        )
+        
+        self.circuit_breakers.settings = self.config.get('circuit_breakers', {})
+        
+        # Retry policies can be tuned per failure category in the config
+        if self.config.get('error_policies'):
+            self.error_recovery = ErrorRecovery(clock=self.clock, rng=self.rng, policies=self.config['error_policies'],
+                                                logger=self.logger)
         
         # Setup signal handlers
-        signal.signal(signal.SIGINT, self.signal_handler)
-        signal.signal(signal.SIGTERM, self.signal_handler)
+        if not managed:
+            signal.signal(signal.SIGINT, self.signal_handler)
+            signal.signal(signal.SIGTERM, self.signal_handler)
+            signal.signal(signal.SIGUSR1, self.signal_handler)
     
     def signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully"""
         self.logger.info(f"Received signal {signum}, shutting down gracefully...")
-        self.cleanup()
+        # SIGUSR1 is a handoff: leave the browser running for the next daemon
+        self.cleanup(preserve_browser=(signum == signal.SIGUSR1))
         sys.exit(0)
     
+    def load_log_settings(self, overrides=None):
+        """Merge default log settings with the config file and constructor overrides"""
+        settings = json.loads(json.dumps(DEFAULT_LOG_SETTINGS))
+        
+        sources = []
+        try:
+            if os.path.exists(self.config_file):
+                with open(self.config_file, 'r') as f:
+                    sources.append(json.load(f).get('logging') or {})
+        except Exception:
+            pass
+        sources.append(overrides or {})
+        
+        for source in sources:
+            for key, value in source.items():
+                if isinstance(value, dict) and isinstance(settings.get(key), dict):
+                    settings[key].update(value)
+                else:
+                    settings[key] = value
+        return settings
+    
+    def _start_log_pipeline(self, logger, handlers):
+        """Attach a non-blocking queue handler to logger and start its listener thread"""
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        # A pipeline left on this logger (e.g. by an earlier booster of the account) is replaced
+        stop_log_pipeline(logger.name)
+        
+        log_queue = queue.Queue(maxsize=self.log_settings.get('queue_size', 10000))
+        queue_handler = DroppingQueueHandler(log_queue)
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        
+        logger.addHandler(queue_handler)
+        logger.propagate = False
+        LOG_PIPELINES[logger.name] = (logger, queue_handler, listener)
+        self.log_pipelines.append((logger.name, listener))
+    
+    def setup_logging(self, detached=False):
+        """Setup queue based logging with rotated, compressed log files"""
+        self.stop_logging()
+        
+        self.logger.setLevel(getattr(logging, str(self.log_settings.get('level', 'INFO')).upper(), logging.INFO))
+        
+        handlers = [create_rotating_handler(self.log_settings['boost_log'])]
+        if self.log_settings.get('console', True) and not detached:
+            handlers.append(logging.StreamHandler())
+        self._start_log_pipeline(self.logger, handlers)
+        
+        # Detached daemons send stray stdout/stderr output to the background log
+        if detached:
+            background_logger = logging.getLogger(f"{self.logger.name}.background")
+            background_logger.propagate = False
+            background_logger.setLevel(logging.INFO)
+            self._start_log_pipeline(
+                background_logger, [create_rotating_handler(self.log_settings['background_log'])]
+            )
+            sys.stdout = LogStream(background_logger, logging.INFO)
+            sys.stderr = LogStream(background_logger, logging.ERROR)
+    
+    def stop_logging(self):
+        """Flush queued records and stop this booster's listener threads"""
+        for name, listener in self.log_pipelines:
+            stop_log_pipeline(name, listener)
+        self.log_pipelines = []
+    
     def load_or_create_config(self):
         """Load existing config or create new one"""
         try:
@@ -373,6 +2043,8 @@ class FunPayBooster:
             os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
             with open(self.config_file, 'w') as f:
                 json.dump(self.config, f, indent=2)
+            if self.config_watcher:
+                self.config_watcher.mark_seen()
             return True
         except Exception as e:
             self.logger.error(f"Failed to save config: {e}")
@@ -389,9 +2061,13 @@ class FunPayBooster:
         import getpass
         password = getpass.getpass("🔒 Enter your FunPay password: ").strip()
         
-        target_url = input("🔗 Enter your boost offers URL: ").strip()
-        if not target_url.startswith('http'):
-            target_url = f"https://funpay.com/en/lots/{target_url}/trade"
+        target_urls = []
+        raw_urls = input("🔗 Enter your boost offers URL(s), comma separated: ").strip()
+        for target_url in [url.strip() for url in raw_urls.split(',') if url.strip()]:
+            if not target_url.startswith('http'):
+                target_url = f"https://funpay.com/en/lots/{target_url}/trade"
+            target_urls.append(target_url)
+        target_url = target_urls[0] if target_urls else ''
         
         try:
             interval = int(input("⏰ Enter boost interval in hours (default 3): ") or "3")
@@ -402,6 +2078,8 @@ class FunPayBooster:
             'username': username,
             'password': password,
             'target_url': target_url,
+            'target_urls': target_urls,
+            'lots': {},
             'boost_interval': interval,
             'cookies': None,
             'last_boost': None,
@@ -459,10 +2137,12 @@ class FunPayBooster:
     def setup_display(self):
         """Setup virtual display with enhanced error handling"""
         try:
-            # Kill existing processes
-            self.kill_processes('Xvfb')
-            self.kill_processes('chrome')
-            self.kill_processes('chromedriver')
+            # Kill existing processes (keep our own ChromeDriver service alive)
+            if self.exclusive_host:
+                self.kill_processes('Xvfb')
+            if self.exclusive_host and not (self.driver_service and self.driver_service.is_alive()):
+                self.kill_processes('chrome')
+                self.kill_processes('chromedriver')
             
             # Remove lock files
             subprocess.run(['rm', '-f', f'/tmp/.X{self.display_num}-lock'], capture_output=True)
@@ -488,10 +2168,283 @@ class FunPayBooster:
             self.logger.error(f"Failed to setup display: {e}")
             return False
     
+    def resolve_chromedriver_path(self):
+        """Find ChromeDriver binary once and cache the result"""
+        if self._chromedriver_resolved:
+            return self.chromedriver_path
+        
+        # Try multiple ChromeDriver paths
+        chromedriver_paths = [
+            '/usr/local/bin/chromedriver',
+            '/usr/bin/chromedriver',
+            'chromedriver'
+        ]
+        
+        for path in chromedriver_paths:
+            resolved = path if os.path.exists(path) else shutil.which(path)
+            if resolved:
+                self.chromedriver_path = resolved
+                self.logger.info(f"Using ChromeDriver at: {resolved}")
+                break
+        else:
+            # Let Selenium Manager locate a driver on first session start
+            self.logger.warning("ChromeDriver not found in expected locations, falling back to Selenium Manager")
+        
+        self._chromedriver_resolved = True
+        return self.chromedriver_path
+    
+    def get_driver_service(self):
+        """Get the long-lived ChromeDriver service, creating it on first use"""
+        # PersistentChromeService.start() respawns the process if it died
+        if self.driver_service is not None:
+            return self.driver_service
+        
+        # Enhanced service configuration for ChromeDriver
+        service_args = [
+            '--log-level=3',  # Reduced logging
+            '--silent'
+        ]
+        
+        self.driver_service = PersistentChromeService(
+            executable_path=self.resolve_chromedriver_path(),
+            service_args=service_args
+        )
+        return self.driver_service
+    
+    def display_is_running(self):
+        """Check if our virtual display is still alive"""
+        if self.xvfb_process is not None:
+            return self.xvfb_process.poll() is None
+        return self.pid_is_alive(self.xvfb_pid)
+    
+    def pid_is_alive(self, pid):
+        """Check if a process with the given PID exists"""
+        if not pid:
+            return False
+        try:
+            os.kill(pid, 0)
+            return True
+        except (ProcessLookupError, PermissionError):
+            return False
+        except Exception:
+            return False
+    
+    def get_debug_port(self):
+        """Remote debugging port for the persistent Chrome instance"""
+        return int(self.config.get('debug_port') or self.debug_port or 9222)
+    
+    def get_chrome_profile_dir(self):
+        """Profile directory of the persistent Chrome instance"""
+        return self.config.get('chrome_profile_dir') or self.chrome_profile_dir or '/tmp/funpay_chrome_profile'
+    
+    def use_host_slot(self, index):
+        """Own display, debugging port and profile for account number index on a shared host"""
+        stem = os.path.splitext(os.path.basename(self.config_file))[0]
+        self.exclusive_host = False
+        self.display_num = 111 + index
+        self.debug_port = 9222 + index
+        self.chrome_profile_dir = f"/tmp/funpay_chrome_profile_{stem}"
+    
+    def debugger_is_reachable(self, debugger_address, timeout=2):
+        """Check if Chrome's remote debugging endpoint answers"""
+        try:
+            with urllib.request.urlopen(f"http://{debugger_address}/json/version", timeout=timeout) as response:
+                return response.status == 200
+        except Exception:
+            return False
+    
+    def load_browser_state(self):
+        """Load persisted browser session metadata"""
+        try:
+            if os.path.exists(self.browser_state_file):
+                with open(self.browser_state_file, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            self.logger.debug(f"Failed to load browser state: {e}")
+        return {}
+    
+    def save_browser_state(self, **updates):
+        """Persist browser address and session metadata for reattaching"""
+        try:
+            state = self.load_browser_state()
+            state.update({
+                'debugger_address': f"127.0.0.1:{self.get_debug_port()}",
+                'chrome_pid': self.chrome_pid,
+                'xvfb_pid': self.xvfb_process.pid if self.xvfb_process else self.xvfb_pid,
+                'display': f":{self.display_num}",
+                'username': self.config.get('username'),
+                'daemon_pid': os.getpid(),
+                'updated_at': self.clock.utcnow().isoformat()
+            })
+            state.update(updates)
+            os.makedirs(os.path.dirname(self.browser_state_file) or '.', exist_ok=True)
+            with open(self.browser_state_file, 'w') as f:
+                json.dump(state, f, indent=2)
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to save browser state: {e}")
+            return False
+    
+    def clear_browser_state(self):
+        """Forget persisted browser session"""
+        try:
+            if os.path.exists(self.browser_state_file):
+                os.remove(self.browser_state_file)
+        except Exception as e:
+            self.logger.debug(f"Failed to remove browser state: {e}")
+    
+    def find_chrome_binary(self):
+        """Find a Chrome/Chromium binary we can launch ourselves"""
+        for name in ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser']:
+            path = shutil.which(name)
+            if path:
+                return path
+        return None
+    
+    def launch_chrome_process(self):
+        """Launch Chrome with a remote debugging endpoint that outlives the daemon"""
+        chrome_binary = self.find_chrome_binary()
+        if not chrome_binary:
+            return None
+        
+        port = self.get_debug_port()
+        debugger_address = f"127.0.0.1:{port}"
+        user_data_dir = self.get_chrome_profile_dir()
+        
+        # A retry replaces the Chrome of the failed attempt instead of orphaning it
+        self.stop_chrome_process()
+        if self.debugger_is_reachable(debugger_address, timeout=1):
+            self.logger.error(f"Port {port} is already served by another browser (PIDs: {port_listener_pids(port)})")
+            return None
+        
+        self.logger.info(f"Launching Chrome with remote debugging on {debugger_address}...")
+        self.chrome_process = subprocess.Popen(
+            [
+                chrome_binary,
+                '--headless',
+                '--no-sandbox',
+                '--disable-dev-shm-usage',
+                '--disable-gpu',
+                f'--remote-debugging-port={port}',
+                f'--user-data-dir={user_data_dir}',
+                'about:blank'
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True  # Survive daemon restarts
+        )
+        self.chrome_pid = self.chrome_process.pid
+        
+        # Wait for the debugging endpoint to come up
+        for _ in range(30):
+            if self.debugger_is_reachable(debugger_address, timeout=1):
+                # Only attach to the endpoint of the Chrome we just started
+                owners = port_listener_pids(port)
+                if owners is not None and self.chrome_pid not in owners:
+                    self.logger.error(f"Port {port} is served by PIDs {owners}, not by our Chrome ({self.chrome_pid})")
+                    break
+                self.save_browser_state(started_at=self.clock.utcnow().isoformat(), authenticated_at=None)
+                return debugger_address
+            if self.chrome_process.poll() is not None:
+                self.logger.error(f"Chrome exited before its debugging endpoint came up "
+                                  f"(exit code {self.chrome_process.returncode})")
+                break
+            self.clock.sleep(0.5)
+        else:
+            self.logger.error("Chrome remote debugging endpoint did not come up")
+        
+        self.stop_chrome_process()
+        return None
+    
+    def stop_chrome_process(self):
+        """Terminate the standalone Chrome this booster launched and wait for it"""
+        if not self.chrome_process:
+            return
+        try:
+            self.chrome_process.terminate()
+            self.chrome_process.wait(timeout=5)
+        except Exception:
+            try:
+                self.chrome_process.kill()
+                self.chrome_process.wait(timeout=5)
+            except Exception:
+                pass
+        self.chrome_process = None
+        self.chrome_pid = None
+    
+    def attach_driver(self, debugger_address):
+        """Open a WebDriver session attached to an already running Chrome"""
+        options = RaiseResponseWatcher.enable(Options())
+        options.debugger_address = debugger_address
+        driver = webdriver.Chrome(service=self.get_driver_service(), options=options)
+        driver.set_page_load_timeout(60)
+        driver.implicitly_wait(10)
+        return driver
+    
+    def try_reattach_browser(self):
+        """Reattach to a Chrome left running by a previous daemon"""
+        state = self.load_browser_state()
+        debugger_address = state.get('debugger_address')
+        
+        if not debugger_address or not self.pid_is_alive(state.get('chrome_pid')):
+            return False
+        
+        # Never steal the browser of a daemon that is still running
+        owner_pid = state.get('daemon_pid')
+        if owner_pid and owner_pid != os.getpid() and self.pid_is_alive(owner_pid):
+            return False
+        
+        if state.get('username') != self.config.get('username'):
+            self.logger.info("Persisted browser belongs to another account, not reattaching")
+            return False
+        
+        if not self.debugger_is_reachable(debugger_address):
+            return False
+        
+        try:
+            self.driver = self.attach_driver(debugger_address)
+        except Exception as e:
+            self.logger.warning(f"Failed to reattach to running Chrome: {e}")
+            return False
+        
+        self.chrome_pid = state.get('chrome_pid')
+        if self.pid_is_alive(state.get('xvfb_pid')):
+            self.xvfb_pid = state.get('xvfb_pid')
+            os.environ['DISPLAY'] = state.get('display', f":{self.display_num}")
+        
+        self.browser_reattached = True
+        self.save_browser_state()
+        self.logger.info(f"♻️ Reattached to running Chrome at {debugger_address}")
+        return True
+    
+    def browser_session_is_authenticated(self):
+        """Check if a reattached browser still holds a valid login"""
+        if not self.browser_reattached or not self.load_browser_state().get('authenticated_at'):
+            return False
+        return self.test_access()
+    
     def setup_chrome(self):
         """Setup Chrome with enhanced Selenium 4.x compatibility"""
         try:
-            if not self.setup_display():
+            # Shared Chrome - just (re)create this account's browser context
+            if self.browser_pool:
+                self.driver = self.browser_pool.acquire(self.account_id)
+                self.page_snapshot.invalidate()
+                self.remember_command_timeout()
+                return True
+            
+            # Injected browser (simulator) - no display, driver service or stealth setup
+            if self.driver_factory:
+                self.driver = self.driver_factory()
+                return True
+            
+            # Reuse a browser handed over by a previous daemon if there is one
+            if self.try_reattach_browser():
+                self.remember_command_timeout()
+                return True
+            
+            # Display and ChromeDriver are shared across browser sessions
+            if not self.display_is_running() and not self.setup_display():
                 return False
             
             # Chrome options with enhanced compatibility
@@ -506,47 +2459,29 @@ class FunPayBooster:
             chrome_options.add_argument("--disable-dev-shm-usage")
             chrome_options.add_argument("--disable-gpu")
             
-            # Enhanced service configuration for ChromeDriver
-            service_args = [
-                '--log-level=3',  # Reduced logging
-                '--silent'
-            ]
-            
-            # Try multiple ChromeDriver paths
-            chromedriver_paths = [
-                '/usr/local/bin/chromedriver',
-                '/usr/bin/chromedriver',
-                'chromedriver'
-            ]
-            
-            service = None
-            for path in chromedriver_paths:
-                try:
-                    if os.path.exists(path) or path == 'chromedriver':
-                        service = Service(executable_path=path, service_args=service_args)
-                        self.logger.info(f"Using ChromeDriver at: {path}")
-                        break
-                except Exception as e:
-                    self.logger.debug(f"Failed to create service with {path}: {e}")
-                    continue
-            
-            if not service:
-                self.logger.error("ChromeDriver not found in any expected location")
-                return False
+            service = self.get_driver_service()
             
             # Simple Chrome startup
             def _start_chrome():
                 try:
                     self.logger.info("Starting Chrome with simple settings...")
                     
+                    # Prefer a standalone Chrome that can be reattached after a restart
+                    debugger_address = self.launch_chrome_process()
+                    if debugger_address:
+                        driver = self.attach_driver(debugger_address)
+                        self.logger.info("Chrome driver attached successfully")
+                        return driver
+                    
                     # Create driver with minimal configuration
-                    options = Options()
+                    options = RaiseResponseWatcher.enable(Options())
                     options.add_argument('--headless')
                     options.add_argument('--no-sandbox')
                     options.add_argument('--disable-dev-shm-usage')
                     options.add_argument('--disable-gpu')
                     
-                    driver = webdriver.Chrome(options=options)
+                    # Open a new session against the shared ChromeDriver process
+                    driver = webdriver.Chrome(service=service, options=options)
                     
                     # Set basic timeouts
                     driver.set_page_load_timeout(60)
@@ -555,18 +2490,25 @@ class FunPayBooster:
                     self.logger.info("Chrome driver created successfully")
                     return driver
                     
+                except SessionNotCreatedException as e:
+                    # Only a ChromeDriver/Chrome version mismatch will not fix itself
+                    if 'only supports chrome version' in str(e).lower():
+                        raise FatalError(f"ChromeDriver does not match the installed Chrome: {e}") from e
+                    self.logger.error(f"Chrome session could not be created: {e}")
+                    raise e
                 except Exception as e:
                     self.logger.error(f"Chrome startup failed: {e}")
                     raise e
             
             # Use error recovery with increased retries
-            self.driver = self.error_recovery.execute_with_retry(
-                _start_chrome, "chrome_startup"
-            )
-            
-            if not self.driver:
-                self.logger.error("Failed to start Chrome after all retries")
+            try:
+                self.driver = self.error_recovery.execute_with_retry(
+                    _start_chrome, "chrome_startup"
+                )
+            except Exception as e:
+                self.logger.error(f"Failed to start Chrome after all retries ({classify_error(e)}): {e}")
                 return False
+            self.remember_command_timeout()
             
             # Apply stealth scripts after successful startup
             try:
@@ -579,9 +2521,9 @@ class FunPayBooster:
             try:
                 self.logger.info("Verifying Chrome functionality...")
                 test_html = "data:text/html,<html><body><h1>Chrome Compatibility Test</h1><p>Selenium 4.x + Chrome</p></body></html>"
-                self.driver.get(test_html)
+                self.navigate(test_html)
                 
-                if "Chrome Compatibility Test" in self.driver.page_source:
+                if "Chrome Compatibility Test" in self.page_snapshot.source(self.driver):
                     self.logger.info("✅ Chrome verification successful")
                 else:
                     self.logger.warning("⚠️ Chrome verification unclear")
@@ -599,6 +2541,16 @@ class FunPayBooster:
             self.logger.error(f"Failed to setup Chrome: {e}")
             return False
     
+    def navigate(self, url):
+        """Load a URL and invalidate the page snapshot"""
+        self.page_snapshot.invalidate()
+        self.driver.get(url)
+    
+    def click_element(self, element):
+        """Click an element with human-like movement and invalidate the page snapshot"""
+        self.browser_stealth.simulate_human_behavior(self.driver, element)
+        self.page_snapshot.invalidate()
+    
     def try_login_with_credentials(self):
         """Try to login with username/password using enhanced stealth"""
         try:
@@ -609,21 +2561,22 @@ class FunPayBooster:
             
             # Navigate to login page with human-like behavior
             def _navigate_to_login():
-                self.driver.get("https://funpay.com/en/account/login")
+                self.navigate("https://funpay.com/en/account/login")
                 self.rate_limiter.add_human_delay(2.0, 4.0)
                 return True
             
-            if not self.error_recovery.execute_with_retry(_navigate_to_login, "navigate_login"):
+            if not self.circuit_breakers.call(
+                'login', self.error_recovery.execute_with_retry, _navigate_to_login, "navigate_login"
+            ):
                 return False
             
             # Check for CAPTCHA
-            page_source = self.driver.page_source.lower()
+            page_source = self.page_snapshot.lower(self.driver)
             if "captcha" in page_source or "recaptcha" in page_source:
-                self.logger.warning("CAPTCHA detected on login page")
-                return False
+                raise AuthError("CAPTCHA detected on login page")
             
             # Fill login form with human-like behavior
-            wait = WebDriverWait(self.driver, random.randint(10, 15))
+            wait = WebDriverWait(self.driver, self.rng.randint(10, 15))
             
             # Find and fill username with human simulation
             username_field = wait.until(EC.presence_of_element_located((By.NAME, "login")))
@@ -634,7 +2587,7 @@ class FunPayBooster:
             # Type username character by character with random delays
             for char in self.config['username']:
                 username_field.send_keys(char)
-                time.sleep(random.uniform(0.05, 0.15))
+                self.clock.sleep(self.rng.uniform(0.05, 0.15))
             
             self.rate_limiter.add_human_delay(1.0, 2.0)
             
@@ -647,17 +2600,17 @@ class FunPayBooster:
             # Type password with random delays
             for char in self.config['password']:
                 password_field.send_keys(char)
-                time.sleep(random.uniform(0.05, 0.15))
+                self.clock.sleep(self.rng.uniform(0.05, 0.15))
             
             self.rate_limiter.add_human_delay(1.0, 3.0)
             
             # Submit form with human-like behavior
             login_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
-            self.browser_stealth.simulate_human_behavior(self.driver, login_button)
+            self.click_element(login_button)
             
             # Wait for response with random delay
-            response_delay = random.uniform(3.0, 7.0)
-            time.sleep(response_delay)
+            response_delay = self.rng.uniform(3.0, 7.0)
+            self.clock.sleep(response_delay)
             
             # Check login success
             if "login" not in self.driver.current_url.lower():
@@ -665,13 +2618,14 @@ class FunPayBooster:
                 self.rate_limiter.reset_adaptive_factor()
                 return True
             else:
-                page_source = self.driver.page_source.lower()
+                page_source = self.page_snapshot.lower(self.driver)
                 if "captcha" in page_source:
-                    self.logger.warning("CAPTCHA appeared after login attempt")
-                else:
-                    self.logger.warning("Login failed - credentials may be incorrect")
-                return False
+                    raise AuthError("CAPTCHA appeared after login attempt")
+                raise AuthError("Login failed - credentials may be incorrect")
                 
+        except AuthError as e:
+            self.logger.warning(str(e))
+            return False
         except Exception as e:
             self.logger.error(f"Login with credentials failed: {e}")
             return False
@@ -682,12 +2636,12 @@ class FunPayBooster:
             self.logger.info("Adding cookies to session...")
             
             # Visit domain first
-            self.driver.get("https://funpay.com")
-            time.sleep(2)
+            self.navigate("https://funpay.com")
+            self.clock.sleep(2)
             
             # Clear existing cookies
             self.driver.delete_all_cookies()
-            time.sleep(1)
+            self.clock.sleep(1)
             
             # Add our cookies
             for cookie in cookies:
@@ -698,8 +2652,9 @@ class FunPayBooster:
                     self.logger.warning(f"❌ Failed to add cookie {cookie['name']}: {e}")
             
             # Refresh to apply cookies
+            self.page_snapshot.invalidate()
             self.driver.refresh()
-            time.sleep(3)
+            self.clock.sleep(3)
             
             return True
             
@@ -707,23 +2662,43 @@ class FunPayBooster:
             self.logger.error(f"Failed to add cookies: {e}")
             return False
     
+    def session_cookies(self):
+        """FunPay cookies of the current browser session"""
+        try:
+            if self.browser_pool:
+                self.browser_pool.activate(self.account_id)
+            return [cookie for cookie in self.driver.get_cookies() if 'funpay' in (cookie.get('domain') or '')]
+        except Exception as e:
+            self.logger.debug(f"Failed to read session cookies: {e}")
+            return []
+    
+    def restore_session(self, cookies):
+        """Reinstall saved session cookies - True if they are still logged in"""
+        if not cookies or not self.add_cookies(cookies) or not self.test_access():
+            return False
+        self.logger.info("✅ Session restored from saved cookies")
+        self.save_browser_state(authenticated_at=self.clock.utcnow().isoformat())
+        return True
+    
     def test_access(self):
         """Test access to boost page"""
         try:
             self.logger.info("Testing access to boost page...")
             
-            self.driver.get(self.config['target_url'])
-            time.sleep(5)
+            self.navigate(self.config['target_url'])
+            self.clock.sleep(5)
             
             current_url = self.driver.current_url
             
             if "login" in current_url.lower():
-                self.logger.warning("Redirected to login page - authentication failed")
-                return False
+                raise AuthError("Redirected to login page - authentication failed")
             
             self.logger.info("✅ Successfully accessed boost page!")
             return True
             
+        except AuthError as e:
+            self.logger.warning(str(e))
+            return False
         except Exception as e:
             self.logger.error(f"Failed to test access: {e}")
             return False
@@ -732,10 +2707,16 @@ class FunPayBooster:
         """Setup authentication - try credentials first, then cookies"""
         self.logger.info("Setting up authentication...")
         
+        # A reattached browser may still be logged in
+        if self.browser_session_is_authenticated():
+            self.logger.info("✅ Reattached browser session is still authenticated!")
+            return True
+        
         # First try with credentials
         if self.try_login_with_credentials():
             if self.test_access():
                 self.logger.info("✅ Authentication successful with credentials!")
+                self.save_browser_state(authenticated_at=self.clock.utcnow().isoformat())
                 return True
         
         # If credentials failed, try existing cookies
@@ -744,68 +2725,228 @@ class FunPayBooster:
             if self.add_cookies(self.config['cookies']):
                 if self.test_access():
                     self.logger.info("✅ Authentication successful with existing cookies!")
+                    self.save_browser_state(authenticated_at=self.clock.utcnow().isoformat())
                     return True
         
         # If both failed, request new cookies
         self.logger.info("Authentication failed, requesting new cookies...")
-        cookies = self.get_cookies_from_user()
+        cookies = self.request_new_cookies()
         
-        if self.add_cookies(cookies):
+        if cookies and self.add_cookies(cookies):
             if self.test_access():
                 self.logger.info("✅ Authentication successful with new cookies!")
+                self.save_browser_state(authenticated_at=self.clock.utcnow().isoformat())
                 return True
         
         self.logger.error("❌ All authentication methods failed!")
         return False
     
+    def get_target_urls(self):
+        """All lot URLs boosted by this account"""
+        target_urls = self.config.get('target_urls') or []
+        if not target_urls and self.config.get('target_url'):
+            target_urls = [self.config['target_url']]
+        return target_urls
+    
+    def record_lot_boost(self, target_url, last_boost_utc, next_boost_utc):
+        """Track the cooldown of a single lot"""
+        if not target_url:
+            return
+        self.config.setdefault('lots', {})[target_url] = {
+            'last_boost': last_boost_utc.isoformat(),
+            'next_boost': next_boost_utc.isoformat()
+        }
+    
+    def server_now(self):
+        """Current UTC time on FunPay's clock"""
+        return self.server_clock.utcnow()
+    
+    def sync_server_clock(self):
+        """Refresh the server clock offset and share it with the Telegram notifier"""
+        previous = self.server_clock.offset
+        if self.server_clock.sync():
+            if abs(self.server_clock.offset - previous) >= 1 or self.server_clock.samples == 1:
+                self.logger.info(
+                    f"🕰️ Server clock offset {self.server_clock.offset:+.1f}s "
+                    f"(±{self.server_clock.uncertainty:.1f}s)"
+                )
+        if self.telegram:
+            self.telegram.clock_offset = self.server_clock.offset
+    
+    def get_due_lots(self):
+        """Lots whose cooldown has ended"""
+        utc_now = self.server_now()
+        due = []
+        for target_url in self.get_target_urls():
+            next_boost = self.config.get('lots', {}).get(target_url, {}).get('next_boost')
+            try:
+                if next_boost and datetime.fromisoformat(next_boost) > utc_now:
+                    continue
+            except ValueError:
+                pass
+            due.append(target_url)
+        return due
+    
+    def preload_lot_tabs(self, target_urls):
+        """Start loading every lot in its own tab so the page loads overlap"""
+        tabs = {}
+        for target_url in target_urls:
+            if self.browser_pool:
+                self.browser_pool.new_tab(self.account_id)
+            else:
+                self.driver.switch_to.new_window('tab')
+            # Non-blocking navigation - the next tab starts loading right away
+            self.driver.execute_script("window.location.href = arguments[0];", target_url)
+            tabs[target_url] = self.driver.current_window_handle
+        return tabs
+    
+    def wait_for_page_load(self, timeout=60):
+        """Wait until the current tab has finished loading"""
+        WebDriverWait(self.driver, timeout).until(
+            lambda driver: driver.execute_script("return document.readyState") == "complete"
+        )
+    
+    def check_all_lots(self):
+        """Boost every due lot in one authenticated session"""
+        due_lots = self.get_due_lots()
+        if not due_lots:
+            self.logger.info("⏳ No lot is due yet")
+            return "wait"
+        
+        self.logger.info(f"📦 {len(due_lots)}/{len(self.get_target_urls())} lots due for boost")
+        main_tab = self.driver.current_window_handle
+        results = {}
+        tabs = {}
+        
+        try:
+            self.enter_phase('navigate')
+            tabs = self.preload_lot_tabs(due_lots)
+            for target_url in due_lots:
+                self.driver.switch_to.window(tabs[target_url])
+                self.page_snapshot.invalidate()
+                self.report_progress(90)
+                try:
+                    self.wait_for_page_load()
+                except TimeoutException:
+                    self.logger.warning(f"Lot page load timed out: {target_url}")
+                results[target_url] = self._check_boost_status(target_url, preloaded=True)
+                self.logger.info(f"📦 {target_url}: {results[target_url]}")
+                
+                # Session expired - no point in checking the other lots
+                if results[target_url] == "auth_failed":
+                    break
+        finally:
+            # Close our lot tabs (never other accounts' tabs) and return to the main tab
+            try:
+                for handle in tabs.values():
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                if self.browser_pool:
+                    self.browser_pool.contexts[self.account_id]['tabs'] = []
+                self.driver.switch_to.window(main_tab)
+            except Exception as e:
+                self.logger.warning(f"Failed to close lot tabs: {e}")
+            self.page_snapshot.invalidate()
+        
+        # Most important result decides what the daemon does next
+        for result in ["fatal", "auth_failed", "success", "circuit_open", "error", "no_button", "wait"]:
+            if result in results.values():
+                return result
+        return "error"
+    
+    def get_page_language(self, target_url=None):
+        """Page language from a lot URL (e.g. /en/ or /ru/)"""
+        match = re.search(r'funpay\.com/([a-z]{2})/', target_url or self.config.get('target_url') or '')
+        return match.group(1) if match else 'ru'
+    
+    def boost_expected(self, target_url):
+        """True when the site's own cooldown for this lot is known to have ended"""
+        next_boost = self.config.get('lots', {}).get(target_url, {}).get('next_boost')
+        try:
+            return bool(next_boost) and datetime.fromisoformat(next_boost) <= self.server_now()
+        except ValueError:
+            return False
+    
     def find_boost_button(self):
         """Find boost button with multiple methods"""
-        selectors = [
-            "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'boost')]",
-            "//a[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'boost')]",
-            "//button[contains(translate(text(), 'АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ', 'абвгдеёжзийклмнопрстуфхцчшщъыьэюя'), 'поднять')]",
-            "//a[contains(translate(text(), 'АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ', 'абвгдеёжзийклмнопрстуфхцчшщъыьэюя'), 'поднять')]",
-            "//*[contains(@class, 'boost')]",
-            "//*[contains(@id, 'boost')]"
-        ]
+        stats_key = f"{self.config.get('username', '')}|{self.get_page_language(self.current_lot_url)}"
+        tried = []
         
-        for selector in selectors:
+        # Try the selector that matched before first
+        for selector in self.selector_stats.ordered(stats_key, self.BOOST_BUTTON_SELECTORS):
+            tried.append(selector)
             try:
                 elements = self.driver.find_elements(By.XPATH, selector)
                 for element in elements:
                     if element.is_displayed() and element.is_enabled():
+                        self.selector_stats.record(stats_key, tried, selector)
                         return element
             except:
                 continue
         
+        # A lot still on cooldown has no button - only a lot known to be due counts as a miss
+        if not self.boost_expected(self.current_lot_url):
+            return None
+        self.selector_stats.record(stats_key, tried)
+        
+        # Selectors that used to match stopped working - the page layout may have changed
+        hit_rate = self.selector_stats.hit_rate(stats_key)
+        if hit_rate is not None and hit_rate < 0.5 and len(self.selector_stats.data[stats_key]['recent']) >= 10:
+            self.logger.warning(f"⚠️ Boost button hit rate dropped to {hit_rate:.0%} - site layout may have changed")
+        
         return None
     
+    def apply_raise_outcome(self, result, wait_minutes):
+        """Record the outcome of the raise request and notify - returns the boost result"""
+        utc_now = self.server_now()
+        iran_tz = pytz.timezone('Asia/Tehran')
+        
+        if result == "wait":
+            # Rejected: the lot is still on cooldown for exactly this long
+            next_boost_time_utc = utc_now + timedelta(minutes=wait_minutes)
+            last_boost = self.config.get('lots', {}).get(self.current_lot_url, {}).get('last_boost')
+            self.record_lot_boost(self.current_lot_url, datetime.fromisoformat(last_boost) if last_boost else utc_now,
+                                  next_boost_time_utc)
+            self.save_config()
+            self.logger.info(f"📡 Raise rejected by the site: wait {wait_minutes} minutes")
+            self.notify('notify_boost_failed', next_boost_time_utc, wait_minutes)
+            return "wait"
+        
+        # Accepted - the site's wait if it sent one, the configured interval otherwise
+        if wait_minutes:
+            next_boost_time_utc = utc_now + timedelta(minutes=wait_minutes)
+        else:
+            next_boost_time_utc = utc_now + timedelta(hours=self.config.get('boost_interval', 3))
+        self.config['last_boost'] = utc_now.isoformat()
+        self.record_lot_boost(self.current_lot_url, utc_now, next_boost_time_utc)
+        self.save_config()
+        
+        next_boost_iran = next_boost_time_utc.replace(tzinfo=pytz.UTC).astimezone(iran_tz)
+        self.logger.info(f"📡 Raise confirmed by the site! Next boost at: {next_boost_iran.strftime('%Y-%m-%d %H:%M:%S')} Iran")
+        if wait_minutes:
+            self.notify('notify_boost_failed', next_boost_time_utc, wait_minutes)
+        else:
+            self.notify('notify_boost_success', next_boost_time_utc)
+        return "success"
+    
     def parse_wait_time_from_page(self):
         """Parse wait time from page content and update config accordingly"""
         try:
-            page_source = self.driver.page_source
+            # Only the container holding the wait message is needed if it is configured
+            page_source = self.page_snapshot.container(
+                self.driver, self.config.get('wait_message_selector')
+            )
             
             # Look for "Please wait X minutes" or similar patterns
-            import re
-            
             # Patterns to match wait times
-            wait_patterns = [
-                r'please wait (\d+) minutes?',
-                r'wait (\d+) minutes?',
-                r'подожди (\d+) минут',
-                r'через (\d+) минут',
-                r'cooldown.*?(\d+).*?minutes?',
-                r'try again.*?(\d+).*?minutes?'
-            ]
-            
-            for pattern in wait_patterns:
+            for pattern in WAIT_MINUTE_PATTERNS:
                 match = re.search(pattern, page_source, re.IGNORECASE)
                 if match:
                     wait_minutes = int(match.group(1))
                     self.logger.info(f"🕐 Site says: Please wait {wait_minutes} minutes")
                     
                     # Calculate timing based on site's exact message (most accurate)
-                    utc_now = datetime.utcnow()
+                    utc_now = self.server_now()
                     
                     # The boost just happened, so last_boost is now
                     actual_last_boost_utc = utc_now
@@ -815,6 +2956,7 @@ class FunPayBooster:
                     
                     # Update config with current time as last boost
                     self.config['last_boost'] = actual_last_boost_utc.isoformat()
+                    self.record_lot_boost(self.current_lot_url, actual_last_boost_utc, next_boost_time_utc)
                     self.save_config()
                     
                     # Convert to Iran time for logging
@@ -832,14 +2974,7 @@ class FunPayBooster:
                     return wait_minutes
             
             # Look for "hours" patterns
-            hour_patterns = [
-                r'please wait (\d+) hours?',
-                r'wait (\d+) hours?',
-                r'подожди (\d+) час',
-                r'через (\d+) час'
-            ]
-            
-            for pattern in hour_patterns:
+            for pattern in WAIT_HOUR_PATTERNS:
                 match = re.search(pattern, page_source, re.IGNORECASE)
                 if match:
                     wait_hours = int(match.group(1))
@@ -847,7 +2982,7 @@ class FunPayBooster:
                     self.logger.info(f"🕐 Site says: Please wait {wait_hours} hours ({wait_minutes} minutes)")
                     
                     # Calculate timing based on site's exact message (most accurate)
-                    utc_now = datetime.utcnow()
+                    utc_now = self.server_now()
                     
                     # The boost just happened, so last_boost is now
                     actual_last_boost_utc = utc_now
@@ -857,6 +2992,7 @@ class FunPayBooster:
                     
                     # Update config with current time as last boost
                     self.config['last_boost'] = actual_last_boost_utc.isoformat()
+                    self.record_lot_boost(self.current_lot_url, actual_last_boost_utc, next_boost_time_utc)
                     self.save_config()
                     
                     # Convert to Iran time for logging
@@ -879,27 +3015,162 @@ class FunPayBooster:
             self.logger.error(f"Error parsing wait time from page: {e}")
             return None
 
-    def check_boost_status(self):
+    def start_cycle_deadline(self):
+        """Create the time budget for one boost cycle"""
+        phases = {'navigate': 180, 'inspect': 60, 'boost': 120}
+        phases.update(self.config.get('phase_deadlines') or {})
+        self.cycle_deadline = CycleDeadline(self.config.get('cycle_deadline', 600), phases, clock=self.clock)
+        self.error_recovery.deadline = self.cycle_deadline
+        return self.cycle_deadline
+    
+    def enter_phase(self, name):
+        """Start a cycle phase and cap WebDriver HTTP requests to its budget"""
+        if not self.cycle_deadline:
+            return
+        self.cycle_deadline.start_phase(name)
+        self.systemd.status(f"Boost cycle: {name}")
+        self.set_command_timeout(max(self.cycle_deadline.remaining(), 1))
+        # A hung phase is killed by the deadline watchdog within its grace period
+        self.report_progress(max(self.cycle_deadline.remaining(), 0) + 30)
+    
+    def report_progress(self, window):
+        """The main loop moved on and promises to check in again within window seconds"""
+        self.systemd.expect_progress(window)
+        if self.progress_hook:
+            self.progress_hook(window)
+    
+    def remember_command_timeout(self):
+        """Keep the session's own WebDriver HTTP timeout so cycles can restore it"""
+        client_config = getattr(getattr(self.driver, 'command_executor', None), '_client_config', None)
+        if client_config is not None and self.session_command_timeout[0] is not client_config:
+            self.session_command_timeout = (client_config, client_config.timeout)
+        return client_config
+    
+    def set_command_timeout(self, timeout):
+        """Set the HTTP timeout of every WebDriver command (None = the session's original timeout)"""
+        client_config = self.remember_command_timeout()
+        if client_config is None:
+            return
+        if timeout is None:
+            # reset_timeout() would fall back to the socket default - usually no timeout at all
+            client_config.timeout = self.session_command_timeout[1]
+        else:
+            client_config.timeout = timeout
+    
+    def start_deadline_watchdog(self, grace=15):
+        """Kill the WebDriver session if a call hangs past the cycle deadline"""
+        # Only a ChromeDriver process we own can be killed without hurting others
+        if self.browser_pool or not (self.driver_service and self.driver_service.is_running()):
+            return None
+        
+        stop = threading.Event()
+        deadline = self.cycle_deadline
+        
+        def _watch():
+            while not stop.wait(1):
+                if deadline.remaining() < -grace:
+                    self.logger.error(f"⏱️ {deadline.phase_name or 'cycle'} deadline exceeded, killing hung WebDriver session")
+                    deadline.expired = True
+                    self.abort_webdriver_session()
+                    return
+        
+        threading.Thread(target=_watch, daemon=True).start()
+        return stop
+    
+    def abort_webdriver_session(self):
+        """Kill ChromeDriver so the in-flight WebDriver request fails immediately"""
+        try:
+            # A wedged ChromeDriver may no longer answer - kill it all the same
+            if self.driver_service and self.driver_service.is_running():
+                self.driver_service.process.kill()
+        except Exception as e:
+            self.logger.warning(f"Failed to abort WebDriver session: {e}")
+    
+    def check_boost_status(self, queue_delay=None):
         """Check boost status and perform boost if available with enhanced stealth and accurate timing"""
+        self.page_snapshot.reset_stats()
+        self.error_recovery.reset_cycle_budget()
+        self.sync_server_clock()
+        self.command_stats.reset()
+        CommandStats.attach(self.driver, self.command_stats)
+        started_at = self.server_now()
+        deadline = self.start_cycle_deadline()
+        # Until the first phase starts (rate limiting, tab switch) - every phase then checks in again
+        self.report_progress(min(deadline.phases.get('navigate') or deadline.total, deadline.total) + 30)
+        watchdog = self.start_deadline_watchdog()
+        result = "error"
+        try:
+            # Shared Chrome - work inside this account's own context
+            if self.browser_pool:
+                self.browser_pool.activate(self.account_id)
+                self.page_snapshot.invalidate()
+            
+            # Several lots are boosted in one session, each with its own cooldown
+            if len(self.get_target_urls()) > 1:
+                result = self.check_all_lots()
+            else:
+                result = self._check_boost_status()
+        except DeadlineExceeded as e:
+            self.logger.error(f"⏱️ Boost cycle aborted: {e}")
+            result = "deadline_exceeded"
+        finally:
+            if watchdog:
+                watchdog.set()
+            self.error_recovery.deadline = None
+            self.cycle_deadline = None
+            try:
+                self.set_command_timeout(None)
+            except Exception:
+                pass
+            
+            # A hung call killed by the watchdog surfaces as a WebDriver error
+            if deadline.expired:
+                result = "deadline_exceeded"
+            
+            stats = self.page_snapshot.stats
+            self.logger.info(
+                f"📄 Page snapshot: {stats['fetches']} fetches, {stats['hits']} cache hits, "
+                f"{stats['bytes_fetched'] / 1024:.1f} KB transferred, {stats['bytes_saved'] / 1024:.1f} KB saved"
+            )
+            self.logger.info(f"🔌 WebDriver: {self.command_stats.summary()}")
+            self.cycle_journal.append({
+                'started_at': started_at.isoformat(),
+                'duration': round(self.clock.time() - deadline.started, 3),
+                'account': self.config.get('username'),
+                'result': result,
+                'queue_delay': queue_delay,
+                'page_snapshot': dict(stats),
+                'webdriver': self.command_stats.to_dict()
+            })
+        return result
+    
+    def _check_boost_status(self, target_url=None, preloaded=False):
+        """Single boost check cycle for one lot"""
         try:
+            target_url = target_url or self.config['target_url']
+            self.current_lot_url = target_url
             self.logger.info("Checking boost status...")
             
             # Apply rate limiting before boost check
             self.rate_limiter.wait_if_needed("boost_check")
             
             # Navigate to boost page with error recovery
+            self.enter_phase('navigate')
             def _navigate_to_boost():
-                self.driver.get(self.config['target_url'])
+                self.navigate(target_url)
                 self.rate_limiter.add_human_delay(3.0, 6.0)
                 return True
             
-            if not self.error_recovery.execute_with_retry(_navigate_to_boost, "navigate_boost"):
+            # Pipelined lots are already loaded in their own tab
+            if not preloaded and not self.circuit_breakers.call(
+                'navigation', self.error_recovery.execute_with_retry, _navigate_to_boost, "navigate_boost"
+            ):
                 return "error"
             
             # Check if redirected to login
+            self.enter_phase('inspect')
             if "login" in self.driver.current_url.lower():
-                self.logger.warning("Redirected to login - cookies may have expired")
-                return "auth_failed"
+                raise AuthError("Redirected to login - cookies may have expired")
             
             # Simulate human browsing behavior
             self.browser_stealth.simulate_human_behavior(self.driver)
@@ -912,13 +3183,9 @@ class FunPayBooster:
                 self.logger.info(f"⏳ Exact wait time detected: {wait_minutes} minutes")
                 
                 # Send telegram notification for wait
-                if self.telegram and self.telegram.is_enabled():
-                    try:
-                        utc_now = datetime.utcnow()
-                        next_boost_time_utc = utc_now + timedelta(minutes=wait_minutes)
-                        self.telegram.notify_boost_failed(next_boost_time_utc, wait_minutes)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to send telegram notification: {e}")
+                utc_now = self.server_now()
+                next_boost_time_utc = utc_now + timedelta(minutes=wait_minutes)
+                self.notify('notify_boost_failed', next_boost_time_utc, wait_minutes)
                 
                 return "wait"
             
@@ -936,20 +3203,31 @@ class FunPayBooster:
                     )
                     self.rate_limiter.add_human_delay(1.0, 2.0)
                     
+                    # Watch the network so the raise request's own response decides the outcome
+                    watcher = RaiseResponseWatcher(self.driver, self.clock, logger=self.logger)
+                    watcher.start()
+                    
                     # Simulate human interaction before clicking
-                    self.browser_stealth.simulate_human_behavior(self.driver, boost_button)
+                    self.click_element(boost_button)
                     
                     self.logger.info("🎉 Boost button clicked!")
                     
+                    response = watcher.wait(self.config.get('raise_response_timeout', 15))
+                    outcome = RaiseResponseWatcher.interpret(response) if response else None
+                    if outcome:
+                        return self.apply_raise_outcome(*outcome)
+                    if watcher.supported:
+                        self.logger.info("📡 No conclusive raise response, checking the page")
+                    
                     # Wait for response with random delay
-                    response_delay = random.uniform(3.0, 8.0)
-                    time.sleep(response_delay)
+                    response_delay = self.rng.uniform(3.0, 8.0)
+                    self.clock.sleep(response_delay)
                     
                     # Check if boost was actually successful by looking for success/wait messages
                     post_click_wait = self.parse_wait_time_from_page()
                     if post_click_wait is not None:
                         # Boost was clicked and site says wait - this means it was successful
-                        utc_now = datetime.utcnow()
+                        utc_now = self.server_now()
                         
                         # Convert to Iran time for logging
                         iran_tz = pytz.timezone('Asia/Tehran')
@@ -959,61 +3237,343 @@ class FunPayBooster:
                         self.logger.info(f"✅ Boost successful! Next boost at: {next_boost_iran.strftime('%Y-%m-%d %H:%M:%S')} Iran")
                         
                         # Send telegram notification for wait (since boost was successful)
-                        if self.telegram and self.telegram.is_enabled():
-                            try:
-                                # Use site's exact next boost time
-                                site_next_boost = utc_now + timedelta(minutes=post_click_wait)
-                                self.telegram.notify_boost_failed(site_next_boost, post_click_wait)
-                                self.logger.info("📱 Telegram notification sent with site's exact timing")
-                            except Exception as e:
-                                self.logger.warning(f"Failed to send telegram notification: {e}")
+                        # Use site's exact next boost time
+                        site_next_boost = utc_now + timedelta(minutes=post_click_wait)
+                        if self.notify('notify_boost_failed', site_next_boost, post_click_wait):
+                            self.logger.info("📱 Telegram notification sent with site's exact timing")
                         
                         return "success"
                     else:
                         # Update last boost time anyway (UTC)
-                        utc_now = datetime.utcnow()
+                        utc_now = self.server_now()
                         self.config['last_boost'] = utc_now.isoformat()
+                        self.record_lot_boost(
+                            self.current_lot_url, utc_now,
+                            utc_now + timedelta(hours=self.config.get('boost_interval', 3))
+                        )
                         self.save_config()
                         
                         # Send telegram notification for success (only if no wait message was detected)
-                        if self.telegram and self.telegram.is_enabled():
-                            try:
-                                interval_hours = self.config.get('boost_interval', 3)
-                                next_scheduled_boost = utc_now + timedelta(hours=interval_hours)
-                                self.telegram.notify_boost_success(next_scheduled_boost)
-                            except Exception as e:
-                                self.logger.warning(f"Failed to send telegram notification: {e}")
+                        interval_hours = self.config.get('boost_interval', 3)
+                        next_scheduled_boost = utc_now + timedelta(hours=interval_hours)
+                        self.notify('notify_boost_success', next_scheduled_boost)
                         
                         return "success"
                 else:
                     return None
             
-            try:
-                result = self.circuit_breaker.call(_find_and_click_boost)
-                if result:
-                    self.rate_limiter.reset_adaptive_factor()
-                    return result
-            except Exception as e:
-                self.logger.warning(f"Circuit breaker prevented boost attempt: {e}")
-                return "circuit_open"
+            # An open breaker and every other failure are sorted out by the handlers below
+            self.enter_phase('boost')
+            result = self.circuit_breakers.call('navigation', _find_and_click_boost)
+            if result:
+                self.rate_limiter.reset_adaptive_factor()
+                return result
+            
+            # If no boost button and no wait message, something else is wrong
+            raise SiteChangeError("❌ No boost button found and no wait message detected")
+            
+        except DeadlineExceeded:
+            raise
+        except CircuitBreakerOpen as e:
+            self.logger.warning(f"⚡ {e}")
+            return "circuit_open"
+        except BoostError as e:
+            # Conditions detected on the page - their category is the result
+            self.logger.warning(str(e))
+            return {'auth': "auth_failed", 'site_change': "no_button", 'fatal': "fatal"}.get(e.category, "error")
+        except Exception as e:
+            # Pick the recovery path from the kind of failure, not just "error"
+            category = classify_error(e)
+            self.logger.error(f"Error checking boost status ({category}): {e}")
+            return {'auth': "auth_failed", 'site_change': "no_button", 'fatal': "fatal"}.get(category, "error")
+    
+    def request_new_cookies(self):
+        """New cookies from the operator - prompt on a terminal, otherwise wait for them out of band"""
+        if self.interactive:
+            return self.get_cookies_from_user()
+        self.await_credentials()
+        return None
+    
+    def await_credentials(self):
+        """Park this account until fresh cookies arrive through the drop file or socket"""
+        if self.awaiting_credentials:
+            return
+        self.awaiting_credentials = True
+        self.cookie_inbox.open()
+        # Tell the operator once, not on every --once run
+        if self.load_browser_state().get('awaiting_credentials_since'):
+            return
+        self.save_browser_state(awaiting_credentials_since=self.clock.utcnow().isoformat())
+        self.logger.warning(
+            f"🍪 Awaiting credentials - put cookies into {self.cookie_inbox.drop_file} "
+            f"or run --send-cookies FILE"
+        )
+        self.notify('send_message', "🍪 <b>FunPay Auto Boost needs new cookies</b>\n\n"
+                    f"Account: {self.config.get('username', 'unknown')}\n"
+                    "Send them with --send-cookies on the server.")
+    
+    def accept_dropped_cookies(self):
+        """Install cookies delivered out of band; True once the account is authenticated again"""
+        cookies = self.cookie_inbox.poll()
+        if not cookies:
+            return False
+        
+        self.logger.info("🍪 New cookies received")
+        if self.install_cookies(cookies):
+            self.config['cookies'] = cookies
+            self.save_config()
+            self.logger.info("✅ Re-authentication successful with delivered cookies!")
+            return True
+        
+        self.logger.error("❌ Delivered cookies did not authenticate, still awaiting credentials")
+        return False
+    
+    def use_delivered_cookies(self):
+        """Log in with cookies that arrived while no browser was running"""
+        cookies, self.delivered_cookies = self.delivered_cookies, None
+        if not cookies:
+            return False
+        if self.install_cookies(cookies):
+            self.config['cookies'] = cookies
+            self.save_config()
+            self.logger.info("✅ Re-authentication successful with delivered cookies!")
+            return True
+        self.logger.error("❌ Delivered cookies did not authenticate, logging in instead")
+        return False
+    
+    def install_cookies(self, cookies):
+        """Put cookies into the running browser session and check they log us in"""
+        if not self.driver:
+            return False
+        if self.browser_pool:
+            self.browser_pool.activate(self.account_id)
+            self.page_snapshot.invalidate()
+        
+        if self.add_cookies(cookies) and self.test_access():
+            self.awaiting_credentials = False
+            self.cookie_inbox.close()
+            self.save_browser_state(
+                authenticated_at=self.clock.utcnow().isoformat(), awaiting_credentials_since=None
+            )
+            return True
+        return False
+    
+    def reload_config(self):
+        """Validate an edited config file and apply it to the running session"""
+        try:
+            with open(self.config_file, 'r') as f:
+                new_config = json.load(f)
+        except Exception as e:
+            self.logger.error(f"⚙️ Config change ignored - cannot read {self.config_file}: {e}")
+            return set()
+        
+        errors = validate_config(new_config)
+        if errors:
+            self.logger.error(f"⚙️ Config change ignored: {'; '.join(errors)}")
+            return set()
+        
+        # Cooldowns learned since the file was written outlive an edit that does not know them
+        lots = {target_url: dict(lot) for target_url, lot in (self.config.get('lots') or {}).items()}
+        for target_url, lot in (new_config.get('lots') or {}).items():
+            known = lots.get(target_url, {})
+            lots[target_url] = dict(lot)
+            if known.get('next_boost') and not lot.get('next_boost'):
+                lots[target_url]['next_boost'] = known['next_boost']
+        if lots:
+            new_config['lots'] = lots
+        
+        # Merged, not replaced - runtime values missing from the file are kept
+        changes = {key for key in new_config if self.config.get(key) != new_config[key]}
+        if not changes:
+            return changes
+        
+        self.config.update(new_config)
+        self.logger.info(f"⚙️ Config reloaded: {', '.join(sorted(changes))}")
+        
+        # New cookies go straight into the existing browser session
+        if 'cookies' in changes and new_config.get('cookies'):
+            if self.install_cookies(parse_cookies(new_config['cookies'])):
+                self.logger.info("🍪 New cookies installed without restarting the browser")
+            else:
+                self.logger.warning("🍪 New cookies from the config did not authenticate")
+        
+        if 'error_policies' in changes:
+            self.error_recovery = ErrorRecovery(clock=self.clock, rng=self.rng, policies=new_config.get('error_policies'),
+                                                logger=self.logger)
+        if 'circuit_breakers' in changes:
+            self.circuit_breakers.settings = new_config.get('circuit_breakers', {})
+        if 'logging' in changes:
+            self.logger.info("⚙️ Logging changes take effect after --restart")
+        if 'server_clock_url' in changes:
+            self.server_clock.url = new_config.get('server_clock_url')
+        if 'browser_policy' in changes:
+            policy = new_config.get('browser_policy', 'auto')
+            self.lifecycle.policy = policy if policy in BrowserLifecycle.POLICIES else 'auto'
+        
+        if changes & set(SCHEDULE_KEYS):
+            self.reschedule()
+        return changes
+    
+    def reschedule(self):
+        """Recompute the next check after targets or the interval changed"""
+        now = self.clock.time()
+        next_check_at = now
+        
+        # Cooldowns the site announced for every target still hold; a new target is checked at once
+        site_next_boost = self.site_next_boost()
+        last_boost = self.config.get('last_boost')
+        if site_next_boost:
+            next_check_at = now + max((site_next_boost - self.server_now()).total_seconds(), 0)
+        # Same targets, new interval - keep counting from the last boost
+        elif last_boost and len(self.get_target_urls()) <= 1 and self.next_check_at:
+            try:
+                due = datetime.fromisoformat(last_boost) + timedelta(hours=self.config.get('boost_interval', 3))
+                next_check_at = now + max((due - self.server_now()).total_seconds(), 0)
+            except ValueError:
+                pass
+        
+        self.next_check_at = next_check_at
+        self.logger.info(f"⏰ Next check rescheduled to {max(next_check_at - now, 0) / 60:.0f} minutes from now")
+    
+    def idle(self, seconds, reason=None, source='backoff'):
+        """Sleep until the next check, applying config edits on the way"""
+        self.next_check_at = self.clock.time() + seconds
+        next_check_utc = self.server_now() + timedelta(seconds=seconds)
+        self.systemd.status(f"Next check at {next_check_utc.strftime('%Y-%m-%d %H:%M:%S')} UTC")
+        # A restarted daemon sleeps until this deadline instead of checking at once
+        self.save_schedule(next_check_utc, reason, source)
+        
+        # Over a long gap the browser is shut down and started again just before the check
+        if self.hibernate_browser(seconds):
+            self._wait_for_next_check(self.lifecycle.prelaunch_lead())
+            if self.running:
+                self.wake_browser()
+        self._wait_for_next_check()
+        self.next_check_at = None
+    
+    def _wait_for_next_check(self, lead=0):
+        """Idle loop until lead seconds before the next check"""
+        poll_interval = self.config.get('config_poll_interval', 5)
+        hours_left = int((self.next_check_at - lead - self.clock.time()) // 3600)
+        # Without a browser nothing else listens for cookies - like a parked account, watch the inbox
+        watch_inbox = not self.driver
+        if watch_inbox:
+            self.cookie_inbox.open()
+        
+        while self.running:
+            remaining = self.next_check_at - lead - self.clock.time()
+            if remaining <= 0:
+                break
+            
+            # Under a systemd watchdog, check in at least once a minute
+            step = min(remaining, 60) if self.systemd.watchdog_interval else remaining
+            if watch_inbox:
+                step = min(step, self.config.get('cookie_poll_interval', 5))
+            self.systemd.expect_progress(step + 30)
+            if not self.config_watcher:
+                self.clock.sleep(step)
+            elif self.config_watcher.fd is not None and isinstance(self.clock, SystemClock):
+                self.config_watcher.wait(step)
+            else:
+                self.clock.sleep(min(step, poll_interval))
             
-            # If no boost button and no wait message, something else is wrong
-            self.logger.info("❌ No boost button found and no wait message detected")
-            return "no_button"
+            if self.config_watcher and self.config_watcher.changed():
+                self.reload_config()
+            
+            # Delivered cookies make the check due at once
+            if watch_inbox and not self.delivered_cookies:
+                self.delivered_cookies = self.cookie_inbox.poll()
+                if self.delivered_cookies:
+                    self.logger.info("🍪 New cookies received - checking now")
+                    self.next_check_at = self.clock.time()
+                    lead = 0
             
+            remaining_hours = int((self.next_check_at - self.clock.time()) // 3600)
+            if 0 < remaining_hours < hours_left:
+                self.logger.info(f"⏰ {remaining_hours} hours until next boost attempt")
+            hours_left = remaining_hours
+        
+        if watch_inbox and not self.awaiting_credentials:
+            self.cookie_inbox.close()
+    
+    def browser_rss(self):
+        """Resident memory of our Chrome (or ChromeDriver-launched browser) process tree"""
+        if self.pid_is_alive(self.chrome_pid):
+            return process_tree_rss(self.chrome_pid)
+        if self.driver_service and self.driver_service.is_running():
+            return process_tree_rss(self.driver_service.process.pid)
+        return 0
+    
+    def hibernate_browser(self, gap):
+        """Close the browser for this idle gap if the lifecycle policy says so"""
+        # A shared Chrome belongs to every account, never shut it down for one of them
+        if self.browser_pool or not self.driver or self.awaiting_credentials:
+            return False
+        
+        self.lifecycle.record_idle_rss(self.browser_rss())
+        if not self.lifecycle.should_hibernate(gap):
+            return False
+        
+        lead = self.lifecycle.prelaunch_lead()
+        self.logger.info(
+            f"💤 Hibernating browser for {(gap - lead) / 60:.0f} minutes "
+            f"(idle RSS {self.lifecycle.state.get('idle_rss_mb') or 0:.0f} MB, "
+            f"startup {self.lifecycle.state.get('startup_seconds') or 0:.0f}s)"
+        )
+        self.close_browser_session()
+        return True
+    
+    def wake_browser(self):
+        """Start and authenticate the browser, recording how long a cold start takes"""
+        self.logger.info("⏰ Pre-launching browser for the next check...")
+        self.systemd.expect_progress(self.config.get('startup_deadline', 600))
+        started = self.clock.time()
+        if self.setup_chrome() and (self.use_delivered_cookies() or self.setup_authentication()):
+            self.lifecycle.record_startup(self.clock.time() - started)
+            return True
+        self.logger.warning("Browser pre-launch failed - recovering on the next check")
+        return False
+    
+    def send_cookies(self, source):
+        """Deliver cookies from a file (or - for stdin) to the running daemon"""
+        try:
+            if source == '-':
+                data = sys.stdin.read()
+            else:
+                with open(source, 'r') as f:
+                    data = f.read()
+            print(f"🍪 Cookies {self.cookie_inbox.deliver(data)}")
+            return True
+        except Exception as e:
+            print(f"❌ Failed to deliver cookies: {e}")
+            return False
+    
+    def notify(self, method, *args):
+        """Send a Telegram notification behind the telegram circuit breaker"""
+        if not (self.telegram and self.telegram.is_enabled()):
+            return False
+        
+        def _send():
+            if not getattr(self.telegram, method)(*args):
+                raise ConnectionError(f"Telegram {method} failed")
+            return True
+        
+        try:
+            return self.circuit_breakers.call('telegram', _send)
         except Exception as e:
-            self.logger.error(f"Error checking boost status: {e}")
-            return "error"
+            self.logger.warning(f"Failed to send telegram notification: {e}")
+            return False
     
     def handle_auth_failure(self):
         """Handle authentication failure by requesting new cookies"""
         self.logger.warning("Authentication failed, requesting new cookies...")
         
         try:
-            cookies = self.get_cookies_from_user()
-            if self.add_cookies(cookies):
+            cookies = self.request_new_cookies()
+            if cookies and self.add_cookies(cookies):
                 if self.test_access():
                     self.logger.info("✅ Re-authentication successful!")
+                    self.save_browser_state(authenticated_at=self.clock.utcnow().isoformat())
                     return True
         except KeyboardInterrupt:
             self.logger.info("Cookie update cancelled by user")
@@ -1037,35 +3597,74 @@ class FunPayBooster:
                 self.logger.error("Failed to get user credentials")
                 return False
         
-        # Setup Chrome
+        # Resume the persisted schedule - the browser is only started shortly before the deadline
+        self.running = True
+        resume = self.resume_deadline()
+        if resume:
+            next_check_utc, reason, source = resume
+            seconds = (next_check_utc - self.server_now()).total_seconds()
+            self.logger.info(
+                f"⏳ Resuming schedule: next check at {next_check_utc.strftime('%Y-%m-%d %H:%M:%S')} UTC "
+                f"in {seconds / 60:.0f} minutes (after {reason or 'unknown'}, from {source})"
+            )
+            self.systemd.ready(f"Next check at {next_check_utc.strftime('%Y-%m-%d %H:%M:%S')} UTC")
+            self.systemd.status(f"Next check at {next_check_utc.strftime('%Y-%m-%d %H:%M:%S')} UTC")
+            self.next_check_at = self.clock.time() + seconds
+            self._wait_for_next_check(self.lifecycle.prelaunch_lead())
+            if not self.running:
+                return True
+        
+        # Setup Chrome - Xvfb, Chrome and the login get the whole startup budget
+        self.systemd.expect_progress(self.config.get('startup_deadline', 600))
+        startup_started = self.clock.time()
         if not self.setup_chrome():
             self.logger.error("Failed to setup Chrome")
             return False
         
-        # Setup authentication
-        if not self.setup_authentication():
+        # Setup authentication - a parked account keeps running and waits for cookies
+        if not (self.use_delivered_cookies() or self.setup_authentication()) and not self.awaiting_credentials:
             self.logger.error("Failed to setup authentication")
             return False
+        if not self.awaiting_credentials:
+            self.lifecycle.record_startup(self.clock.time() - startup_started)
+        
+        self.systemd.ready("Awaiting credentials" if self.awaiting_credentials else "Authenticated")
         
         self.logger.info("✅ Boost monitoring started successfully!")
         
+        # Warm browser, resumed deadline - wait out the rest of it
+        if self.next_check_at:
+            self._wait_for_next_check()
+            self.next_check_at = None
+        
         # Main monitoring loop with enhanced error handling
-        while True:
+        while self.running:
             try:
+                # Parked until cookies arrive through the drop file or socket
+                # Rate limiting, cookie polling and recovery all report back within this
+                self.systemd.expect_progress(self.config.get('loop_progress_timeout', 300))
+                
+                if self.awaiting_credentials:
+                    if not self.accept_dropped_cookies():
+                        self.systemd.status("Awaiting credentials - use --send-cookies")
+                        self.clock.sleep(self.config.get('cookie_poll_interval', 5))
+                        if self.config_watcher and self.config_watcher.changed():
+                            self.reload_config()
+                    continue
+                
+                # A failed pre-launch left us without a browser
+                if not self.driver and not self.wake_browser():
+                    self.consecutive_errors += 1
+                
                 # Apply rate limiting before each boost check cycle
                 self.rate_limiter.wait_if_needed("main_loop")
                 
                 result = self.check_boost_status()
                 
                 if result == "success":
-                    wait_hours = self.config.get('boost_interval', 3)
-                    # Add randomization to boost interval to avoid detection patterns
-                    jitter_minutes = random.randint(-30, 30)
-                    wait_seconds = (wait_hours * 3600) + (jitter_minutes * 60)
-                    
-                    # Calculate next time in UTC
-                    utc_now = datetime.utcnow()
-                    next_time_utc = utc_now + timedelta(seconds=wait_seconds)
+                    # The earliest cooldown the lots reported, the jittered interval only when none did
+                    next_time_utc, source = self.next_deadline(result)
+                    wait_seconds = max(int((next_time_utc - self.server_now()).total_seconds()), 0)
                     
                     # Convert to Iran time for logging
                     iran_tz = pytz.timezone('Asia/Tehran')
@@ -1075,46 +3674,45 @@ class FunPayBooster:
                     self.consecutive_errors = 0
                     self.error_recovery.reset_retry_count("boost_operation")
                     
-                    # Sleep with periodic status updates and random micro-breaks
-                    hours_to_wait = int(wait_seconds // 3600)
-                    remaining_seconds = wait_seconds % 3600
-                    
-                    for i in range(hours_to_wait):
-                        # Add random micro-breaks during waiting
-                        hour_sleep = 3600 + random.randint(-300, 300)  # ±5 minutes
-                        time.sleep(hour_sleep)
-                        
-                        remaining_hours = hours_to_wait - i - 1
-                        if remaining_hours > 0:
-                            self.logger.info(f"⏰ {remaining_hours} hours until next boost attempt")
-                    
-                    # Sleep remaining time
-                    if remaining_seconds > 0:
-                        time.sleep(remaining_seconds)
+                    # Sleep with periodic status updates, applying config edits on the way
+                    self.idle(wait_seconds, result, 'interval' if source == 'backoff' else source)
                 
                 elif result == "auth_failed":
-                    auth_retry_result = self.error_recovery.execute_with_retry(
-                        self.handle_auth_failure, "auth_recovery"
-                    )
-                    
-                    if auth_retry_result:
+                    # Asking for cookies again will not help - one attempt, then wait
+                    if self.handle_auth_failure() or self.awaiting_credentials:
                         continue  # Try again immediately
                     else:
-                        self.logger.error("Re-authentication failed after retries, waiting 1 hour...")
-                        time.sleep(3600)
+                        self.logger.error("Re-authentication failed, waiting 1 hour...")
+                        self.idle(3600, result)
+                
+                elif result == "fatal":
+                    self.logger.error("❌ Unrecoverable error (check chromedriver, Chrome and file permissions) - stopping daemon")
+                    self.notify('send_message', "❌ <b>FunPay Auto Boost stopped</b>\n\nUnrecoverable error - check the server logs.")
+                    self.running = False
+                    return False
                 
                 elif result == "wait":
-                    # Add randomization to wait time
-                    base_wait = 3600  # 1 hour
-                    jitter = random.randint(-600, 600)  # ±10 minutes
-                    wait_time = base_wait + jitter
+                    # The site's cooldown when it told us, otherwise about an hour
+                    next_check_utc, source = self.next_deadline(result)
+                    wait_time = int((next_check_utc - self.server_now()).total_seconds())
                     
                     self.logger.info(f"⏳ Waiting {wait_time//60} minutes before next check...")
-                    time.sleep(wait_time)
+                    self.idle(wait_time, result, source)
+                
+                elif result == "deadline_exceeded":
+                    # The browser may be wedged - start a fresh session before retrying
+                    self.logger.warning("Boost cycle hit its deadline, restarting browser...")
+                    if not self.restart_chrome():
+                        self.consecutive_errors += 1
+                    wait_time = schedule_delay(result, self.config.get('boost_interval', 3), self.rng)
+                    self.logger.info(f"⏳ Retrying in {wait_time // 60} minutes...")
+                    self.idle(wait_time, result)
                 
                 elif result == "circuit_open":
-                    self.logger.warning("Circuit breaker is open, waiting for recovery...")
-                    time.sleep(self.circuit_breaker.recovery_timeout)
+                    # Wake up when the breaker lets a probe through, not after a fixed sleep
+                    wait_time = max(self.circuit_breakers.next_probe_in(), 60)
+                    self.logger.warning(f"Circuit breaker is open, probing again in {wait_time // 60:.0f} minutes...")
+                    self.idle(wait_time, result)
                 
                 else:
                     self.consecutive_errors += 1
@@ -1131,15 +3729,15 @@ class FunPayBooster:
                             self.logger.info("Recovery successful, continuing...")
                         else:
                             self.logger.error("Recovery failed, entering extended wait...")
-                            time.sleep(7200)  # 2 hours
+                            self.idle(7200, result)  # 2 hours
                     else:
                         # Progressive backoff for errors
                         wait_time = 1800 * (2 ** (self.consecutive_errors - 1))  # Exponential backoff
                         wait_time = min(wait_time, 7200)  # Max 2 hours
-                        wait_time += random.randint(-300, 300)  # Add jitter
+                        wait_time += self.rng.randint(-300, 300)  # Add jitter
                         
                         self.logger.info(f"⏰ Error {self.consecutive_errors}/{self.max_errors}, waiting {wait_time//60} minutes...")
-                        time.sleep(wait_time)
+                        self.idle(wait_time, result)
                 
             except KeyboardInterrupt:
                 self.logger.info("🛑 Daemon stopped by user")
@@ -1149,35 +3747,192 @@ class FunPayBooster:
                 
                 # Use error recovery for unexpected errors
                 recovery_wait = self.error_recovery.execute_with_retry(
-                    lambda: random.randint(1800, 3600), "unexpected_error_recovery"
+                    lambda: self.rng.randint(1800, 3600), "unexpected_error_recovery"
                 )
-                time.sleep(recovery_wait or 1800)
+                self.idle(recovery_wait or 1800, "error")
         
         return True
     
+    def load_schedule(self):
+        """Persisted next check time of timer-driven (--once) runs"""
+        try:
+            with open(self.schedule_file, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+    
+    def save_schedule(self, next_check_utc, result, source=None):
+        """Persist the next deadline (--once runs and daemon restarts resume from it)"""
+        try:
+            os.makedirs(os.path.dirname(self.schedule_file) or '.', exist_ok=True)
+            with open(self.schedule_file, 'w') as f:
+                json.dump({
+                    'next_check': next_check_utc.isoformat(),
+                    'last_result': result,
+                    'source': source,
+                    # A deadline computed for other targets or another interval is not resumed
+                    'targets': self.get_target_urls(),
+                    'boost_interval': self.config.get('boost_interval', 3),
+                    'updated_at': self.clock.utcnow().isoformat()
+                }, f, indent=2)
+            return True
+        except Exception as e:
+            self.logger.warning(f"Failed to save schedule: {e}")
+            return False
+    
+    def site_next_boost(self):
+        """Earliest next boost the site announced for our lots, None unless it is known for all of them"""
+        lots = self.config.get('lots', {})
+        known = [lots.get(target_url, {}).get('next_boost') for target_url in self.get_target_urls()]
+        if known and all(known):
+            return min(datetime.fromisoformat(value) for value in known)
+        return None
+    
+    def next_check_after(self, result):
+        """Next check time in UTC - the site's own cooldowns when known, the daemon's delays otherwise"""
+        return self.next_deadline(result)[0]
+    
+    def next_deadline(self, result):
+        """(next check in UTC, source) - source is 'site' when the site's cooldown decided it"""
+        utc_now = self.server_now()
+        next_check = utc_now + timedelta(seconds=schedule_delay(result, self.config.get('boost_interval', 3), self.rng))
+        
+        if result in ("success", "wait"):
+            site_next_boost = self.site_next_boost()
+            if site_next_boost:
+                return max(site_next_boost, utc_now + timedelta(minutes=1)), 'site'
+        return next_check, 'backoff'
+    
+    def resume_deadline(self):
+        """(next check in UTC, reason, source) to resume after a restart, None when a check is due now"""
+        # Delivered cookies make the daemon due straight away
+        if os.path.exists(self.cookie_inbox.drop_file):
+            return None
+        
+        utc_now = self.server_now()
+        boost_interval = self.config.get('boost_interval', 3)
+        deadline = None
+        schedule = self.load_schedule()
+        if (schedule.get('next_check') and schedule.get('targets') == self.get_target_urls()
+                and schedule.get('boost_interval') == boost_interval):
+            deadline = (datetime.fromisoformat(schedule['next_check']), schedule.get('last_result'),
+                        schedule.get('source') or 'schedule')
+        elif self.site_next_boost():
+            deadline = (self.site_next_boost(), 'wait', 'site')
+        elif self.config.get('last_boost') and len(self.get_target_urls()) <= 1:
+            deadline = (datetime.fromisoformat(self.config['last_boost']) + timedelta(hours=boost_interval),
+                        'success', 'last_boost')
+        
+        # Nothing persisted, already due, or implausibly far away (clock jump)
+        if not deadline or deadline[0] <= utc_now or deadline[0] - utc_now > timedelta(hours=max(boost_interval, 6) + 1):
+            return None
+        return deadline
+    
+    def run_once(self):
+        """One timer-driven run: exit at once if not due, otherwise boost, record the next check and stop everything"""
+        schedule = self.load_schedule()
+        utc_now = self.server_now()
+        
+        # Delivered cookies make the run due straight away
+        next_check = schedule.get('next_check')
+        if next_check and datetime.fromisoformat(next_check) > utc_now and not os.path.exists(self.cookie_inbox.drop_file):
+            self.logger.info(f"⏳ Not due yet - next check at {next_check} UTC")
+            return "not_due"
+        
+        result = "error"
+        try:
+            if not all(key in self.config for key in ['username', 'password', 'target_url']):
+                self.logger.error("Missing configuration - run --setup first")
+                result = "fatal"
+            elif not self.setup_chrome():
+                result = "error"
+            else:
+                cookies = self.cookie_inbox.poll()
+                if cookies and self.install_cookies(cookies):
+                    self.config['cookies'] = cookies
+                    self.save_config()
+                    self.logger.info("✅ Re-authentication successful with delivered cookies!")
+                    result = self.check_boost_status()
+                elif self.setup_authentication():
+                    result = self.check_boost_status()
+                else:
+                    result = "auth_failed"
+        finally:
+            next_check, source = self.next_deadline(result)
+            self.save_schedule(next_check, result, source)
+            self.logger.info(f"🔚 Single run finished: {result}, next check at {next_check.isoformat()} UTC")
+            self.cleanup()
+        return result
+    
+    def emit_timer_units(self, accounts=None):
+        """Print a systemd service and timer pair that runs --once, timed from the saved schedules"""
+        minutes = int(self.config.get('once_check_minutes', 10))
+        command = f"{sys.executable} {os.path.abspath(__file__)} --once"
+        if accounts:
+            command += ' --accounts ' + ' '.join(os.path.abspath(config_file) for config_file in accounts)
+        
+        # Saved next checks are in server time - the timer fires on the local clock
+        next_checks = []
+        for schedule_file in [account_state_file(config_file, 'schedule') for config_file in accounts or []] or [self.schedule_file]:
+            try:
+                with open(schedule_file, 'r') as f:
+                    next_check = json.load(f).get('next_check')
+                if next_check:
+                    next_checks.append(datetime.fromisoformat(next_check) - timedelta(seconds=self.server_clock.offset))
+            except Exception:
+                pass
+        local_now = self.clock.utcnow()
+        due_now = not next_checks or len(next_checks) < len(accounts or [None]) or min(next_checks) <= local_now
+        
+        print("# /etc/systemd/system/funpay-boost-once.service")
+        print("[Unit]")
+        print("Description=FunPay Auto Boost - single boost check")
+        print("")
+        print("[Service]")
+        print("Type=oneshot")
+        print(f"ExecStart={command}")
+        print("")
+        print("# /etc/systemd/system/funpay-boost-once.timer")
+        print("[Unit]")
+        print("Description=FunPay Auto Boost - boost check timer")
+        print("")
+        print("[Timer]")
+        # The first run lands on the saved check, later runs pick up the next check each run records
+        for next_check in sorted(set(next_checks)):
+            if next_check > local_now:
+                print(f"OnCalendar={next_check.strftime('%Y-%m-%d %H:%M:%S')} UTC")
+        if due_now:
+            print("OnActiveSec=1s")
+        print(f"OnUnitInactiveSec={minutes}min")
+        print("Persistent=true")
+        print("AccuracySec=1s")
+        print("")
+        print("[Install]")
+        print("WantedBy=timers.target")
+    
     def restart_chrome(self):
         """Restart Chrome driver with enhanced recovery"""
         try:
             self.logger.info("Restarting Chrome with enhanced recovery...")
+            self.systemd.expect_progress(self.config.get('startup_deadline', 600))
             
-            # Cleanup with error recovery
+            # Close only the browser session - ChromeDriver and Xvfb stay up
             def _cleanup():
-                self.cleanup()
+                self.close_browser_session()
                 # Add random delay to avoid detection patterns
-                cleanup_delay = random.uniform(5.0, 15.0)
-                time.sleep(cleanup_delay)
+                cleanup_delay = self.rng.uniform(5.0, 15.0)
+                self.clock.sleep(cleanup_delay)
                 return True
             
             self.error_recovery.execute_with_retry(_cleanup, "cleanup_operation")
             
             # Setup Chrome with circuit breaker protection
             def _setup_and_auth():
-                if self.setup_chrome():
-                    if self.setup_authentication():
-                        return True
-                return False
+                if not self.setup_chrome():
+                    raise WebDriverException("Chrome setup failed")
+                return self.setup_authentication()
             
-            result = self.circuit_breaker.call(_setup_and_auth)
+            result = self.circuit_breakers.call('browser_startup', _setup_and_auth)
             
             if result:
                 self.logger.info("✅ Chrome restarted successfully with enhanced recovery")
@@ -1207,6 +3962,42 @@ class FunPayBooster:
         print(f"👤 Username: {self.config.get('username', 'Not configured')}")
         print(f"⏰ Boost Interval: {interval} hours")
         print(f"🍪 Cookies: {'Configured' if self.config.get('cookies') else 'Not configured'}")
+        lifecycle = self.lifecycle.state
+        if lifecycle.get('startup_seconds') is not None:
+            print(f"🧠 Browser policy: {self.lifecycle.policy} (startup {lifecycle['startup_seconds']:.0f}s, "
+                  f"idle RSS {lifecycle.get('idle_rss_mb') or 0:.0f} MB, last: {lifecycle.get('last_decision') or 'n/a'})")
+        last_cycle = self.cycle_journal.last()
+        if last_cycle and last_cycle.get('webdriver'):
+            totals = last_cycle['webdriver']['totals']
+            print(f"🔌 Last cycle: {last_cycle['result']} at {last_cycle['started_at'][:19]} UTC - "
+                  f"{totals['count']} WebDriver commands, "
+                  f"{(totals['bytes_sent'] + totals['bytes_received']) / 1024:.1f} KB, {totals['seconds']:.1f}s")
+        if self.server_clock.samples:
+            print(f"🕰️ Server clock offset: {self.server_clock.offset:+.1f}s ({self.server_clock.samples} samples)")
+        schedule = self.load_schedule()
+        if schedule.get('next_check'):
+            print(f"📆 Next check: {schedule['next_check'][:19]} UTC "
+                  f"(after {schedule.get('last_result') or 'unknown'}, from {schedule.get('source') or 'schedule'})")
+        awaiting_since = self.load_browser_state().get('awaiting_credentials_since')
+        if awaiting_since:
+            print(f"🍪 Awaiting new cookies since {awaiting_since} UTC - use --send-cookies FILE")
+        
+        target_urls = self.get_target_urls()
+        if len(target_urls) > 1:
+            iran_tz = pytz.timezone('Asia/Tehran')
+            print(f"📦 Lots: {len(target_urls)}")
+            for target_url in target_urls:
+                next_boost = self.config.get('lots', {}).get(target_url, {}).get('next_boost')
+                if next_boost:
+                    next_boost = datetime.fromisoformat(next_boost).replace(tzinfo=pytz.UTC).astimezone(iran_tz)
+                    next_boost = f"{next_boost.strftime('%Y-%m-%d %H:%M:%S')} Iran"
+                print(f"   • {target_url} - next boost: {next_boost or 'ready'}")
+        
+        # Breakers that are not CLOSED, as last saved by the daemon
+        for name, breaker in self.circuit_breakers.load_status().items():
+            if breaker.get('state') != 'CLOSED':
+                since = datetime.fromtimestamp(breaker['state_changed_at']).strftime('%Y-%m-%d %H:%M:%S')
+                print(f"⚡ Circuit breaker {name}: {breaker['state']} since {since}")
         print("")
         
         if last_boost:
@@ -1229,7 +4020,7 @@ class FunPayBooster:
                 print(f"📅 Next Boost: {next_time_iran.strftime('%Y-%m-%d %H:%M:%S')} Iran")
                 
                 # Calculate remaining time in UTC
-                now_utc = datetime.utcnow().replace(tzinfo=pytz.UTC)
+                now_utc = self.server_now().replace(tzinfo=pytz.UTC)
                 if next_time_utc > now_utc:
                     remaining = next_time_utc - now_utc
                     hours = int(remaining.total_seconds() // 3600)
@@ -1259,10 +4050,14 @@ class FunPayBooster:
             
             print("🚀 Starting FunPay Auto Boost in background...")
             
+            # Listener threads do not survive fork - stop them and restart on both sides
+            self.stop_logging()
+            
             # Fork process to background
             pid = os.fork()
             
             if pid > 0:
+                self.setup_logging()
                 # Parent process
                 print(f"✅ FunPay Auto Boost started in background with PID: {pid}")
                 print("📋 Use --stop to stop the background process")
@@ -1272,13 +4067,14 @@ class FunPayBooster:
             # Child process - run in background
             os.setsid()  # Create new session
             
-            # Redirect stdout/stderr to log file
-            log_file = '/var/log/funpay/background.log'
-            os.makedirs(os.path.dirname(log_file), exist_ok=True)
-            
-            with open(log_file, 'a') as f:
+            # Detach from the terminal - stdout/stderr go to the rotated background log
+            with open(os.devnull, 'w') as f:
                 os.dup2(f.fileno(), sys.stdout.fileno())
                 os.dup2(f.fileno(), sys.stderr.fileno())
+            with open(os.devnull, 'r') as f:
+                os.dup2(f.fileno(), sys.stdin.fileno())
+            self.interactive = False
+            self.setup_logging(detached=True)
             
             # Save PID
             with open(self.pid_file, 'w') as f:
@@ -1294,7 +4090,7 @@ class FunPayBooster:
             print(f"❌ Error starting background: {e}")
             return False
     
-    def stop_background(self):
+    def stop_background(self, preserve_browser=False):
         """Stop background daemon"""
         try:
             if not self.is_running():
@@ -1304,9 +4100,14 @@ class FunPayBooster:
             pid = self.get_running_pid()
             print(f"🛑 Stopping FunPay Auto Boost (PID: {pid})...")
             
-            # Send SIGTERM first
-            os.kill(pid, signal.SIGTERM)
-            time.sleep(2)
+            # SIGUSR1 asks the daemon to hand its browser over, SIGTERM shuts everything down
+            os.kill(pid, signal.SIGUSR1 if preserve_browser else signal.SIGTERM)
+            
+            # Wait for graceful shutdown
+            for _ in range(20):
+                if not self.is_running():
+                    break
+                time.sleep(0.5)
             
             # Check if still running
             if self.is_running():
@@ -1390,12 +4191,13 @@ class FunPayBooster:
                 pass
             
             # Show log file location
-            print(f"📄 Log File: /var/log/funpay/background.log")
-            print(f"📄 Boost Log: /var/log/funpay/boost.log")
+            boost_log = self.log_settings['boost_log']['path']
+            print(f"📄 Log File: {self.log_settings['background_log']['path']}")
+            print(f"📄 Boost Log: {boost_log}")
             
             # Show recent activity
             try:
-                result = subprocess.run(['tail', '-3', '/var/log/funpay/boost.log'], 
+                result = subprocess.run(['tail', '-3', boost_log], 
                                       capture_output=True, text=True)
                 if result.returncode == 0 and result.stdout.strip():
                     print(f"📋 Recent Activity:")
@@ -1413,17 +4215,64 @@ class FunPayBooster:
         # Show configuration status
         self.get_status()
     
-    def cleanup(self):
+    def close_browser_session(self, preserve_browser=False):
+        """Close the current browser session without stopping ChromeDriver"""
+        if self.browser_pool:
+            # Only this account's context goes away, the shared Chrome stays up
+            if not preserve_browser:
+                self.browser_pool.release(self.account_id)
+            self.driver = None
+            return True
+        
+        if preserve_browser:
+            # Leave Chrome running for the next daemon to reattach
+            self.driver = None
+            return True
+        
+        if self.driver:
+            try:
+                self.driver.quit()
+            except:
+                pass
+            self.driver = None
+        
+        # Standalone Chrome is not owned by ChromeDriver, stop it ourselves
+        had_browser = bool(self.chrome_process or self.chrome_pid)
+        if self.chrome_process:
+            self.stop_chrome_process()
+        elif self.pid_is_alive(self.chrome_pid):
+            try:
+                os.kill(self.chrome_pid, signal.SIGTERM)
+            except:
+                pass
+        if had_browser:
+            self.clear_browser_state()
+        self.chrome_process = None
+        self.chrome_pid = None
+        self.browser_reattached = False
+        return True
+    
+    def cleanup(self, preserve_browser=False):
         """Clean up resources"""
         try:
             self.logger.info("Cleaning up resources...")
+            self.systemd.stopping()
+            
+            self.close_browser_session(preserve_browser=preserve_browser)
+            self.cookie_inbox.close()
             
-            if self.driver:
+            if self.driver_service:
                 try:
-                    self.driver.quit()
+                    self.driver_service.shutdown()
                 except:
                     pass
-                self.driver = None
+                self.driver_service = None
+            
+            if preserve_browser:
+                self.logger.info("♻️ Browser left running for the next daemon")
+                self.remove_own_pid_file()
+                self.logger.info("Cleanup completed")
+                return
             
             if self.xvfb_process:
                 try:
@@ -1435,26 +4284,570 @@ class FunPayBooster:
                     except:
                         pass
                 self.xvfb_process = None
-            
-            # Kill remaining processes
-            self.kill_processes('chrome')
-            self.kill_processes('chromedriver')
-            self.kill_processes('Xvfb')
-            
-            # Remove PID file if we're the background process
-            if os.path.exists(self.pid_file):
+            elif self.pid_is_alive(self.xvfb_pid):
                 try:
-                    with open(self.pid_file, 'r') as f:
-                        pid = int(f.read().strip())
-                    if pid == os.getpid():
-                        os.remove(self.pid_file)
+                    os.kill(self.xvfb_pid, signal.SIGTERM)
                 except:
                     pass
+            self.xvfb_pid = None
+            
+            # Kill remaining processes
+            if self.exclusive_host:
+                self.kill_processes('chrome')
+                self.kill_processes('chromedriver')
+                self.kill_processes('Xvfb')
+            
+            self.remove_own_pid_file()
             
             self.logger.info("Cleanup completed")
             
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}")
+    
+    def owns_resources(self):
+        """Check if this process started a browser, driver or display"""
+        if self.browser_pool:
+            return False
+        return any([self.driver, self.driver_service, self.xvfb_process, self.chrome_process])
+    
+    def remove_own_pid_file(self):
+        """Remove PID file if we're the background process"""
+        if os.path.exists(self.pid_file):
+            try:
+                with open(self.pid_file, 'r') as f:
+                    pid = int(f.read().strip())
+                if pid == os.getpid():
+                    os.remove(self.pid_file)
+            except:
+                pass
+
+# Cycle results in the order AccountState stores them
+RESULT_CODES = ('pending', 'success', 'wait', 'error', 'no_button', 'auth_failed', 'circuit_open',
+                'deadline_exceeded', 'fatal')
+
+class AccountState:
+    """Scheduling state of an account without a live booster - a few hundred bytes each"""
+    
+    __slots__ = ('config_file', 'account_id', 'next_check', 'result_code', 'config_mtime', 'session')
+    
+    def __init__(self, config_file, account_id=None, next_check=0.0):
+        self.config_file = config_file
+        self.account_id = account_id or config_file
+        self.next_check = next_check
+        self.result_code = 0
+        self.config_mtime = self.read_config_mtime()
+        self.session = None  # (name, value, domain, path) of the login cookies while evicted
+    
+    def keep_session(self, cookies):
+        """Remember the login cookies of a released browser context"""
+        self.session = tuple(
+            (cookie['name'], cookie['value'], cookie.get('domain'), cookie.get('path', '/'))
+            for cookie in cookies
+        ) or None
+    
+    def session_cookies(self):
+        """Saved login cookies in add_cookie() form"""
+        cookies = []
+        for name, value, domain, path in self.session or ():
+            cookie = {'name': name, 'value': value, 'path': path}
+            if domain:
+                cookie['domain'] = domain
+            cookies.append(cookie)
+        return cookies
+    
+    @classmethod
+    def from_config(cls, config_file):
+        """State named after the config's username"""
+        try:
+            with open(config_file, 'r') as f:
+                account_id = json.load(f).get('username')
+        except Exception:
+            account_id = None
+        return cls(config_file, account_id)
+    
+    @property
+    def result(self):
+        return RESULT_CODES[self.result_code]
+    
+    @result.setter
+    def result(self, value):
+        self.result_code = RESULT_CODES.index(value if value in RESULT_CODES else 'error')
+    
+    def read_config_mtime(self):
+        try:
+            return os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return 0
+    
+    def config_changed(self):
+        """True once after the config file was modified"""
+        mtime = self.read_config_mtime()
+        if mtime == self.config_mtime:
+            return False
+        self.config_mtime = mtime
+        return True
+
+class MultiAccountDaemon:
+    """Runs several accounts in one shared Chrome, one browser context per account"""
+    
+    def __init__(self, config_files):
+        # The first account owns Chrome, Xvfb, ChromeDriver and the log pipeline
+        self.host = FunPayBooster(config_files[0])
+        self.logger = self.host.logger
+        self.clock = self.host.clock
+        self.pool = None
+        
+        # Idle accounts are kept as AccountStates, only recently used ones keep a booster and browser context
+        self.states = OrderedDict()
+        for config_file in config_files:
+            state = AccountState.from_config(config_file)
+            self.states[state.account_id] = state
+        self.host_state = next(iter(self.states.values()))
+        self.host.account_id = self.host_state.account_id
+        self.live = OrderedDict([(self.host.account_id, self.host)])  # Least recently used first
+        self.max_live = max(self.host.config.get('max_live_accounts', 32), 1)
+        
+        signal.signal(signal.SIGINT, self.signal_handler)
+        signal.signal(signal.SIGTERM, self.signal_handler)
+    
+    @property
+    def boosters(self):
+        """Live boosters"""
+        return list(self.live.values())
+    
+    def signal_handler(self, signum, frame):
+        self.logger.info(f"Received signal {signum}, shutting down gracefully...")
+        self.cleanup()
+        sys.exit(0)
+    
+    def setup(self):
+        """Start the shared Chrome and authenticate the host account in its own context"""
+        if not self.host.setup_chrome():
+            self.logger.error("Failed to setup shared Chrome")
+            return False
+        
+        self.pool = BrowserContextPool(self.host.driver, logger=self.logger)
+        self.host.browser_pool = self.pool
+        self.host.setup_chrome()
+        if not self.host.setup_authentication() and not self.host.awaiting_credentials:
+            self.logger.error(f"❌ Authentication failed for {self.host.account_id}")
+            self.host_state.next_check = self.clock.time() + 3600
+        
+        # Every other account logs in when it first comes due
+        for state in self.states.values():
+            if state is not self.host_state:
+                state.next_check = self.clock.time()
+        self.host.systemd.ready(f"{len(self.states)} accounts")
+        return True
+    
+    def activate(self, state):
+        """Live booster of an account, created and logged in on demand; None if login failed"""
+        booster = self.live.get(state.account_id)
+        if booster:
+            self.live.move_to_end(state.account_id)
+            return booster
+        
+        booster = FunPayBooster(state.config_file, managed=True, logger=self.logger)
+        booster.systemd = self.host.systemd
+        booster.browser_pool = self.pool
+        booster.account_id = state.account_id
+        self.live[state.account_id] = booster
+        booster.setup_chrome()
+        
+        # An evicted account gets its old session back instead of a fresh credential login
+        if state.session:
+            if booster.restore_session(state.session_cookies()):
+                return booster
+            state.session = None
+        if booster.setup_authentication() or booster.awaiting_credentials:
+            return booster
+        
+        self.logger.error(f"❌ Authentication failed for {state.account_id}")
+        self.release(state, keep_session=False)
+        return None
+    
+    def release(self, state, keep_session=True):
+        """Drop an account's booster and browser context, keeping only its AccountState"""
+        booster = self.live.pop(state.account_id, None)
+        if not booster:
+            return
+        if keep_session and not booster.awaiting_credentials:
+            state.keep_session(booster.session_cookies())
+        booster.close_browser_session()
+        if booster.config_watcher:
+            booster.config_watcher.close()
+        # Edits made while the booster was live are already applied
+        state.config_mtime = state.read_config_mtime()
+    
+    def evict(self):
+        """Release least recently used boosters above max_live_accounts"""
+        for account_id in list(self.live):
+            if len(self.live) <= self.max_live:
+                break
+            booster = self.live[account_id]
+            # The host owns the shared Chrome; parked accounts listen for cookies
+            if booster is self.host or booster.awaiting_credentials:
+                continue
+            self.release(self.states[account_id])
+    
+    def run(self):
+        """Check every account when it is due"""
+        self.logger.info(f"🚀 Starting multi-account mode with {len(self.states)} accounts")
+        if not self.setup():
+            return False
+        
+        try:
+            while True:
+                for state in self.states.values():
+                    if self.clock.time() < state.next_check:
+                        continue
+                    
+                    booster = self.live.get(state.account_id)
+                    # A parked account only polls for cookies - the others keep boosting
+                    if booster and booster.awaiting_credentials:
+                        if not booster.accept_dropped_cookies():
+                            state.next_check = self.clock.time() + booster.config.get('cookie_poll_interval', 5)
+                            continue
+                    
+                    booster = self.activate(state)
+                    if booster is None:
+                        state.next_check = self.clock.time() + 3600
+                        continue
+                    if booster.awaiting_credentials:
+                        state.next_check = self.clock.time() + booster.config.get('cookie_poll_interval', 5)
+                        continue
+                    
+                    result = booster.check_boost_status()
+                    state.result = result
+                    self.logger.info(f"👤 {state.account_id}: {result}")
+                    
+                    if result == "auth_failed":
+                        # Fresh context and login for this account only
+                        booster.close_browser_session()
+                        booster.setup_chrome()
+                        delay = 60 if booster.setup_authentication() or booster.awaiting_credentials else 3600
+                    else:
+                        # Per-lot cooldowns the site reported, the account's interval only when none did
+                        delay = max((booster.next_check_after(result) - booster.server_now()).total_seconds(), 0)
+                    state.next_check = self.clock.time() + delay
+                    self.evict()
+                
+                # Apply config edits - a schedule change makes the account due for a fresh check
+                for state in self.states.values():
+                    booster = self.live.get(state.account_id)
+                    if booster is None:
+                        # A released account reloads its config when it is next activated
+                        if state.config_changed():
+                            state.next_check = self.clock.time()
+                    elif booster.config_watcher and booster.config_watcher.changed():
+                        if booster.reload_config() & set(SCHEDULE_KEYS):
+                            state.next_check = booster.next_check_at or self.clock.time()
+                            booster.next_check_at = None
+                
+                self.host.systemd.expect_progress(self.host.config.get('loop_progress_timeout', 300))
+                next_check = min(state.next_check for state in self.states.values())
+                sleep_for = max(next_check - self.clock.time(), 1)
+                self.clock.sleep(min(sleep_for, self.host.config.get('config_poll_interval', 5)))
+        except KeyboardInterrupt:
+            self.logger.info("🛑 Multi-account daemon stopped by user")
+        finally:
+            self.cleanup()
+        return True
+    
+    def cleanup(self):
+        """Dispose all contexts and stop the shared Chrome"""
+        shared_driver = self.pool.driver if self.pool else self.host.driver
+        if self.pool:
+            self.pool.release_all()
+        for booster in self.live.values():
+            booster.browser_pool = None
+            booster.driver = None
+            if booster is not self.host and booster.config_watcher:
+                booster.config_watcher.close()
+        self.pool = None
+        
+        # Hand the shared driver back to the host so its cleanup stops Chrome
+        self.host.driver = shared_driver
+        self.host.cleanup()
+
+def account_worker(config_file, conn, index, heartbeat_interval=5):
+    """Worker process: owns one account's browser and runs boost cycles on request"""
+    stem = os.path.splitext(os.path.basename(config_file))[0]
+    booster = FunPayBooster(config_file, log_settings={
+        'console': False,
+        'boost_log': {'path': f"/var/log/funpay/boost-{stem}.log"}
+    })
+    
+    # Every worker gets its own display, debugging port and profile
+    booster.use_host_slot(index)
+    # Only the supervisor talks to systemd, and nobody answers a prompt
+    booster.systemd = SystemdNotifier(socket_path='', logger=booster.logger)
+    booster.interactive = False
+    
+    # Heartbeats come from the main loop itself (phases, idle ticks) - a hung call stops them
+    def heartbeat(window=None):
+        conn.send(('heartbeat', time.time(), window))
+    booster.progress_hook = heartbeat
+    startup_window = booster.config.get('startup_deadline', 600)
+    
+    try:
+        heartbeat(startup_window)
+        # A parked account is healthy - it waits for cookies instead of being restarted
+        ready = booster.setup_chrome() and (booster.setup_authentication() or booster.awaiting_credentials)
+        conn.send(('ready', bool(ready)))
+        if not ready:
+            return
+        
+        while True:
+            if not conn.poll(heartbeat_interval):
+                # Delivered cookies make the account due at once
+                if booster.awaiting_credentials and booster.accept_dropped_cookies():
+                    conn.send(('credentials',))
+                heartbeat()
+                continue
+            command = conn.recv()
+            if command[0] == 'stop':
+                break
+            if command[0] == 'check':
+                started = time.time()
+                if booster.awaiting_credentials and not booster.accept_dropped_cookies():
+                    conn.send(('result', "awaiting_credentials", time.time() - started))
+                    continue
+                result = booster.check_boost_status(queue_delay=command[1] if len(command) > 1 else None)
+                if result == "auth_failed":
+                    heartbeat(startup_window)
+                    if booster.setup_authentication():
+                        result = booster.check_boost_status()
+                # The worker knows its lots' cooldowns - the supervisor schedules by them
+                delay = max((booster.next_check_after(result) - booster.server_now()).total_seconds(), 0)
+                conn.send(('result', result, time.time() - started, delay))
+    finally:
+        booster.cleanup()
+
+class AccountSupervisor:
+    """Runs every account in its own worker process with heartbeats, deadlines and restarts"""
+    
+    def __init__(self, config_files, cycle_deadline=900, startup_deadline=600, heartbeat_timeout=60,
+                 max_restarts=5, restart_window=3600, governor_settings=None):
+        self.cycle_deadline = cycle_deadline
+        self.startup_deadline = startup_deadline
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_restarts = max_restarts
+        self.restart_window = restart_window
+        self.context = multiprocessing.get_context('spawn')
+        self.logger = logging.getLogger(__name__)
+        
+        # Workers log to their own files, the supervisor only to the console
+        logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+        self.running = True
+        
+        self.workers = []
+        for index, config_file in enumerate(config_files):
+            with open(config_file, 'r') as f:
+                config = json.load(f)
+            boost_interval = config.get('boost_interval', 3)
+            self.workers.append({
+                'config_file': config_file,
+                'index': index,
+                'boost_interval': boost_interval,
+                'process': None,
+                'conn': None,
+                'status': 'stopped',  # stopped, starting, idle, busy, backoff
+                'deadline': None,
+                'last_heartbeat': None,
+                'heartbeat_window': None,
+                'next_check': time.time(),
+                'restarts': [],
+                'backoff_until': 0,
+                'queue_delay': None
+            })
+        
+        # Browser starts and boost cycles wait their turn when the host is busy - host-wide limits, not per account
+        self.governor = ConcurrencyGovernor(**(governor_settings or {}))
+        self.governor_report_interval = 300
+        self.last_governor_report = 0
+        self.systemd = SystemdNotifier(logger=self.logger)
+        
+        signal.signal(signal.SIGINT, self.signal_handler)
+        signal.signal(signal.SIGTERM, self.signal_handler)
+    
+    def signal_handler(self, signum, frame):
+        self.logger.info(f"Received signal {signum}, stopping workers...")
+        self.running = False
+    
+    def start_worker(self, worker):
+        """Spawn the worker process for one account"""
+        parent_conn, child_conn = self.context.Pipe()
+        process = self.context.Process(
+            target=account_worker,
+            args=(worker['config_file'], child_conn, worker['index']),
+            daemon=True
+        )
+        process.start()
+        now = time.time()
+        worker.update({
+            'process': process,
+            'conn': parent_conn,
+            'status': 'starting',
+            'deadline': now + self.startup_deadline,
+            'last_heartbeat': now,
+            'heartbeat_window': self.startup_deadline
+        })
+        self.logger.info(f"👷 Started worker for {worker['config_file']} (PID: {process.pid})")
+    
+    def kill_worker(self, worker, reason):
+        """Kill a wedged worker and its browser, then schedule a restart"""
+        self.logger.warning(f"💀 Killing worker for {worker['config_file']}: {reason}")
+        process = worker['process']
+        if process and process.is_alive():
+            process.kill()
+            process.join(timeout=5)
+        
+        # The worker's Chrome and Xvfb run in their own sessions and survive it
+        try:
+            with open(account_state_file(worker['config_file'], 'browser_session'), 'r') as f:
+                state = json.load(f)
+            for pid in [state.get('chrome_pid'), state.get('xvfb_pid')]:
+                if pid:
+                    try:
+                        os.kill(pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+        except (FileNotFoundError, ValueError):
+            pass
+        except Exception as e:
+            self.logger.warning(f"Failed to stop browser of {worker['config_file']}: {e}")
+        
+        self.governor.cancel(worker['index'])
+        
+        # Restart policy: exponential backoff, give up for a while after too many restarts
+        now = time.time()
+        worker['restarts'] = [t for t in worker['restarts'] if now - t < self.restart_window] + [now]
+        if len(worker['restarts']) > self.max_restarts:
+            backoff = self.restart_window
+            self.logger.error(f"❌ {worker['config_file']} restarted too often, pausing for {backoff // 60} minutes")
+        else:
+            backoff = min(10 * (2 ** (len(worker['restarts']) - 1)), 600)
+        
+        worker.update({
+            'process': None,
+            'conn': None,
+            'status': 'backoff',
+            'deadline': None,
+            'backoff_until': now + backoff
+        })
+    
+    def handle_message(self, worker, message):
+        now = time.time()
+        worker['last_heartbeat'] = now
+        kind = message[0]
+        
+        # A heartbeat says how long until the worker's next check-in (a phase, an idle tick)
+        worker['heartbeat_window'] = message[2] if kind == 'heartbeat' and len(message) > 2 else None
+        
+        if kind == 'ready':
+            self.governor.release(worker['index'])
+            if message[1]:
+                # The idle worker keeps its browser and counts against max_sessions
+                self.governor.hold(worker['index'])
+                worker['status'] = 'idle'
+                worker['deadline'] = None
+            else:
+                self.kill_worker(worker, "startup or authentication failed")
+        elif kind == 'result':
+            self.governor.release(worker['index'])
+            result, duration = message[1], message[2]
+            queued = f", queued {worker['queue_delay']:.1f}s" if worker['queue_delay'] else ""
+            self.logger.info(f"👤 {worker['config_file']}: {result} ({duration:.1f}s{queued})")
+            worker['status'] = 'idle'
+            worker['deadline'] = None
+            delay = message[3] if len(message) > 3 else schedule_delay(result, worker['boost_interval'])
+            worker['next_check'] = now + delay
+        elif kind == 'credentials':
+            self.logger.info(f"🍪 {worker['config_file']}: new cookies accepted")
+            worker['next_check'] = now
+    
+    def poll_worker(self, worker):
+        """Read pending messages and enforce heartbeat and deadline"""
+        try:
+            while worker['conn'] and worker['conn'].poll():
+                self.handle_message(worker, worker['conn'].recv())
+        except (EOFError, OSError):
+            self.kill_worker(worker, "worker exited")
+            return
+        
+        if worker['status'] not in ('starting', 'idle', 'busy'):
+            return
+        
+        now = time.time()
+        if not worker['process'].is_alive():
+            self.kill_worker(worker, f"worker died (exit code {worker['process'].exitcode})")
+        elif now - worker['last_heartbeat'] > (worker['heartbeat_window'] or self.heartbeat_timeout):
+            self.kill_worker(worker, "heartbeat timeout")
+        elif worker['deadline'] and now > worker['deadline']:
+            self.kill_worker(worker, "cycle deadline exceeded")
+    
+    def run(self):
+        """Supervise workers until stopped"""
+        self.logger.info(f"🚀 Supervising {len(self.workers)} account workers")
+        self.systemd.ready(f"Supervising {len(self.workers)} account workers")
+        
+        try:
+            while self.running:
+                self.systemd.expect_progress(60)
+                now = time.time()
+                for worker in self.workers:
+                    # Due work is queued by the time it is due and admitted by the governor
+                    if worker['status'] in ('stopped', 'backoff') and now >= worker['backoff_until']:
+                        self.governor.request(worker['index'], 'start', max(worker['backoff_until'], worker['next_check']))
+                    
+                    self.poll_worker(worker)
+                    
+                    if worker['status'] == 'idle' and now >= worker['next_check']:
+                        self.governor.request(worker['index'], 'cycle', worker['next_check'])
+                
+                for index, kind, delay in self.governor.admit():
+                    worker = self.workers[index]
+                    if kind == 'start':
+                        self.start_worker(worker)
+                    else:
+                        worker['queue_delay'] = delay
+                        worker['conn'].send(('check', delay))
+                        worker['status'] = 'busy'
+                        worker['deadline'] = time.time() + self.cycle_deadline
+                
+                self.report_governor()
+                time.sleep(1)
+        finally:
+            self.systemd.stopping()
+            self.stop_all()
+        return True
+    
+    def report_governor(self):
+        """Log queueing delays now and then while work is waiting"""
+        now = time.time()
+        if now - self.last_governor_report < self.governor_report_interval:
+            return
+        stats = self.governor.stats()
+        if not stats['queued'] and not stats['queue_delay']['max']:
+            return
+        self.last_governor_report = now
+        self.logger.info(f"🚦 Governor: {self.governor.summary()}")
+        self.systemd.status(f"{len(self.workers)} account workers, {self.governor.summary()}")
+    
+    def stop_all(self):
+        """Ask workers to stop and kill the ones that do not"""
+        for worker in self.workers:
+            if worker['conn']:
+                try:
+                    worker['conn'].send(('stop',))
+                except Exception:
+                    pass
+        for worker in self.workers:
+            if worker['process']:
+                worker['process'].join(timeout=15)
+                if worker['process'].is_alive():
+                    self.kill_worker(worker, "did not stop")
 
 def main():
     """Main function"""
@@ -1468,8 +4861,54 @@ def main():
     parser.add_argument('--status', action='store_true', help='Show status (including background)')
     parser.add_argument('--setup', action='store_true', help='Run initial setup')
     parser.add_argument('--test', action='store_true', help='Test boost once')
+    parser.add_argument('--accounts', nargs='+', metavar='CONFIG',
+                        help='Run several accounts (one config file each) in one shared Chrome')
+    parser.add_argument('--workers', action='store_true',
+                        help='With --accounts: run every account in its own supervised worker process')
+    parser.add_argument('--max-sessions', type=int, metavar='N',
+                        help='With --workers: live browsers allowed at once (default: CPU count)')
+    parser.add_argument('--max-starts', type=int, metavar='N',
+                        help='With --workers: browsers starting at once (default: 2)')
+    parser.add_argument('--min-free-mb', type=int, metavar='MB',
+                        help='With --workers: memory to keep free after a new session (default: 512)')
+    parser.add_argument('--session-mb', type=int, metavar='MB',
+                        help='With --workers: memory set aside for a starting session (default: 400)')
+    parser.add_argument('--max-load', type=float, metavar='LOAD',
+                        help='With --workers: 1-minute load average per CPU allowed (default: 1.5)')
+    parser.add_argument('--once', action='store_true',
+                        help='Run a single boost check if one is due, record the next check and exit (for systemd timers)')
+    parser.add_argument('--emit-timer', action='store_true',
+                        help='Print a systemd service and timer that run --once')
+    parser.add_argument('--send-cookies', metavar='FILE',
+                        help='Hand new cookies (JSON or "name=value; ..." text, - for stdin) to the running daemon')
     args = parser.parse_args()
     
+    if args.emit_timer:
+        FunPayBooster(args.accounts[0] if args.accounts else '/etc/funpay/config.json').emit_timer_units(args.accounts)
+        return
+    
+    if args.once:
+        # Accounts run one after another, each with its own display, port and profile
+        results = []
+        for index, config_file in enumerate(args.accounts or ['/etc/funpay/config.json']):
+            booster = FunPayBooster(config_file)
+            if args.accounts:
+                booster.use_host_slot(index)
+            results.append(booster.run_once())
+            booster.stop_logging()
+        sys.exit(1 if "fatal" in results else 0)
+    
+    if args.accounts:
+        if args.workers:
+            governor_settings = {name: value for name, value in [
+                ('max_sessions', args.max_sessions), ('max_starts', args.max_starts),
+                ('min_free_mb', args.min_free_mb), ('session_mb', args.session_mb), ('max_load', args.max_load)
+            ] if value is not None}
+            AccountSupervisor(args.accounts, governor_settings=governor_settings).run()
+        else:
+            MultiAccountDaemon(args.accounts).run()
+        return
+    
     booster = FunPayBooster()
     
     try:
@@ -1492,13 +4931,16 @@ def main():
             
         elif args.restart:
             print("🔄 Restarting FunPay Auto Boost...")
-            booster.stop_background()
-            time.sleep(2)
+            # Keep the authenticated browser so the new daemon can reattach
+            booster.stop_background(preserve_browser=True)
             booster.start_background()
             
         elif args.status:
             booster.get_background_status()
             
+        elif args.send_cookies:
+            booster.send_cookies(args.send_cookies)
+            
         elif args.setup:
             booster.get_user_credentials()
             
@@ -1555,7 +4997,9 @@ def main():
     except Exception as e:
         print(f"❌ Fatal error: {e}")
     finally:
-        if not args.start:  # Don't cleanup if we're starting background
+        # Only clean up what this process started - a background daemon
+        # (or a browser handed over on --restart) must be left alone
+        if not args.start and booster.owns_resources():
             booster.cleanup()
 
 if __name__ == "__main__":
@@ -0,0 +1,536 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FunPay Auto Boost - Load Test
+Runs many simulated accounts against a local mock FunPay server and reports how the daemon scales
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import heapq
+import queue
+import random
+import calendar
+import tempfile
+import argparse
+import threading
+import multiprocessing
+import urllib.parse
+import urllib.request
+import urllib.error
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+
+from funpay_boost_ultimate import FunPayBooster
+from funpay_simulator import FakeDriver, percentile
+
+SITE_URL = "https://funpay.com"
+LOGIN_PATH = "/en/account/login"
+PASSWORD = "load-password"
+
+class ScaledClock:
+    """Wall clock running `speed` times faster, shared by the harness and the mock server"""
+
+    def __init__(self, speed=60.0, start=None, wall_start=None):
+        self.speed = speed
+        self.start = start or datetime(2026, 1, 1)
+        self.start_ts = calendar.timegm(self.start.timetuple())
+        self.wall_start = wall_start if wall_start is not None else time.time()
+
+    def elapsed(self):
+        return (time.time() - self.wall_start) * self.speed
+
+    def time(self):
+        return self.start_ts + self.elapsed()
+
+    def utcnow(self):
+        return self.start + timedelta(seconds=self.elapsed())
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds / self.speed)
+
+class MockFunPaySite:
+    """Per-account raise cooldowns, sessions and injected faults"""
+
+    def __init__(self, clock, cooldown_minutes=240, latency=0.0, failure_rate=0.0, logout_rate=0.0, seed=1):
+        self.clock = clock
+        self.cooldown = cooldown_minutes * 60
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.logout_rate = logout_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.available_at = {}  # golden_key -> simulated timestamp
+        self.expired = set()    # golden_keys whose session ends until the next login
+        self.stats = {'requests': 0, 'page_loads': 0, 'logins': 0, 'raises': 0, 'failures': 0, 'logouts': 0}
+
+    def roll(self, rate):
+        with self.lock:
+            return self.rng.random() < rate
+
+    def count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+    def wait_minutes(self, golden_key):
+        remaining = self.available_at.get(golden_key, 0) - self.clock.time()
+        return max(1, math.ceil(remaining / 60)) if remaining > 0 else 0
+
+    def raise_offers(self, golden_key):
+        with self.lock:
+            if self.available_at.get(golden_key, 0) > self.clock.time():
+                return False
+            self.available_at[golden_key] = self.clock.time() + self.cooldown
+            self.stats['raises'] += 1
+            return True
+
+class MockFunPayHandler(BaseHTTPRequestHandler):
+    """Just enough of FunPay for the booster: login, lot pages and the raise request"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def site(self):
+        return self.server.site
+
+    def golden_key(self):
+        cookies = {}
+        for part in (self.headers.get('Cookie') or '').split(';'):
+            if '=' in part:
+                name, value = part.strip().split('=', 1)
+                cookies[name] = value
+        return cookies.get('golden_key')
+
+    def reply(self, status, body='', content_type='text/html; charset=utf-8', headers=None):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def start(self):
+        """Latency and random failures shared by every endpoint; False when the request fails"""
+        self.site.count('requests')
+        if self.site.latency:
+            time.sleep(self.site.latency * (0.5 + self.site.rng.random()))
+        if self.site.roll(self.site.failure_rate):
+            self.site.count('failures')
+            self.reply(503, "<html><body>Service temporarily unavailable</body></html>")
+            return False
+        return True
+
+    def do_GET(self):
+        path = urllib.parse.urlsplit(self.path).path
+        if path == '/stats':
+            with self.site.lock:
+                self.reply(200, json.dumps(self.site.stats), 'application/json')
+            return
+        if not self.start():
+            return
+
+        if path == LOGIN_PATH:
+            self.reply(200, "<html><body><form method='post'><input name='login'><input name='password' type='password'>"
+                            "<button type='submit'>Log in</button></form></body></html>")
+            return
+
+        if path.startswith('/en/lots/'):
+            self.site.count('page_loads')
+            golden_key = self.golden_key()
+            if golden_key and golden_key not in self.site.expired and self.site.roll(self.site.logout_rate):
+                self.site.expired.add(golden_key)
+                self.site.count('logouts')
+            if not golden_key or golden_key in self.site.expired:
+                self.reply(302, headers={'Location': LOGIN_PATH})
+                return
+
+            wait = self.site.wait_minutes(golden_key)
+            if wait:
+                content = f"<div class='ajax-alert ajax-alert-danger'>Please wait {wait} minutes.</div>"
+            else:
+                content = "<button class='btn btn-default js-lot-raise'>Boost offers</button>"
+            self.reply(200, f"<html><body><div class='tc table-hover'>{content}</div></body></html>")
+            return
+
+        self.reply(200, "<html><body>FunPay</body></html>")
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        form = urllib.parse.parse_qs(self.rfile.read(length).decode('utf-8'))
+        if not self.start():
+            return
+
+        path = urllib.parse.urlsplit(self.path).path
+        if path == LOGIN_PATH:
+            login = (form.get('login') or [''])[0]
+            if login.startswith('acct-') and (form.get('password') or [''])[0] == PASSWORD:
+                golden_key = f"key-{login[5:]}"
+                self.site.expired.discard(golden_key)
+                self.site.count('logins')
+                self.reply(200, json.dumps({'ok': True}), 'application/json',
+                           {'Set-Cookie': f"golden_key={golden_key}; Path=/"})
+            else:
+                self.reply(200, json.dumps({'ok': False}), 'application/json')
+            return
+
+        if path == '/lots/raise':
+            golden_key = self.golden_key()
+            if not golden_key or golden_key in self.site.expired:
+                self.reply(200, json.dumps({'error': 1, 'msg': 'Log in'}), 'application/json')
+                return
+            self.site.raise_offers(golden_key)
+            self.reply(200, json.dumps({'msg': f"Please wait {self.site.wait_minutes(golden_key)} minutes."}),
+                       'application/json')
+            return
+
+        self.reply(404, "<html><body>Not found</body></html>")
+
+def serve(port_queue, speed, wall_start, cooldown_minutes, latency, failure_rate, logout_rate, seed):
+    """Mock server process entry point - reports its port and serves until terminated"""
+    clock = ScaledClock(speed, wall_start=wall_start)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MockFunPayHandler)
+    server.daemon_threads = True
+    server.site = MockFunPaySite(clock, cooldown_minutes, latency, failure_rate, logout_rate, seed)
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+class HttpDriver(FakeDriver):
+    """WebDriver stand-in that loads pages from the mock server over HTTP"""
+
+    def __init__(self, base_url, timeout=30):
+        super().__init__(site=None)
+        self.base_url = base_url
+        self.timeout = timeout
+        self.cookies = {}
+        self.html = ''
+        self.opener = urllib.request.build_opener()
+        # DevTools network events of the raise request, read back like Chrome's performance log
+        self.performance_log = []
+        self.response_bodies = {}
+
+    def _request(self, url, form=None):
+        target = url.replace(SITE_URL, self.base_url, 1) if url.startswith(SITE_URL) else url
+        data = urllib.parse.urlencode(form).encode('utf-8') if form is not None else None
+        request = urllib.request.Request(target, data=data)
+        if self.cookies:
+            request.add_header('Cookie', '; '.join(f"{name}={value}" for name, value in self.cookies.items()))
+        try:
+            with self.opener.open(request, timeout=self.timeout) as response:
+                for header in response.headers.get_all('Set-Cookie') or []:
+                    name, value = header.split(';', 1)[0].split('=', 1)
+                    self.cookies[name.strip()] = value.strip()
+                return response.geturl().replace(self.base_url, SITE_URL, 1), response.read().decode('utf-8')
+        except urllib.error.HTTPError as e:
+            raise WebDriverException(f"HTTP {e.code} loading {url}")
+        except OSError as e:
+            raise WebDriverException(f"connection to mock FunPay failed: {e}")
+
+    # Session / navigation
+    def quit(self):
+        self.cookies = {}
+
+    def get(self, url):
+        self.elements = {}
+        self.message = ''
+        self.current_url, self.html = self._request(url)
+
+    def refresh(self):
+        self.get(self.current_url)
+
+    def delete_all_cookies(self):
+        self.cookies = {}
+
+    def add_cookie(self, cookie):
+        self.cookies[cookie['name']] = cookie['value']
+
+    def get_cookies(self):
+        return [{'name': name, 'value': value, 'domain': '.funpay.com', 'path': '/'}
+                for name, value in self.cookies.items()]
+
+    def get_log(self, log_type):
+        entries, self.performance_log = self.performance_log, []
+        return entries
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        if cmd == 'Network.getResponseBody':
+            return {'body': self.response_bodies.pop(cmd_args['requestId']), 'base64Encoded': False}
+        raise WebDriverException(f"unsupported CDP command {cmd}")
+
+    def _network_event(self, method, params):
+        self.performance_log.append({'message': json.dumps({'message': {'method': method, 'params': params}})})
+
+    @property
+    def page_source(self):
+        return self.html + (f"<div class='ajax-alert'>{self.message}</div>" if self.message else '')
+
+    # Elements
+    def find_element(self, by='id', value=None):
+        if LOGIN_PATH in self.current_url:
+            if value in ('login', 'password'):
+                return self._element(value)
+            if 'submit' in (value or ''):
+                return self._element('submit')
+        raise NoSuchElementException(f"{by}={value}")
+
+    def find_elements(self, by='id', value=None):
+        if '/lots/' in self.current_url and 'js-lot-raise' in self.html and 'boost' in (value or ''):
+            return [self._element('boost')]
+        return []
+
+    def on_click(self, element):
+        if element.kind == 'submit':
+            username = self.elements.get('login')
+            password = self.elements.get('password')
+            _, body = self._request(SITE_URL + LOGIN_PATH, {
+                'login': username.value if username else '',
+                'password': password.value if password else ''
+            })
+            if json.loads(body).get('ok'):
+                self.current_url = SITE_URL + '/en/'
+        elif element.kind == 'boost':
+            url, body = self._request(SITE_URL + '/lots/raise', {})
+            request_id = f"raise-{len(self.response_bodies)}-{id(element)}"
+            self.response_bodies[request_id] = body
+            self._network_event('Network.responseReceived',
+                                {'requestId': request_id, 'response': {'url': url, 'status': 200}})
+            self._network_event('Network.loadingFinished', {'requestId': request_id})
+            self.message = json.loads(body).get('msg', '')
+
+def own_rss():
+    """Resident memory of this process in bytes"""
+    with open('/proc/self/statm', 'r') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+def create_boosters(count, work_dir, base_url, clock, seed, log_level):
+    """One booster per simulated account, sharing a single log pipeline like multi-account mode"""
+    boosters = []
+    # Requests take real time while deadlines run on the scaled clock - keep the default budgets in real seconds
+    cycle_deadline = 600 * clock.speed
+    phase_deadlines = {name: budget * clock.speed for name, budget in
+                       {'navigate': 180, 'inspect': 60, 'boost': 120}.items()}
+    log_settings = {'console': False, 'level': log_level,
+                    'boost_log': {'path': os.path.join(work_dir, 'boost.log')}}
+    for index in range(count):
+        config_file = os.path.join(work_dir, f"acct-{index}", 'config.json')
+        os.makedirs(os.path.dirname(config_file), exist_ok=True)
+        with open(config_file, 'w') as f:
+            json.dump({
+                'username': f"acct-{index}",
+                'password': PASSWORD,
+                'target_url': f"{SITE_URL}/en/lots/{1000 + index}/trade",
+                'boost_interval': 3,
+                'cookies': [{'name': 'golden_key', 'value': f"key-{index}"}],
+                'last_boost': None,
+                'server_clock_url': None,
+                'cycle_deadline': cycle_deadline,
+                'phase_deadlines': phase_deadlines
+            }, f)
+
+        # The first account owns the log pipeline, the others log through its logger
+        booster = FunPayBooster(
+            config_file=config_file,
+            log_settings=log_settings,
+            clock=clock,
+            rng=random.Random(seed + index),
+            driver_factory=lambda: HttpDriver(base_url),
+            managed=bool(boosters),
+            logger=boosters[0].logger if boosters else None
+        )
+        booster.telegram = None
+        booster.exclusive_host = False
+        booster.interactive = False
+        # Thousands of inotify watches would exhaust the descriptor limit
+        booster.config_watcher.close()
+        booster.config_watcher = None
+        booster.account_id = booster.config['username']
+        boosters.append(booster)
+    return boosters
+
+def run_load(accounts, hours=6, speed=600, workers=16, cooldown_minutes=240, latency=0.0, failure_rate=0.0,
+             logout_rate=0.0, seed=1, log_level='WARNING', work_dir=None):
+    """Run `accounts` boosters against a fresh mock server for `hours` simulated hours"""
+    work_dir = work_dir or tempfile.mkdtemp(prefix='funpay_load_')
+    clock = ScaledClock(speed)
+
+    context = multiprocessing.get_context('spawn')
+    port_queue = context.Queue()
+    server = context.Process(target=serve, daemon=True, args=(
+        port_queue, speed, clock.wall_start, cooldown_minutes, latency, failure_rate, logout_rate, seed
+    ))
+    server.start()
+    base_url = f"http://127.0.0.1:{port_queue.get(timeout=30)}"
+
+    boosters = []
+    try:
+        rss_before = own_rss()
+        boosters = create_boosters(accounts, work_dir, base_url, clock, seed, log_level)
+        rss_created = own_rss()
+
+        # Auth path: start a "browser" and log in every account
+        auth_started = time.perf_counter()
+        authenticated = 0
+        for booster in boosters:
+            if booster.setup_chrome() and booster.setup_authentication():
+                authenticated += 1
+        auth_seconds = time.perf_counter() - auth_started
+        rss_authenticated = own_rss()
+
+        # Scheduling path: deadline ordered queue drained by a worker pool
+        horizon = clock.time() + hours * 3600
+        due = [(clock.time(), index) for index in range(accounts)]
+        heapq.heapify(due)
+        lock = threading.Lock()
+        ready = queue.Queue()
+        results = {}
+        lags = []
+        cycle_seconds = []
+
+        def _cycle(index, due_at):
+            booster = boosters[index]
+            started = clock.time()
+            real_started = time.perf_counter()
+            try:
+                result = booster.check_boost_status()
+                if result == "auth_failed":
+                    next_check = clock.time() + (60 if booster.setup_authentication() else 3600)
+                else:
+                    next_check = calendar.timegm(booster.next_check_after(result).timetuple())
+            except Exception as e:
+                result = f"exception: {type(e).__name__}"
+                next_check = clock.time() + 1800
+            with lock:
+                lags.append((started - due_at) / speed)
+                cycle_seconds.append(time.perf_counter() - real_started)
+                results[result] = results.get(result, 0) + 1
+                if next_check < horizon:
+                    heapq.heappush(due, (next_check, index))
+
+        def _worker():
+            while True:
+                item = ready.get()
+                if item is None:
+                    return
+                _cycle(*item)
+
+        cpu_started = time.process_time()
+        run_started = time.perf_counter()
+        threads = [threading.Thread(target=_worker, daemon=True) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+
+        # Hand due accounts to the workers; workers push each account's next deadline back
+        while clock.time() < horizon:
+            with lock:
+                now = clock.time()
+                while due and due[0][0] <= now:
+                    due_at, index = heapq.heappop(due)
+                    ready.put((index, due_at))
+            time.sleep(0.01)
+        for thread in threads:
+            ready.put(None)
+        for thread in threads:
+            thread.join()
+
+        run_seconds = time.perf_counter() - run_started
+        cpu_seconds = time.process_time() - cpu_started
+        with urllib.request.urlopen(f"{base_url}/stats", timeout=30) as response:
+            site_stats = json.loads(response.read().decode('utf-8'))
+    finally:
+        for booster in boosters:
+            booster.stop_logging()
+        server.terminate()
+        server.join()
+
+    checks = sum(results.values())
+    boosts = results.get('success', 0)
+    return {
+        'accounts': accounts,
+        'authenticated': authenticated,
+        'auth_per_second': round(accounts / auth_seconds, 1) if auth_seconds else 0.0,
+        'simulated_hours': hours,
+        'real_seconds': round(run_seconds, 1),
+        'checks': checks,
+        'boosts': boosts,
+        'results': results,
+        'checks_per_second': round(checks / run_seconds, 1) if run_seconds else 0.0,
+        'boosts_per_second': round(boosts / run_seconds, 1) if run_seconds else 0.0,
+        'scheduler_lag_seconds': {
+            'p50': round(percentile(lags, 0.5), 3),
+            'p95': round(percentile(lags, 0.95), 3),
+            'max': round(max(lags), 3) if lags else 0.0
+        },
+        'cycle_seconds_p50': round(percentile(cycle_seconds, 0.5), 4),
+        'memory_per_account_kb': {
+            'idle': round((rss_created - rss_before) / accounts / 1024, 1),
+            'authenticated': round((rss_authenticated - rss_before) / accounts / 1024, 1)
+        },
+        'cpu_ms_per_boost': round(cpu_seconds * 1000 / boosts, 2) if boosts else None,
+        'site': site_stats,
+        'work_dir': work_dir
+    }
+
+def print_report(reports):
+    """Print one row per fleet size"""
+    print("╔══════════════════════════════════════════════════════════════╗")
+    print("║                FunPay Auto Boost - Load Test                 ║")
+    print("╚══════════════════════════════════════════════════════════════╝")
+    print("")
+    print(f"{'accounts':>8} {'auth/s':>8} {'checks':>7} {'boosts':>7} {'boosts/s':>9} "
+          f"{'lag p50':>8} {'lag p95':>8} {'lag max':>8} {'KB/acct':>8} {'CPU ms/boost':>13}")
+    for report in reports:
+        lag = report['scheduler_lag_seconds']
+        cpu = report['cpu_ms_per_boost']
+        print(f"{report['accounts']:>8} {report['auth_per_second']:>8} {report['checks']:>7} {report['boosts']:>7} "
+              f"{report['boosts_per_second']:>9} {lag['p50']:>7}s {lag['p95']:>7}s {lag['max']:>7}s "
+              f"{report['memory_per_account_kb']['authenticated']:>8} {cpu if cpu is not None else '-':>13}")
+    print("")
+    for report in reports:
+        results = ', '.join(f"{name} {count}" for name, count in sorted(report['results'].items()))
+        print(f"👥 {report['accounts']}: {results} | site: {report['site']['raises']} raises, "
+              f"{report['site']['failures']} failures, {report['site']['logouts']} logouts")
+    print("")
+    print("Scheduler lag is in real seconds; every other figure is per real second of the run.")
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='FunPay Auto Boost - Load test against a mock FunPay server')
+    parser.add_argument('--accounts', type=int, nargs='+', default=[10, 100, 1000], help='Fleet sizes to run')
+    parser.add_argument('--hours', type=float, default=6, help='Simulated hours per fleet size')
+    parser.add_argument('--speed', type=float, default=600, help='Simulated seconds per real second')
+    parser.add_argument('--workers', type=int, default=16, help='Concurrent boost cycles')
+    parser.add_argument('--cooldown', type=int, default=240, help='Raise cooldown in minutes')
+    parser.add_argument('--latency', type=float, default=0.0, help='Mean server latency in real seconds')
+    parser.add_argument('--failure-rate', type=float, default=0.0, help='Chance a request fails with HTTP 503')
+    parser.add_argument('--logout-rate', type=float, default=0.0, help='Chance a lot page finds the session expired')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed')
+    parser.add_argument('--log-level', default='WARNING', help='Booster log level')
+    parser.add_argument('--json', action='store_true', help='Print the reports as JSON')
+    args = parser.parse_args()
+
+    reports = [
+        run_load(
+            accounts, hours=args.hours, speed=args.speed, workers=args.workers, cooldown_minutes=args.cooldown,
+            latency=args.latency, failure_rate=args.failure_rate, logout_rate=args.logout_rate,
+            seed=args.seed, log_level=args.log_level
+        )
+        for accounts in args.accounts
+    ]
+
+    if args.json:
+        print(json.dumps(reports, indent=2))
+    else:
+        print_report(reports)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
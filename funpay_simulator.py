@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FunPay Auto Boost - Simulator
+Replays weeks of daemon behaviour in seconds with a simulated clock and a fake browser
+"""
+
+import os
+import sys
+import json
+import math
+import random
+import tempfile
+import argparse
+from datetime import datetime, timedelta
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+
+from funpay_boost_ultimate import FunPayBooster
+
+LOGIN_URL = "https://funpay.com/en/account/login"
+TARGET_URL = "https://funpay.com/en/lots/1/trade"
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+class SimulatedClock:
+    """Clock whose sleep() advances simulated time instantly"""
+
+    def __init__(self, start=None, on_sleep=None):
+        self.start = start or datetime(2026, 1, 1)
+        self.elapsed = 0.0
+        self.on_sleep = on_sleep
+
+    def time(self):
+        return self.start.timestamp() + self.elapsed
+
+    def utcnow(self):
+        return self.start + timedelta(seconds=self.elapsed)
+
+    def sleep(self, seconds):
+        self.elapsed += max(seconds, 0)
+        if self.on_sleep:
+            self.on_sleep()
+
+class SimulatedFunPay:
+    """Scripted FunPay site: raise cooldown plus random page outcomes"""
+
+    def __init__(self, clock, rng, cooldown_minutes=240, error_rate=0.0, logout_rate=0.0,
+                 credentials_work=True):
+        self.clock = clock
+        self.rng = rng
+        self.cooldown = timedelta(minutes=cooldown_minutes)
+        self.error_rate = error_rate
+        self.logout_rate = logout_rate
+        self.credentials_work = credentials_work
+        self.username = 'sim_user'
+        self.password = 'sim_password'
+        self.cookies = [{'name': 'golden_key', 'value': 'sim_key', 'domain': '.funpay.com', 'path': '/'}]
+
+        self.available_at = clock.utcnow()
+        self.authenticated = False
+
+        # Metrics
+        self.page_loads = 0
+        self.wasted_page_loads = 0
+        self.boosts = []  # (available_at, boosted_at)
+        self.fault_started = None
+        self.recovery_times = []
+
+    def can_boost(self):
+        return self.clock.utcnow() >= self.available_at
+
+    def wait_minutes(self):
+        remaining = (self.available_at - self.clock.utcnow()).total_seconds()
+        return max(1, math.ceil(remaining / 60))
+
+    def raise_offers(self):
+        now = self.clock.utcnow()
+        self.boosts.append((self.available_at, now))
+        self.available_at = now + self.cooldown
+
+    def fault(self):
+        if self.fault_started is None:
+            self.fault_started = self.clock.utcnow()
+
+    def recovered(self):
+        if self.fault_started is not None:
+            self.recovery_times.append((self.clock.utcnow() - self.fault_started).total_seconds())
+            self.fault_started = None
+
+    def load_target(self):
+        """Decide the outcome of one boost page load"""
+        self.page_loads += 1
+        roll = self.rng.random()
+
+        if roll < self.error_rate:
+            self.wasted_page_loads += 1
+            self.fault()
+            raise WebDriverException("simulated page load timeout")
+
+        if roll < self.error_rate + self.logout_rate:
+            self.authenticated = False
+
+        if not self.authenticated:
+            self.wasted_page_loads += 1
+            self.fault()
+            return LOGIN_URL
+
+        self.recovered()
+        if not self.can_boost():
+            self.wasted_page_loads += 1
+        return TARGET_URL
+
+class FakeElement(WebElement):
+    """Element of the fake page"""
+
+    def __init__(self, driver, kind):
+        super().__init__(driver, f"{kind}-{id(self)}")
+        self.kind = kind
+        self.value = ''
+
+    def clear(self):
+        self.value = ''
+
+    def send_keys(self, *value):
+        self.value += ''.join(value)
+
+    def click(self):
+        self._parent.on_click(self)
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+class FakeDriver:
+    """Minimal WebDriver stand-in driven by a SimulatedFunPay"""
+
+    def __init__(self, site):
+        self.site = site
+        self.current_url = 'about:blank'
+        self.message = ''
+        self.elements = {}
+        self.added_cookies = []
+
+    # Session / navigation
+    def set_page_load_timeout(self, timeout):
+        pass
+
+    def implicitly_wait(self, timeout):
+        pass
+
+    def quit(self):
+        self.site.authenticated = False
+
+    def get(self, url):
+        self.elements = {}
+        self.message = ''
+        if 'account/login' in url:
+            self.current_url = LOGIN_URL if not self.site.authenticated else 'https://funpay.com/en/'
+        elif '/lots/' in url:
+            self.current_url = self.site.load_target()
+            if self.current_url == TARGET_URL and not self.site.can_boost():
+                self.message = f"Please wait {self.site.wait_minutes()} minutes"
+        else:
+            self.current_url = url
+
+    def refresh(self):
+        if self.added_cookies and self.added_cookies[-1:] == self.site.cookies[-1:]:
+            self.site.authenticated = True
+
+    def delete_all_cookies(self):
+        self.added_cookies = []
+
+    def add_cookie(self, cookie):
+        self.added_cookies.append(cookie)
+
+    @property
+    def page_source(self):
+        if self.current_url.startswith('data:'):
+            return self.current_url
+        return f"<html><body><div class='alert'>{self.message}</div></body></html>"
+
+    # Elements
+    def _element(self, kind):
+        element = self.elements.get(kind)
+        if element is None:
+            element = self.elements[kind] = FakeElement(self, kind)
+        return element
+
+    def find_element(self, by=By.ID, value=None):
+        if self.current_url == LOGIN_URL:
+            if by == By.NAME and value in ('login', 'password'):
+                return self._element(value)
+            if by == By.XPATH and 'submit' in value:
+                return self._element('submit')
+        raise NoSuchElementException(f"{by}={value}")
+
+    def find_elements(self, by=By.ID, value=None):
+        if (self.current_url == TARGET_URL and not self.message
+                and self.site.can_boost() and 'boost' in (value or '')):
+            return [self._element('boost')]
+        return []
+
+    def execute_script(self, script, *args):
+        return None
+
+    def execute(self, command, params=None):
+        # ActionChains.perform() - a pointer down over an element is a click
+        if command == Command.W3C_ACTIONS:
+            for source in (params or {}).get('actions', []):
+                target = None
+                for action in source.get('actions', []):
+                    origin = action.get('origin')
+                    if isinstance(origin, dict) and ELEMENT_KEY in origin:
+                        target = origin[ELEMENT_KEY]
+                    if action.get('type') == 'pointerDown' and target:
+                        for element in self.elements.values():
+                            if element.id == target:
+                                self.on_click(element)
+        return {'value': None}
+
+    def on_click(self, element):
+        if element.kind == 'submit':
+            username = self.elements.get('login')
+            password = self.elements.get('password')
+            if (self.site.credentials_work and username and password
+                    and username.value == self.site.username and password.value == self.site.password):
+                self.site.authenticated = True
+                self.current_url = 'https://funpay.com/en/'
+        elif element.kind == 'boost' and self.site.can_boost():
+            self.site.raise_offers()
+            self.message = f"Please wait {self.site.wait_minutes()} minutes"
+
+def percentile(values, fraction):
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def run_simulation(days=30, seed=1, cooldown_minutes=240, boost_interval=3, error_rate=0.0,
+                   logout_rate=0.0, credentials_work=True, work_dir=None, clock=None):
+    """Run the real daemon loop against the simulated site and return a report"""
+    work_dir = work_dir or tempfile.mkdtemp(prefix='funpay_sim_')
+    config_file = os.path.join(work_dir, 'config.json')
+
+    rng = random.Random(seed)
+    clock = clock or SimulatedClock()
+    end = clock.utcnow() + timedelta(days=days)
+    site = SimulatedFunPay(clock, random.Random(seed + 1), cooldown_minutes,
+                           error_rate, logout_rate, credentials_work)
+
+    with open(config_file, 'w') as f:
+        json.dump({
+            'username': site.username,
+            'password': site.password,
+            'target_url': TARGET_URL,
+            'boost_interval': boost_interval,
+            'cookies': site.cookies,
+            'last_boost': None,
+            # The simulated site shares the simulated clock - no offset to measure
+            'server_clock_url': None
+        }, f)
+
+    booster = FunPayBooster(
+        config_file=config_file,
+        log_settings={'console': False, 'boost_log': {'path': os.path.join(work_dir, 'boost.log')}},
+        clock=clock,
+        rng=rng,
+        driver_factory=lambda: FakeDriver(site)
+    )
+    booster.telegram = None
+    # Nobody edits the config during a simulation - skip the idle-time file checks
+    booster.config_watcher = None
+
+    # The operator answers cookie prompts instantly with valid cookies
+    booster.interactive = True
+    booster.get_cookies_from_user = lambda: site.cookies
+
+    def _stop_at_horizon():
+        if clock.utcnow() >= end:
+            booster.running = False
+    clock.on_sleep = _stop_at_horizon
+
+    try:
+        booster.run_daemon()
+    finally:
+        booster.stop_logging()
+
+    slips = [(boosted - available).total_seconds() / 60 for available, boosted in site.boosts]
+    possible = int(days * 24 * 60 // cooldown_minutes)
+
+    return {
+        'days': days,
+        'seed': seed,
+        'boosts': len(site.boosts),
+        'possible_boosts': possible,
+        'slip_minutes': {
+            'mean': round(sum(slips) / len(slips), 1) if slips else 0.0,
+            'p50': round(percentile(slips, 0.5), 1),
+            'p95': round(percentile(slips, 0.95), 1),
+            'max': round(max(slips), 1) if slips else 0.0
+        },
+        'page_loads': site.page_loads,
+        'wasted_page_loads': site.wasted_page_loads,
+        'recovery_minutes': {
+            'count': len(site.recovery_times),
+            'mean': round(sum(site.recovery_times) / len(site.recovery_times) / 60, 1) if site.recovery_times else 0.0,
+            'max': round(max(site.recovery_times) / 60, 1) if site.recovery_times else 0.0
+        },
+        'work_dir': work_dir
+    }
+
+def print_report(report):
+    """Print a simulation report"""
+    print("╔══════════════════════════════════════════════════════════════╗")
+    print("║                FunPay Auto Boost - Simulation                ║")
+    print("╚══════════════════════════════════════════════════════════════╝")
+    print("")
+    print(f"📅 Simulated days: {report['days']} (seed {report['seed']})")
+    print(f"🎯 Boosts: {report['boosts']} / {report['possible_boosts']} possible")
+    slip = report['slip_minutes']
+    print(f"⏱️ Boost slip: mean {slip['mean']}m, p50 {slip['p50']}m, p95 {slip['p95']}m, max {slip['max']}m")
+    print(f"📄 Page loads: {report['page_loads']} ({report['wasted_page_loads']} wasted)")
+    recovery = report['recovery_minutes']
+    print(f"🔄 Recoveries: {recovery['count']}, mean {recovery['mean']}m, max {recovery['max']}m")
+    print(f"📁 Logs: {report['work_dir']}")
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='FunPay Auto Boost - Simulated clock harness')
+    parser.add_argument('--days', type=float, default=30, help='Simulated days to replay')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed')
+    parser.add_argument('--cooldown', type=int, default=240, help='Site raise cooldown in minutes')
+    parser.add_argument('--interval', type=float, default=3, help='Configured boost_interval in hours')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Chance a page load fails')
+    parser.add_argument('--logout-rate', type=float, default=0.0, help='Chance the session expires on a page load')
+    parser.add_argument('--bad-credentials', action='store_true', help='Credential login always fails')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args()
+
+    report = run_simulation(
+        days=args.days,
+        seed=args.seed,
+        cooldown_minutes=args.cooldown,
+        boost_interval=args.interval,
+        error_rate=args.error_rate,
+        logout_rate=args.logout_rate,
+        credentials_work=not args.bad_credentials
+    )
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FunPay Auto Boost - systemd Check
+Runs the daemon loop against a local notify-socket stand-in and checks READY, WATCHDOG and STATUS
+"""
+
+import os
+import sys
+import json
+import socket
+import tempfile
+import argparse
+
+from funpay_simulator import SimulatedClock, run_simulation
+
+class NotifySocketStandIn:
+    """Local $NOTIFY_SOCKET that records sd_notify datagrams with the daemon's clock time"""
+
+    def __init__(self, path):
+        self.path = path
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.bind(path)
+        self.sock.setblocking(False)
+        self.messages = []  # (time, {field: value})
+
+    def drain(self, now):
+        """Record every datagram sent so far"""
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except BlockingIOError:
+                return
+            fields = dict(line.split('=', 1) for line in data.decode('utf-8').splitlines() if '=' in line)
+            self.messages.append((now, fields))
+
+    def close(self):
+        self.sock.close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+class StampingClock(SimulatedClock):
+    """Simulated clock that collects notifications before each sleep, i.e. at the time they were sent"""
+
+    def __init__(self, stand_in):
+        super().__init__()
+        self.stand_in = stand_in
+
+    def sleep(self, seconds):
+        self.stand_in.drain(self.time())
+        super().sleep(seconds)
+
+def check_notifications(messages, watchdog_sec):
+    """READY/STATUS/WATCHDOG findings - late pings are gaps longer than the window the daemon announced"""
+    pings = [(at, fields) for at, fields in messages if fields.get('WATCHDOG') == '1']
+    windows = []
+    late = []
+    for (at, fields), (next_at, _) in zip(pings, pings[1:]):
+        window = int(fields.get('WATCHDOG_USEC', watchdog_sec * 1e6)) / 1e6
+        windows.append(window)
+        if next_at - at > window:
+            late.append({'at': at, 'gap': round(next_at - at, 1), 'window': window})
+
+    windows.sort()
+    return {
+        'ready': any(fields.get('READY') == '1' for _, fields in messages),
+        'statuses': len([1 for _, fields in messages if 'STATUS' in fields]),
+        'last_status': next((fields['STATUS'] for _, fields in reversed(messages) if 'STATUS' in fields), None),
+        'pings': len(pings),
+        'late_pings': late,
+        'window_seconds': {
+            'p50': windows[len(windows) // 2] if windows else None,
+            'max': windows[-1] if windows else None
+        }
+    }
+
+def run_check(days=1, seed=1, watchdog_sec=120, error_rate=0.0, logout_rate=0.0):
+    """Run the simulated daemon with NOTIFY_SOCKET pointed at a stand-in and check what it sent"""
+    work_dir = tempfile.mkdtemp(prefix='funpay_notify_')
+    stand_in = NotifySocketStandIn(os.path.join(work_dir, 'notify.sock'))
+    clock = StampingClock(stand_in)
+
+    saved = {name: os.environ.get(name) for name in ('NOTIFY_SOCKET', 'WATCHDOG_USEC', 'WATCHDOG_PID')}
+    os.environ['NOTIFY_SOCKET'] = stand_in.path
+    os.environ['WATCHDOG_USEC'] = str(int(watchdog_sec * 1e6))
+    os.environ.pop('WATCHDOG_PID', None)
+    try:
+        simulation = run_simulation(days=days, seed=seed, error_rate=error_rate, logout_rate=logout_rate,
+                                    work_dir=work_dir, clock=clock)
+        stand_in.drain(clock.time())
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        stand_in.close()
+
+    report = check_notifications(stand_in.messages, watchdog_sec)
+    report.update({'days': days, 'seed': seed, 'boosts': simulation['boosts'], 'work_dir': work_dir})
+    return report
+
+def print_report(report):
+    """Print a check report"""
+    print("╔══════════════════════════════════════════════════════════════╗")
+    print("║               FunPay Auto Boost - systemd Check              ║")
+    print("╚══════════════════════════════════════════════════════════════╝")
+    print("")
+    print(f"{'✅' if report['ready'] else '❌'} READY=1 {'sent' if report['ready'] else 'never sent'}")
+    print(f"{'✅' if report['statuses'] else '❌'} STATUS: {report['statuses']} updates, last: {report['last_status']}")
+    print(f"{'✅' if report['pings'] and not report['late_pings'] else '❌'} WATCHDOG: {report['pings']} pings, "
+          f"{len(report['late_pings'])} later than their window")
+    windows = report['window_seconds']
+    if windows['max'] is not None:
+        print(f"⏱️ A hung loop is restarted after {windows['p50']:.0f}s (p50 window), at most {windows['max']:.0f}s")
+    print(f"🎯 Boosts: {report['boosts']} in {report['days']} simulated days")
+    print(f"📁 Logs: {report['work_dir']}")
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='FunPay Auto Boost - sd_notify check against a local socket')
+    parser.add_argument('--days', type=float, default=1, help='Simulated days to run')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed')
+    parser.add_argument('--watchdog-sec', type=int, default=120, help='WatchdogSec of the simulated unit')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Chance a page load fails')
+    parser.add_argument('--logout-rate', type=float, default=0.0, help='Chance the session expires on a page load')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    args = parser.parse_args()
+
+    report = run_check(args.days, args.seed, args.watchdog_sec, args.error_rate, args.logout_rate)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return 0 if report['ready'] and report['statuses'] and report['pings'] and not report['late_pings'] else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
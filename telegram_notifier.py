@@ -13,10 +13,11 @@ import pytz
 import os
 
 class TelegramNotifier:
-    def __init__(self, config_file='telegram_config.json'):
+    def __init__(self, config_file='telegram_config.json', logger=None):
         self.config_file = config_file
         self.config = {}
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger or logging.getLogger(__name__)
+        self.clock_offset = 0.0  # Seconds between local UTC and FunPay's clock
         self.load_config()
     
     def load_config(self):
@@ -72,14 +73,18 @@ class TelegramNotifier:
             self.logger.error(f"Error converting time: {e}")
             return str(input_time)
     
+    def utcnow(self):
+        """Current UTC time corrected by the FunPay clock offset"""
+        return datetime.utcnow() + timedelta(seconds=self.clock_offset)
+    
     def calculate_time_remaining(self, target_time):
         """Calculate remaining time until target with proper UTC handling"""
         try:
             if isinstance(target_time, str):
                 target_time = datetime.fromisoformat(target_time)
             
-            # Current time in UTC (server time)
-            now_utc = datetime.utcnow().replace(tzinfo=pytz.UTC)
+            # Current time in UTC on FunPay's clock
+            now_utc = self.utcnow().replace(tzinfo=pytz.UTC)
             
             # If target_time has no timezone, assume it's UTC
             if target_time.tzinfo is None: